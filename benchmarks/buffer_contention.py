@@ -0,0 +1,63 @@
+"""Contention benchmark: UniverseBuffer (lock) vs SeqlockUniverseBuffer.
+
+Runs writer threads applying `set_channels` batches while a reader thread
+snapshots as fast as a sender would, and reports throughput of both sides
+plus the worst snapshot latency.
+"""
+import argparse
+import threading
+from time import perf_counter
+
+from dmx_controller.buffer import SeqlockUniverseBuffer, UniverseBuffer
+
+
+def run(buffer_cls, writers: int, duration: float, batch: int) -> dict:
+    buf = buffer_cls()
+    stop = threading.Event()
+    writes = [0] * writers
+    snapshots = {"count": 0, "worst": 0.0}
+
+    def writer(idx: int) -> None:
+        updates = [(ch, (ch + idx) & 0xFF) for ch in range(1, batch + 1)]
+        while not stop.is_set():
+            buf.set_channels(updates)
+            writes[idx] += 1
+
+    def reader() -> None:
+        while not stop.is_set():
+            t0 = perf_counter()
+            buf.snapshot()
+            dt = perf_counter() - t0
+            snapshots["count"] += 1
+            if dt > snapshots["worst"]:
+                snapshots["worst"] = dt
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads.append(threading.Thread(target=reader))
+    for t in threads:
+        t.start()
+    stop.wait(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    return {
+        "writes/s": sum(writes) / duration,
+        "snapshots/s": snapshots["count"] / duration,
+        "worst snapshot ms": snapshots["worst"] * 1000.0,
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--writers", type=int, default=4)
+    p.add_argument("--duration", type=float, default=2.0)
+    p.add_argument("--batch", type=int, default=64, help="channels per set_channels batch")
+    args = p.parse_args()
+
+    for cls in (UniverseBuffer, SeqlockUniverseBuffer):
+        res = run(cls, args.writers, args.duration, args.batch)
+        print(f"{cls.__name__:24s} " + "  ".join(f"{k}={v:,.1f}" for k, v in res.items()))
+
+
+if __name__ == "__main__":
+    main()
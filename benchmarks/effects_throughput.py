@@ -0,0 +1,59 @@
+"""Effects benchmark: frame render time for large fixture groups.
+
+Patches `--fixtures` identical 5-channel fixtures across as many universes
+of a `UniverseStore` as needed, runs a dimmer chase and a red sine over all
+of them, and reports the mean and worst time to render one frame against
+the frame budget at `--fps`.
+"""
+import argparse
+from time import perf_counter
+
+from dmx_controller.effects import Effect, EffectEngine
+from dmx_controller.fixture_types import ParCanFixture
+from dmx_controller.store import UniverseStore
+
+PER_UNIVERSE = 512 // 5
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=440)
+    parser.add_argument("--fps", type=float, default=44.0)
+    args = parser.parse_args()
+
+    store = UniverseStore((args.fixtures + PER_UNIVERSE - 1) // PER_UNIVERSE)
+    fixtures = []
+    for i in range(args.fixtures):
+        u, slot = divmod(i, PER_UNIVERSE)
+        base = slot * 5 + 1
+        fixtures.append(
+            ParCanFixture(
+                id=f"par{i}",
+                name=f"Par {i}",
+                type="rgb",
+                channels={"dim": base, "red": base + 1, "green": base + 2, "blue": base + 3, "strobe": base + 4},
+                buffer=store[u],
+            )
+        )
+    effects = EffectEngine()
+    effects.add(Effect(fixtures, waveform="chase", rate=0.5, width=0.1))
+    effects.add(Effect(fixtures, attribute="red", waveform="sine", rate=0.25, spread=2.0))
+
+    worst = 0.0
+    t0 = perf_counter()
+    for frame in range(args.frames):
+        start = perf_counter()
+        effects(frame / args.fps)
+        worst = max(worst, perf_counter() - start)
+    mean = (perf_counter() - t0) / args.frames
+    budget = 1.0 / args.fps
+    print(
+        f"{args.fixtures} fixtures in {len(store)} universes: "
+        f"mean {mean * 1e3:.3f} ms, worst {worst * 1e3:.3f} ms per frame "
+        f"({mean / budget:.1%} of the {budget * 1e3:.1f} ms budget)"
+    )
+
+
+if __name__ == "__main__":
+    main()
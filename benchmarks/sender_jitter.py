@@ -0,0 +1,85 @@
+"""Jitter benchmark: Engine tick timing with and without realtime settings.
+
+Runs an Engine against a null sender for a while, optionally with CPU-hog
+threads and processes competing for the cores, first with default scheduling
+and then with a `RealtimeConfig` (SCHED_FIFO/RR, CPU pinning, niceness), and
+prints the achieved fps, tick jitter percentiles and overruns of both runs.
+Realtime settings usually need root or CAP_SYS_NICE; denied settings are
+reported and the run continues without them.
+"""
+import argparse
+import multiprocessing
+import time
+import warnings
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.engine import Engine
+from dmx_controller.realtime import RealtimeConfig
+
+
+class NullSender:
+    def send(self, data, force=False):
+        return True
+
+    def close(self):
+        pass
+
+
+def _hog(stop) -> None:
+    while not stop.is_set():
+        pass
+
+
+def run(fps: float, duration: float, spin: float, realtime) -> dict:
+    engine = Engine(Controller(sender=NullSender(), buffer=UniverseBuffer()), fps=fps, spin=spin)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        engine.start(realtime=realtime)
+    time.sleep(duration)
+    engine.stop()
+    stats = engine.scheduler.stats()
+    if realtime is not None:
+        stats["realtime"] = realtime.status
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fps", type=float, default=44.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--spin", type=float, default=0.001, help="final busy-wait window in seconds")
+    parser.add_argument("--load", type=int, default=multiprocessing.cpu_count(), help="CPU hog processes")
+    parser.add_argument("--policy", choices=("fifo", "rr"), default="fifo")
+    parser.add_argument("--priority", type=int, default=50)
+    parser.add_argument("--cpus", type=int, nargs="*", help="pin the sender thread to these CPUs")
+    parser.add_argument("--nice", type=int, default=None)
+    args = parser.parse_args()
+
+    stop = multiprocessing.Event()
+    hogs = [multiprocessing.Process(target=_hog, args=(stop,), daemon=True) for _ in range(args.load)]
+    for p in hogs:
+        p.start()
+    try:
+        configs = [
+            ("default", None),
+            ("realtime", RealtimeConfig(policy=args.policy, priority=args.priority, cpus=args.cpus, nice=args.nice)),
+        ]
+        for label, config in configs:
+            stats = run(args.fps, args.duration, args.spin, config)
+            print(
+                f"{label:9s} fps={stats['achieved_fps']:.2f} "
+                f"jitter p50={stats['jitter_p50'] * 1e6:.0f}us p95={stats['jitter_p95'] * 1e6:.0f}us "
+                f"p99={stats['jitter_p99'] * 1e6:.0f}us max={stats['jitter_max'] * 1e6:.0f}us "
+                f"overruns={stats['overruns']} skipped={stats['skipped']}"
+            )
+            if config is not None:
+                print(f"          realtime: {stats['realtime']}")
+    finally:
+        stop.set()
+        for p in hogs:
+            p.join(timeout=1.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,63 @@
 """dmx_controller package public API"""
 
 from .controller import Controller
+from .engine import Engine, MultiEngine
 from .fixtures import parse_fixtures_json
-from .buffer import UniverseBuffer
-from .artnet import ArtNetSender
+from .buffer import UniverseBuffer, SeqlockUniverseBuffer
+from .shared import SharedUniverseBuffer
+from .store import UniverseStore, UniverseView
+from .artnet import ArtNetSender, MultiUniverseSender
+from .sacn import E131Sender
+from .receiver import ArtNetReceiver
+from .recorder import FrameRecorder, FrameReplayer
+from .scheduler import FrameScheduler
+from .realtime import RealtimeConfig
+from .lookahead import FrameRing, LookaheadEngine
+from .effects import Effect, EffectEngine
+from .fades import FadeEngine
+from .mixer import Layer, LayerMixer
+from .output import OutputStage
+from .cues import CompiledShow, CuePlayer, compile_cues, load_cue_list
+from .aio import AsyncArtNetSender, AsyncEngine
 from .fixture_types import Fixture, ParCanFixture, MovingHeadFixture
+from .groups import FixtureGroup
 
 __all__ = [
     "Controller",
+    "Engine",
+    "MultiEngine",
     "parse_fixtures_json",
     "UniverseBuffer",
+    "SeqlockUniverseBuffer",
+    "SharedUniverseBuffer",
+    "UniverseStore",
+    "UniverseView",
     "ArtNetSender",
+    "MultiUniverseSender",
+    "E131Sender",
+    "ArtNetReceiver",
+    "FrameRecorder",
+    "FrameReplayer",
+    "FrameScheduler",
+    "RealtimeConfig",
+    "FrameRing",
+    "LookaheadEngine",
+    "Effect",
+    "EffectEngine",
+    "FadeEngine",
+    "Layer",
+    "LayerMixer",
+    "OutputStage",
+    "CompiledShow",
+    "CuePlayer",
+    "compile_cues",
+    "load_cue_list",
+    "AsyncArtNetSender",
+    "AsyncEngine",
     "Fixture",
     "ParCanFixture",
     "MovingHeadFixture",
+    "FixtureGroup",
 ]
 
 __version__ = "0.2.0"
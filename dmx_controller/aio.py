@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+from typing import Optional, Union
+
+from .artnet import (
+    ARTNET_PORT,
+    ARTSYNC_PACKET,
+    DEFAULT_BACKOFF_INITIAL,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_FPS,
+    DEFAULT_KEEPALIVE,
+    DMX_CHANNELS,
+    DestinationHealth,
+    _ArtDmxPacket,
+    _ChangeFilter,
+    _SendGate,
+    _admit,
+    _delivered,
+)
+from .controller import Controller
+
+
+class _ArtNetProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol that tracks write flow control and errors."""
+
+    def __init__(self, health: DestinationHealth):
+        self.health = health
+        self.errors = 0
+        self.writable = asyncio.Event()
+        self.writable.set()
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors (e.g. port unreachable) arrive asynchronously
+        self.errors += 1
+        self.health.record_failure(exc, perf_counter())
+
+    def pause_writing(self) -> None:
+        self.writable.clear()
+
+    def resume_writing(self) -> None:
+        self.writable.set()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.writable.set()
+
+
+class AsyncArtNetSender:
+    """Art-Net sender running on an asyncio event loop.
+
+    Implements the same `send(data, force)`/`close()` contract as
+    `ArtNetSender`, so it can be injected into a `Controller`. `send()` never
+    blocks: the datagram transport either sends immediately or queues a copy
+    of the packet. Call `await open()` (or use `AsyncArtNetSender.create()`)
+    from the event loop before sending.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = ARTNET_PORT,
+        universe: int = 0,
+        fps: int = DEFAULT_FPS,
+        physical: int = 0,
+        debug: bool = False,
+        send_on_change: bool = False,
+        keepalive: float = DEFAULT_KEEPALIVE,
+        length: int = DMX_CHANNELS,
+        backoff_initial: float = DEFAULT_BACKOFF_INITIAL,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        self.host = host
+        self.port = port
+        self.universe = universe
+        self._gate = _SendGate(fps)
+        self._sequence = 0
+        self._packet = _ArtDmxPacket(universe, physical=int(physical), length=length)
+        self._changes = _ChangeFilter(keepalive) if send_on_change else None
+        self.frames_sent = 0
+        self.frames_suppressed = 0
+        self.health = DestinationHealth(backoff_initial, backoff_max)
+        self.debug = bool(debug)
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._protocol: Optional[_ArtNetProtocol] = None
+        # protocol error count at the previous send
+        self._errors_at_send = 0
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "AsyncArtNetSender":
+        sender = cls(*args, **kwargs)
+        await sender.open()
+        return sender
+
+    @property
+    def is_open(self) -> bool:
+        return self._transport is not None and not self._transport.is_closing()
+
+    async def open(self) -> None:
+        """Create the datagram endpoint connected to host:port. Idempotent."""
+        if self.is_open:
+            return
+        loop = asyncio.get_running_loop()
+        self._transport, self._protocol = await loop.create_datagram_endpoint(
+            lambda: _ArtNetProtocol(self.health), remote_addr=(self.host, self.port)
+        )
+        self._errors_at_send = 0
+
+    @property
+    def length(self) -> int:
+        return self._packet.length
+
+    def set_length(self, length: int) -> None:
+        self._packet.set_length(length)
+
+    def send(self, data: Union[bytes, bytearray], force: bool = False) -> bool:
+        """Queue the DMX payload on the transport without blocking.
+
+        Same return contract as `ArtNetSender.send`. Raises RuntimeError if
+        the sender has not been opened.
+        """
+        transport = self._transport
+        if transport is None:
+            raise RuntimeError("AsyncArtNetSender is not open; await open() first")
+        now = perf_counter()
+        if not self._gate.due(now, force):
+            return False
+        changes = self._changes
+        if not _admit(self, changes, self.health, data, now, force):
+            return False
+        self._gate.last_send = now
+
+        packet = self._packet
+        packet.set_sequence(self._sequence)
+        packet.set_payload(data)
+        # the transport copies the packet if it cannot send it right away
+        transport.sendto(packet.frame)
+        self._sequence = (self._sequence + 1) & 0xFF
+        self.frames_sent += 1
+        # delivery errors arrive later via error_received, so only a previous
+        # send that drew no error clears a backoff
+        errors = self._protocol.errors
+        _delivered(changes, self.health, data, now, confirmed=errors == self._errors_at_send)
+        self._errors_at_send = errors
+        return True
+
+    def send_sync(self) -> None:
+        if self._transport is not None:
+            self._transport.sendto(ARTSYNC_PACKET)
+
+    async def wait_writable(self) -> None:
+        """Wait until the transport's write buffer has drained below its limit."""
+        if self._protocol is not None:
+            await self._protocol.writable.wait()
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+            self._protocol = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AsyncEngine:
+    """Event-loop counterpart of `Engine`.
+
+    Ticks are scheduled with `loop.call_at` on absolute deadlines, so no
+    thread is needed per controller; late ticks skip the deadlines they
+    missed instead of bursting. The controller's fixtures and buffer are
+    used as usual from the loop thread.
+
+    As with `Engine`, renderers added with `add_renderer(fn)` (and the
+    controller's `fades`) are called as `fn(t)` at the start of every tick;
+    failures are counted in `render_errors`.
+    """
+
+    def __init__(self, controller: Controller, fps: float = 60.0, sync: bool = False):
+        self.controller = controller
+        self.fps = float(fps)
+        self.sync = bool(sync)
+        self.ticks = 0
+        self.missed = 0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._next_time = 0.0
+        self._renderers: list = []
+        self.render_errors = 0
+        fades = getattr(controller, "fades", None)
+        if fades is not None:
+            self.add_renderer(fades)
+
+    @property
+    def running(self) -> bool:
+        return self._handle is not None
+
+    async def _open_sender(self) -> None:
+        open_ = getattr(self.controller.sender, "open", None)
+        if open_ is not None:
+            await open_()
+
+    async def start(self) -> None:
+        """Open the sender (if it is async) and start ticking. Idempotent."""
+        if self._handle is not None:
+            return
+        await self._open_sender()
+        self._loop = asyncio.get_running_loop()
+        self._next_time = self._loop.time()
+        self._handle = self._loop.call_at(self._next_time, self._on_tick)
+
+    def _on_tick(self) -> None:
+        try:
+            self._tick()
+        except Exception:
+            # don't let the schedule die on transient errors
+            pass
+        interval = 1.0 / self.fps
+        self._next_time += interval
+        now = self._loop.time()
+        if self._next_time < now:
+            # overran: drop the missed deadlines and realign to the grid
+            skipped = int((now - self._next_time) / interval) + 1
+            self.missed += skipped
+            self._next_time += skipped * interval
+        self._handle = self._loop.call_at(self._next_time, self._on_tick)
+
+    def add_renderer(self, renderer) -> None:
+        """Call `renderer(t)` at the start of every tick."""
+        self._renderers = self._renderers + [renderer]
+
+    def remove_renderer(self, renderer) -> None:
+        self._renderers = [r for r in self._renderers if r is not renderer]
+
+    def _render(self) -> None:
+        renderers = self._renderers
+        if not renderers:
+            return
+        t = perf_counter()
+        for renderer in renderers:
+            try:
+                renderer(t)
+            except Exception:
+                self.render_errors += 1
+
+    def _tick(self) -> None:
+        self.ticks += 1
+        self._render()
+        sent = self.controller.send_frame()
+        if sent and self.sync:
+            send_sync = getattr(self.controller.sender, "send_sync", None)
+            if send_sync is not None:
+                send_sync()
+
+    async def send_frame(self, force: bool = False) -> bool:
+        """Send the current buffer now, waiting first for transport back-pressure."""
+        wait = getattr(self.controller.sender, "wait_writable", None)
+        if wait is not None:
+            await wait()
+        return self.controller.send_frame(force=force)
+
+    async def blackout(self) -> bool:
+        """Zero all channels and send a forced frame."""
+        if self.controller.buffer is not None:
+            self.controller.buffer.zero_all()
+        return await self.send_frame(force=True)
+
+    async def stop(self) -> None:
+        """Stop ticking, send a final blackout and close the sender."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        try:
+            await self.blackout()
+            if self.sync:
+                send_sync = getattr(self.controller.sender, "send_sync", None)
+                if send_sync is not None:
+                    send_sync()
+        except Exception:
+            # Do not raise from stop
+            pass
+        self.controller.stop()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
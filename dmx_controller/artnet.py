@@ -1,35 +1,67 @@
 from __future__ import annotations
 
 from time import perf_counter
-from typing import Union
+from typing import Mapping, Optional, Union
 import socket
-import time
 
 DMX_CHANNELS = 512
 DEFAULT_FPS = 60
 ARTNET_PORT = 6454
+# Art-Net recommends refreshing a static universe about once per second
+DEFAULT_KEEPALIVE = 1.0
+# exponential backoff applied to a destination whose sends keep failing
+DEFAULT_BACKOFF_INITIAL = 0.05
+DEFAULT_BACKOFF_MAX = 2.0
 
 # Art-Net constants
 ARTNET_ID = b"Art-Net\x00"
 OPCODE_ARTDMX = (0x00, 0x50)  # Little-endian for 0x5000
+OPCODE_ARTSYNC = (0x00, 0x52)  # Little-endian for 0x5200
 PROTOCOL_VERSION = (0x00, 0x0e)  # 14
+ARTDMX_HEADER_SIZE = 18
+ARTDMX_SEQUENCE_OFFSET = 12
+ARTDMX_LENGTH_OFFSET = 16
 
+_ZERO_PAYLOAD = memoryview(bytes(DMX_CHANNELS))
 
-def _build_artdmx_packet(data: Union[bytes, bytearray], universe: int = 0, sequence: int = 0, physical: int = 0) -> bytes:
-    """Build a full ArtDMX packet with 512 bytes payload (pad or truncate).
+# ArtSync: ID, OpCode, protocol version and two zero Aux bytes. Nodes that
+# receive it latch every ArtDMX received since the previous ArtSync at once.
+ARTSYNC_PACKET = ARTNET_ID + bytes(OPCODE_ARTSYNC) + bytes(PROTOCOL_VERSION) + bytes(2)
+
+
+def artdmx_length(channels: int) -> int:
+    """Return the ArtDMX data length needed to carry `channels` channels.
+
+    The spec requires an even length in the range 2..512.
+    """
+    n = max(2, min(DMX_CHANNELS, int(channels)))
+    return n + (n & 1) if n < DMX_CHANNELS else DMX_CHANNELS
+
+
+def _build_artdmx_packet(
+    data: Union[bytes, bytearray],
+    universe: int = 0,
+    sequence: int = 0,
+    physical: int = 0,
+    length: int = DMX_CHANNELS,
+) -> bytes:
+    """Build a full ArtDMX packet with `length` bytes payload (pad or truncate).
 
     Sequence and physical fields are single bytes located after the protocol version.
+
+    This allocating builder is kept as the reference implementation used by
+    tests; the sender hot path patches an `_ArtDmxPacket` template in place.
     """
-    # Ensure payload is exactly DMX_CHANNELS bytes
+    # Ensure payload is exactly `length` bytes
     if isinstance(data, (bytes, bytearray)):
         d = bytes(data)
     else:
         d = bytes(data)
 
-    if len(d) < DMX_CHANNELS:
-        d = d + bytes(DMX_CHANNELS - len(d))
+    if len(d) < length:
+        d = d + bytes(length - len(d))
     else:
-        d = d[:DMX_CHANNELS]
+        d = d[:length]
 
     packet = bytearray()
     packet.extend(ARTNET_ID)
@@ -39,12 +71,211 @@ def _build_artdmx_packet(data: Union[bytes, bytearray], universe: int = 0, seque
     packet.extend((sequence & 0xFF, physical & 0xFF))
     # Universe (low byte first)
     packet.extend((universe & 0xFF, (universe >> 8) & 0xFF))
-    # Data length hi/lo for DMX_CHANNELS (hi first)
-    packet.extend(((DMX_CHANNELS >> 8) & 0xFF, DMX_CHANNELS & 0xFF))
+    # Data length hi/lo (hi first)
+    packet.extend(((length >> 8) & 0xFF, length & 0xFF))
     packet.extend(d)
     return bytes(packet)
 
 
+_ARTDMX_OPCODE_BYTES = bytes(OPCODE_ARTDMX)
+
+
+def _parse_artdmx(view: memoryview) -> Optional[tuple[int, int, memoryview]]:
+    """Parse an ArtDMX datagram without copying it.
+
+    Returns (universe, sequence, payload) where `payload` is a memoryview
+    into `view`, or None if the datagram is not a well-formed ArtDMX packet.
+    """
+    if len(view) < ARTDMX_HEADER_SIZE + 2:
+        return None
+    if view[:8] != ARTNET_ID or view[8:10] != _ARTDMX_OPCODE_BYTES:
+        return None
+    length = (view[ARTDMX_LENGTH_OFFSET] << 8) | view[ARTDMX_LENGTH_OFFSET + 1]
+    length = min(length, DMX_CHANNELS, len(view) - ARTDMX_HEADER_SIZE)
+    universe = view[14] | (view[15] << 8)
+    return universe, view[ARTDMX_SEQUENCE_OFFSET], view[ARTDMX_HEADER_SIZE : ARTDMX_HEADER_SIZE + length]
+
+
+class _ArtDmxPacket:
+    """Preallocated ArtDMX packet patched in place for every frame.
+
+    The header is written once; per frame only the sequence byte and the
+    payload are copied into the packet through a memoryview, so sending
+    allocates nothing. `frame` is the part of the buffer that goes on the
+    wire: the header plus `length` payload bytes.
+    """
+
+    def __init__(self, universe: int = 0, physical: int = 0, length: int = DMX_CHANNELS):
+        self.buf = bytearray(_build_artdmx_packet(b"", universe, sequence=0, physical=physical))
+        self.view = memoryview(self.buf)
+        self.payload = self.view[ARTDMX_HEADER_SIZE:]
+        self.set_length(length)
+
+    def set_length(self, length: int) -> None:
+        """Set the ArtDMX data length (rounded up to even, 2..512)."""
+        length = artdmx_length(length)
+        self.length = length
+        self.buf[ARTDMX_LENGTH_OFFSET] = (length >> 8) & 0xFF
+        self.buf[ARTDMX_LENGTH_OFFSET + 1] = length & 0xFF
+        self.frame = self.view[: ARTDMX_HEADER_SIZE + length]
+
+    def set_sequence(self, sequence: int) -> None:
+        self.buf[ARTDMX_SEQUENCE_OFFSET] = sequence & 0xFF
+
+    def set_payload(self, data) -> None:
+        """Copy `data` into the payload area, zero-padding to `length` bytes."""
+        try:
+            src = memoryview(data)
+        except TypeError:
+            # iterables of ints (lists, generators) take the slow path
+            src = memoryview(bytes(data))
+        if src.ndim != 1 or src.itemsize != 1:
+            src = src.cast("B")
+        n = len(src)
+        length = self.length
+        if n >= length:
+            self.payload[:length] = src[:length]
+        else:
+            self.payload[:n] = src
+            self.payload[n:length] = _ZERO_PAYLOAD[n:length]
+
+
+class _ChangeFilter:
+    """Send-on-change state: the last payload sent and when it went out.
+
+    A frame is redundant when it equals the last payload and the keepalive
+    interval has not yet elapsed since that payload was sent. The last
+    payload is kept in a preallocated buffer so tracking it never allocates.
+    """
+
+    def __init__(self, keepalive: float = DEFAULT_KEEPALIVE):
+        self.keepalive = float(keepalive)
+        self.last = bytearray(DMX_CHANNELS)
+        self.valid = False
+        self.last_tx = 0.0
+
+    def is_redundant(self, data, now: float) -> bool:
+        # bytearray on the left: compares any bytes-like `data` with memcmp
+        return self.valid and (now - self.last_tx) < self.keepalive and self.last == data
+
+    def sent(self, data, now: float) -> None:
+        # resizes only if the payload length changes
+        self.last[:] = data
+        self.valid = True
+        self.last_tx = now
+
+
+class DestinationHealth:
+    """Failure/backoff state machine for one send destination.
+
+    A destination is healthy until all attempts of a send fail. It then
+    enters backoff: sends are skipped (never slept on) until `backoff_until`,
+    and each further failed attempt doubles the delay up to `backoff_max`.
+    The first successful send returns it to healthy.
+    """
+
+    def __init__(self, backoff_initial: float = DEFAULT_BACKOFF_INITIAL, backoff_max: float = DEFAULT_BACKOFF_MAX):
+        self.backoff_initial = float(backoff_initial)
+        self.backoff_max = float(backoff_max)
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.last_error: Optional[BaseException] = None
+        self.backoff_since: Optional[float] = None
+        self.backoff_until = 0.0
+        self.skipped = 0
+
+    @property
+    def in_backoff(self) -> bool:
+        return self.backoff_since is not None
+
+    def ready(self, now: float) -> bool:
+        """Return True when a send may be attempted at `now`."""
+        if self.backoff_since is None or now >= self.backoff_until:
+            return True
+        self.skipped += 1
+        return False
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.backoff_since = None
+        self.backoff_until = 0.0
+
+    def record_failure(self, exc: BaseException, now: float) -> None:
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        self.last_error = exc
+        if self.backoff_since is None:
+            self.backoff_since = now
+        delay = min(self.backoff_max, self.backoff_initial * (2 ** (self.consecutive_failures - 1)))
+        self.backoff_until = now + delay
+
+    def time_in_backoff(self, now: Optional[float] = None) -> float:
+        if self.backoff_since is None:
+            return 0.0
+        return (perf_counter() if now is None else now) - self.backoff_since
+
+    def as_dict(self, now: Optional[float] = None) -> dict:
+        """Monitoring snapshot of the destination state."""
+        return {
+            "healthy": not self.in_backoff,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "last_error": repr(self.last_error) if self.last_error is not None else None,
+            "time_in_backoff": self.time_in_backoff(now),
+            "skipped": self.skipped,
+        }
+
+
+class _SendGate:
+    """Frame-rate limiter shared by the senders: one frame per `1 / fps`
+    seconds unless forced."""
+
+    def __init__(self, fps: float):
+        self.fps = float(fps)
+        self.last_send = 0.0
+
+    def due(self, now: float, force: bool = False) -> bool:
+        return force or (now - self.last_send) >= (1.0 / self.fps)
+
+
+def _admit(sender, changes: Optional[_ChangeFilter], health: DestinationHealth, data, now: float, force: bool) -> bool:
+    """Send-on-change and backoff checks for one destination.
+
+    Counts suppressed frames on `sender.frames_suppressed`; forced sends
+    bypass both checks.
+    """
+    if force:
+        return True
+    if changes is not None and changes.is_redundant(data, now):
+        sender.frames_suppressed += 1
+        return False
+    return health.ready(now)
+
+
+def _delivered(
+    changes: Optional[_ChangeFilter], health: DestinationHealth, data, now: float, confirmed: bool = True
+) -> None:
+    """Bookkeeping after a payload went out: remember it and, if delivery is
+    `confirmed`, clear any backoff."""
+    if changes is not None:
+        changes.sent(data, now)
+    if confirmed and (health.consecutive_failures or health.in_backoff):
+        health.record_success()
+
+
+def _attempt(transmit, retries: int) -> Optional[BaseException]:
+    """Call `transmit()` up to 1 + `retries` times without sleeping; return
+    None on success or the last exception."""
+    last_exc: Optional[BaseException] = None
+    for _ in range(max(0, retries) + 1):
+        try:
+            transmit()
+            return None
+        except Exception as exc:
+            last_exc = exc
+    return last_exc
+
+
 class ArtNetSender:
     def __init__(
         self,
@@ -57,24 +288,46 @@ class ArtNetSender:
         reuse_socket: bool = True,
         physical: int = 0,
         debug: bool = False,
+        send_on_change: bool = False,
+        keepalive: float = DEFAULT_KEEPALIVE,
+        length: int = DMX_CHANNELS,
+        backoff_initial: float = DEFAULT_BACKOFF_INITIAL,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
     ):
         self.host = host
         self.port = port
         self.universe = universe
-        self._fps = float(fps)
-        self._last_send = 0.0
+        self._gate = _SendGate(fps)
         self._timeout = timeout
-        self._retries = int(retries)
+        self._retries = max(0, int(retries))
         self._reuse_socket = bool(reuse_socket)
         self._physical = int(physical)
         self._sequence = 0
+        self._addr = (host, port)
+        self._connected = False
+        self._packet = self._make_packet(length)
+        # send-on-change: unchanged frames are suppressed until `keepalive`
+        # seconds have passed since the last transmission
+        self._changes = _ChangeFilter(keepalive) if send_on_change else None
+        self.frames_sent = 0
+        self.frames_suppressed = 0
+        # failing destinations are skipped with exponential backoff instead
+        # of sleeping on the caller's thread
+        self.health = DestinationHealth(backoff_initial, backoff_max)
         # debug: dump hex payload on successful send when True
         self.debug = bool(debug)
 
+        # bound once so a send does not allocate a callable per frame
+        self._attempt_send = self._send_frame
+
         self._socket = None
         if self._reuse_socket:
             self._socket = self._create_socket()
 
+    def _make_packet(self, length: int) -> _ArtDmxPacket:
+        """Create the preallocated packet template (overridden by other protocols)."""
+        return _ArtDmxPacket(self.universe, physical=self._physical, length=length)
+
     def _create_socket(self):
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -84,49 +337,341 @@ class ArtNetSender:
                 s.settimeout(self._timeout)
         except Exception:
             pass
+        # connect() resolves the destination once so each frame is a plain
+        # send() without a per-packet address lookup; fakes and unroutable
+        # hosts fall back to sendto()
+        try:
+            s.connect(self._addr)
+            connected = True
+        except Exception:
+            connected = False
+        self._connected = connected
         return s
 
+    def _transmit(self, sock, pkt) -> None:
+        # a connected UDP socket reports ICMP port-unreachable from an earlier
+        # datagram as ConnectionRefusedError on the next send; it propagates
+        # so the attempt counts as failed (and the retry finds it cleared)
+        if self._connected:
+            sock.send(pkt)
+        else:
+            sock.sendto(pkt, self._addr)
+
+    def _send_frame(self) -> None:
+        """One attempt at sending the current packet."""
+        sock = self._socket if self._reuse_socket else self._create_socket()
+        try:
+            self._transmit(sock, self._packet.frame)
+        finally:
+            # ephemeral sockets are closed after every attempt
+            if not self._reuse_socket:
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+
+    @property
+    def length(self) -> int:
+        """ArtDMX data length of transmitted frames (2..512, even)."""
+        return self._packet.length
+
+    def set_length(self, length: int) -> None:
+        """Send variable-length frames carrying only the first `length` channels.
+
+        The value is rounded up to an even number as the spec requires.
+        """
+        self._packet.set_length(length)
+
     def send(self, data: Union[bytes, bytearray], force: bool = False) -> bool:
         """Send the given DMX payload to the configured host/port.
 
         Returns True if a send was actually performed, or False if a send was
-        skipped due to rate limiting. Raises an exception if all send attempts
-        failed.
+        skipped due to rate limiting, because the destination is in backoff
+        after earlier failures, or, in send-on-change mode, because the
+        payload is unchanged and no keepalive is due. Raises an exception if
+        all send attempts failed; retries are immediate and never sleep.
         """
         now = perf_counter()
-        if not force and (now - self._last_send) < (1.0 / self._fps):
+        if not self._gate.due(now, force):
+            return False
+        changes = self._changes
+        health = self.health
+        if not _admit(self, changes, health, data, now, force):
             return False
-        self._last_send = now
+        self._gate.last_send = now
+
+        packet = self._packet
+        packet.set_sequence(self._sequence)
+        packet.set_payload(data)
 
-        seq = self._sequence
-        pkt = _build_artdmx_packet(data, self.universe, sequence=seq, physical=self._physical)
+        failure = _attempt(self._attempt_send, self._retries)
+        if failure is None:
+            # increment sequence on successful send
+            self._sequence = (self._sequence + 1) & 0xFF
+            self.frames_sent += 1
+            _delivered(changes, health, data, now)
+            # don't perform debug printing here - controller will handle it
+            return True
+        # all attempts failed: back off this destination so later ticks
+        # skip it instead of stalling the frame loop
+        health.record_failure(failure, now)
+        raise failure
 
-        attempts = 0
-        last_exc = None
-        while attempts <= self._retries:
-            attempts += 1
-            sock = self._socket if self._reuse_socket else self._create_socket()
+    def send_sync(self) -> None:
+        """Send an ArtSync packet so the node latches the frame just sent.
+
+        Call it once after all universes of a frame have gone out (the
+        `Engine` does this per tick when created with `sync=True`).
+        """
+        sock = self._socket if self._reuse_socket else self._create_socket()
+        try:
             try:
-                sock.sendto(pkt, (self.host, self.port))
-                if not self._reuse_socket:
-                    sock.close()
-                # increment sequence on successful send
-                self._sequence = (self._sequence + 1) & 0xFF
-                # don't perform debug printing here - controller will handle it
-                return True
-            except Exception as exc:
-                last_exc = exc
-                # if using ephemeral sockets, ensure we close them
+                self._transmit(sock, ARTSYNC_PACKET)
+            except ConnectionRefusedError as exc:
+                # left by an earlier frame: count it, the error is now cleared
+                self.health.record_failure(exc, perf_counter())
+                self._transmit(sock, ARTSYNC_PACKET)
+        finally:
+            if not self._reuse_socket:
                 try:
-                    if not self._reuse_socket:
-                        sock.close()
+                    sock.close()
                 except Exception:
                     pass
-                # backoff small amount
-                time.sleep(0.01)
+
+    def close(self) -> None:
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except Exception:
+                pass
+            self._socket = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _UniverseOutput:
+    """Per-universe state of a `MultiUniverseSender`: destination, packet and sequence."""
+
+    def __init__(
+        self,
+        sender: "MultiUniverseSender",
+        universe: int,
+        addr: tuple,
+        physical: int = 0,
+        keepalive: Optional[float] = None,
+        length: int = DMX_CHANNELS,
+    ):
+        self.sender = sender
+        self.universe = universe
+        self.addr = addr
+        self.packet = _ArtDmxPacket(universe, physical=physical, length=length)
+        self.sequence = 0
+        self.changes = _ChangeFilter(keepalive) if keepalive is not None else None
+        # bound once so a burst does not allocate a callable per universe
+        self.attempt = self._send_frame
+
+    def _send_frame(self) -> None:
+        self.sender._socket.sendto(self.packet.frame, self.addr)
+
+
+def _resolve_host(host: str) -> str:
+    """Resolve `host` to a numeric address once so sendto() skips name lookups."""
+    try:
+        return socket.gethostbyname(host)
+    except Exception:
+        return host
+
+
+class MultiUniverseSender:
+    """Send many universes through a single UDP socket.
+
+    Universes are registered with `add_universe()` (or the `destinations`
+    mapping of universe -> host or (host, port)). `send()` takes a mapping of
+    universe -> payload for the universes that changed this frame and emits
+    them back-to-back in one loop, sharing a single rate limiter so all
+    universes of a frame leave together.
+
+    With `sync=True` an ArtSync packet follows every burst that sent at least
+    one universe. It goes out only after every ArtDMX of the burst (including
+    retries) has been handed to the socket, and exactly once per `send()`,
+    so nodes latch the whole frame together. `sync_host` directs it to one
+    address (e.g. a subnet broadcast); by default it is unicast to each
+    distinct destination of the burst.
+    """
+
+    def __init__(
+        self,
+        destinations: Optional[Mapping[int, Union[str, tuple]]] = None,
+        port: int = ARTNET_PORT,
+        fps: int = DEFAULT_FPS,
+        timeout: float = 0.2,
+        retries: int = 0,
+        physical: int = 0,
+        debug: bool = False,
+        send_on_change: bool = False,
+        keepalive: float = DEFAULT_KEEPALIVE,
+        sync: bool = False,
+        sync_host: Optional[str] = None,
+        backoff_initial: float = DEFAULT_BACKOFF_INITIAL,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        self.port = port
+        self._gate = _SendGate(fps)
+        self._timeout = timeout
+        self._retries = max(0, int(retries))
+        self._physical = int(physical)
+        self.debug = bool(debug)
+        self._keepalive = float(keepalive) if send_on_change else None
+        self.frames_sent = 0
+        self.frames_suppressed = 0
+        self.sync = bool(sync)
+        self._sync_addr = (_resolve_host(sync_host), port) if sync_host is not None else None
+        self.syncs_sent = 0
+        self._backoff = (float(backoff_initial), float(backoff_max))
+        # destination address -> DestinationHealth, shared by the universes
+        # patched to the same node
+        self._health: dict[tuple, DestinationHealth] = {}
+        self._outputs: dict[int, _UniverseOutput] = {}
+        self._socket = self._create_socket()
+        for universe, dest in (destinations or {}).items():
+            if isinstance(dest, (tuple, list)):
+                self.add_universe(universe, dest[0], dest[1])
+            else:
+                self.add_universe(universe, dest)
+
+    def _create_socket(self):
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            if self._timeout is not None and self._timeout > 0:
+                s.settimeout(self._timeout)
+        except Exception:
+            pass
+        if self._sync_addr is not None:
+            # ArtSync is commonly sent to a subnet broadcast address
+            try:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            except Exception:
+                pass
+        return s
+
+    def add_universe(
+        self,
+        universe: int,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        length: int = DMX_CHANNELS,
+    ) -> None:
+        """Register (or re-target) `universe` to be sent to host:port.
+
+        `length` limits the universe to variable-length frames carrying only
+        its first `length` channels.
+        """
+        addr = (_resolve_host(host), self.port if port is None else int(port))
+        out = self._outputs.get(universe)
+        if out is None:
+            self._outputs[universe] = _UniverseOutput(
+                self, universe, addr, physical=self._physical, keepalive=self._keepalive, length=length
+            )
+        else:
+            out.addr = addr
+            out.packet.set_length(length)
+
+    def set_length(self, universe: int, length: int) -> None:
+        """Change the ArtDMX data length of `universe` (rounded up to even)."""
+        self._outputs[universe].packet.set_length(length)
+
+    def remove_universe(self, universe: int) -> None:
+        self._outputs.pop(universe, None)
+
+    def _health_for(self, addr: tuple) -> DestinationHealth:
+        health = self._health.get(addr)
+        if health is None:
+            health = self._health[addr] = DestinationHealth(*self._backoff)
+        return health
+
+    def health(self) -> dict:
+        """Return a monitoring snapshot per destination ("host:port" -> state)."""
+        now = perf_counter()
+        return {f"{addr[0]}:{addr[1]}": h.as_dict(now) for addr, h in self._health.items()}
+
+    @property
+    def universes(self) -> list[int]:
+        return list(self._outputs)
+
+    def sequence(self, universe: int) -> int:
+        """Return the sequence number the next packet of `universe` will carry."""
+        return self._outputs[universe].sequence
+
+    def send(self, frames: Mapping[int, Union[bytes, bytearray]], force: bool = False) -> int:
+        """Send the payload of every universe in `frames` in one burst.
+
+        Returns the number of universes sent (0 when rate limited). In
+        send-on-change mode unchanged universes are skipped until their
+        keepalive is due. Each
+        universe is retried up to `retries` times like `ArtNetSender.send`; a
+        universe whose attempts all fail does not stop the others, and the
+        last failure is raised once the whole burst has gone out. A
+        destination whose attempts all failed is skipped on later calls
+        until its exponential backoff expires; nothing here ever sleeps.
+        """
+        outputs = self._outputs
+        # validate the whole burst first so an unknown universe sends nothing
+        for universe in frames:
+            if universe not in outputs:
+                raise KeyError(f"Universe {universe} has no destination")
+        now = perf_counter()
+        if not self._gate.due(now, force):
+            return 0
+        self._gate.last_send = now
+
+        sent = 0
+        failure = None
+        synced = set() if self.sync else None
+        for universe, data in frames.items():
+            out = outputs[universe]
+            changes = out.changes
+            health = self._health_for(out.addr)
+            if not _admit(self, changes, health, data, now, force):
                 continue
-        # if we reach here, all attempts failed
-        raise last_exc
+            packet = out.packet
+            packet.set_sequence(out.sequence)
+            packet.set_payload(data)
+            exc = _attempt(out.attempt, self._retries)
+            if exc is not None:
+                health.record_failure(exc, now)
+                failure = exc
+                continue
+            out.sequence = (out.sequence + 1) & 0xFF
+            sent += 1
+            _delivered(changes, health, data, now)
+            if synced is not None:
+                synced.add(out.addr)
+        self.frames_sent += sent
+        if synced:
+            # sync the universes that did go out even if another one failed
+            self.send_sync(synced)
+        if failure is not None:
+            raise failure
+        return sent
+
+    def send_sync(self, addrs=None) -> None:
+        """Send one ArtSync to `sync_host`, or to each address in `addrs`
+        (default: every registered destination)."""
+        if self._sync_addr is not None:
+            targets = (self._sync_addr,)
+        elif addrs is not None:
+            targets = addrs
+        else:
+            targets = {out.addr for out in self._outputs.values()}
+        sendto = self._socket.sendto
+        for addr in targets:
+            sendto(ARTSYNC_PACKET, addr)
+        self.syncs_sent += 1
 
     def close(self) -> None:
         if self._socket is not None:
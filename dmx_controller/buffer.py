@@ -1,16 +1,45 @@
 from __future__ import annotations
 
 import threading
-from typing import Iterable
+import time
+from typing import Iterable, Optional
 
 
 class UniverseBuffer:
-    """Thread-safe universe buffer with 1-based public API."""
+    """Thread-safe universe buffer with 1-based public API.
+
+    Every write bumps a monotonically increasing `generation` and widens the
+    dirty channel range, so consumers can skip idle universes cheaply with
+    `snapshot_if_changed()` / `take_dirty()` instead of comparing frames.
+    """
 
     def __init__(self, channels: int = 512):
         self._channels = channels
         self._buf = bytearray(channels)
         self._lock = threading.Lock()
+        self._zeros = bytes(channels)
+        self._generation = 0
+        # dirty range as 0-based [lo, hi); empty when lo >= hi
+        self._dirty_lo = channels
+        self._dirty_hi = 0
+
+    def _touch(self, lo: int, hi: int) -> None:
+        """Record a write to 0-based [lo, hi); called with the lock held."""
+        self._generation += 1
+        if lo < self._dirty_lo:
+            self._dirty_lo = lo
+        if hi > self._dirty_hi:
+            self._dirty_hi = hi
+
+    @property
+    def channels(self) -> int:
+        """Number of channels in the universe."""
+        return self._channels
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented by every write."""
+        return self._generation
 
     def set_channel(self, channel: int, value: int) -> None:
         """Set channel value. Public API is 1-based channel numbering."""
@@ -20,6 +49,7 @@ class UniverseBuffer:
             raise ValueError("value must be 0..255")
         with self._lock:
             self._buf[channel - 1] = value
+            self._touch(channel - 1, channel)
 
     def get_channel(self, channel: int) -> int:
         if not 1 <= channel <= self._channels:
@@ -32,18 +62,198 @@ class UniverseBuffer:
         with self._lock:
             return bytes(self._buf)
 
+    def snapshot_if_changed(self, since_generation: int) -> Optional[tuple[int, bytes]]:
+        """Return (generation, snapshot) if the buffer was written after
+        `since_generation`, else None."""
+        with self._lock:
+            if self._generation == since_generation:
+                return None
+            return self._generation, bytes(self._buf)
+
+    def snapshot_into(self, out) -> int:
+        """Copy the universe into the caller-owned writable buffer `out`
+        (at least `channels` bytes) without allocating; returns the
+        generation the copy reflects."""
+        view = _byte_view(out)
+        with self._lock:
+            view[: self._channels] = self._buf
+            return self._generation
+
+    def take_dirty(self) -> Optional[tuple[int, int]]:
+        """Return the 1-based inclusive (first, last) channel range written
+        since the previous call and reset it; None if nothing was written."""
+        with self._lock:
+            lo, hi = self._dirty_lo, self._dirty_hi
+            self._dirty_lo, self._dirty_hi = self._channels, 0
+        if lo >= hi:
+            return None
+        return lo + 1, hi
+
     def zero_all(self) -> None:
         """Set all channels to zero atomically."""
         with self._lock:
-            for i in range(self._channels):
-                self._buf[i] = 0
+            self._buf[:] = self._zeros
+            self._touch(0, self._channels)
+
+    def set_range(self, start: int, data, step: int = 1) -> None:
+        """Atomically write a block of channel values starting at 1-based `start`.
+
+        `data` is any bytes-like object with one byte per channel (bytes,
+        bytearray, memoryview, `array('B')`, NumPy `uint8` arrays); it is
+        applied with a single slice assignment. With `step` > 1 the values go
+        to every `step`-th channel (start, start + step, ...), e.g. the dimmer
+        channel of identical fixtures patched back to back.
+        """
+        view = _byte_view(data)
+        n = len(view)
+        if step < 1:
+            raise ValueError("step must be >= 1")
+        offset = start - 1
+        end = offset + (n - 1) * step + 1 if n else offset
+        if not 1 <= start or end > self._channels:
+            raise IndexError("channel range out of range (1-based)")
+        with self._lock:
+            if step == 1:
+                self._buf[offset:end] = view
+            else:
+                self._buf[offset:end:step] = view
+            self._touch(offset, end)
+
+    def set_ranges(self, writes: Iterable[tuple]) -> None:
+        """Atomically apply several `set_range` writes given as (start, data, step).
+
+        All writes are validated first and land under one lock acquisition
+        with one generation bump, e.g. the red, green and blue channels of a
+        fixture group as three strided slices.
+        """
+        slices = []
+        lo, hi = self._channels, 0
+        for start, data, step in writes:
+            view = _byte_view(data)
+            n = len(view)
+            if step < 1:
+                raise ValueError("step must be >= 1")
+            offset = start - 1
+            end = offset + (n - 1) * step + 1 if n else offset
+            if not 1 <= start or end > self._channels:
+                raise IndexError("channel range out of range (1-based)")
+            if n:
+                slices.append((slice(offset, end, step), view))
+                lo, hi = min(lo, offset), max(hi, end)
+        if not slices:
+            return
+        with self._lock:
+            for where, view in slices:
+                self._buf[where] = view
+            self._touch(lo, hi)
 
     def set_channels(self, updates: Iterable[tuple[int, int]]) -> None:
         """Atomically apply multiple (channel, value) updates."""
+        lo, hi = self._channels + 1, 0
         with self._lock:
-            for ch, val in updates:
-                if not 1 <= ch <= self._channels:
-                    raise IndexError("channel out of range (1-based)")
-                if not 0 <= val <= 255:
-                    raise ValueError("value must be 0..255")
-                self._buf[ch - 1] = val
+            try:
+                for ch, val in updates:
+                    if not 1 <= ch <= self._channels:
+                        raise IndexError("channel out of range (1-based)")
+                    if not 0 <= val <= 255:
+                        raise ValueError("value must be 0..255")
+                    self._buf[ch - 1] = val
+                    if ch < lo:
+                        lo = ch
+                    if ch > hi:
+                        hi = ch
+            finally:
+                if hi:
+                    self._touch(lo - 1, hi)
+
+
+def _byte_view(data) -> memoryview:
+    """Return a flat unsigned-byte memoryview over a bytes-like object."""
+    try:
+        view = memoryview(data)
+    except TypeError:
+        raise TypeError("expected a bytes-like object with one byte per channel") from None
+    if view.itemsize != 1:
+        raise TypeError("expected one byte per channel (e.g. a uint8 array)")
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    return view
+
+
+class _SeqLock:
+    """Writer lock that bumps a sequence counter around every write.
+
+    The counter is odd while a write is in progress and even when the
+    buffer is stable, so readers can copy without taking the lock and
+    detect a torn read by comparing the counter before and after.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sequence = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        self.sequence += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        self.sequence += 1
+        self._lock.release()
+
+
+class SeqlockUniverseBuffer(UniverseBuffer):
+    """UniverseBuffer whose readers never block writers.
+
+    Writers still serialize among themselves and each `set_channels` batch
+    stays atomic, but `snapshot()` and `get_channel()` are lock-free: they
+    copy the buffer and retry if a write was in progress or completed
+    meanwhile. Use it when a sender thread snapshots while effects write
+    heavily (see `benchmarks/buffer_contention.py`).
+    """
+
+    def __init__(self, channels: int = 512):
+        super().__init__(channels)
+        self._lock = _SeqLock()
+
+    def get_channel(self, channel: int) -> int:
+        if not 1 <= channel <= self._channels:
+            raise IndexError("channel out of range (1-based)")
+        # a single byte read cannot tear
+        return self._buf[channel - 1]
+
+    def snapshot(self) -> bytes:
+        """Return a consistent immutable copy without taking the writer lock."""
+        seq = self._lock
+        buf = self._buf
+        while True:
+            before = seq.sequence
+            if before & 1:
+                # writer mid-batch: let it finish
+                time.sleep(0)
+                continue
+            data = bytes(buf)
+            if seq.sequence == before:
+                return data
+
+    def snapshot_into(self, out) -> int:
+        view = _byte_view(out)
+        seq = self._lock
+        n = self._channels
+        while True:
+            before = seq.sequence
+            if before & 1:
+                time.sleep(0)
+                continue
+            generation = self._generation
+            view[:n] = self._buf
+            if seq.sequence == before:
+                return generation
+
+    def snapshot_if_changed(self, since_generation: int) -> Optional[tuple[int, bytes]]:
+        # read the generation first: the snapshot is at least that new
+        generation = self._generation
+        if generation == since_generation:
+            return None
+        return generation, self.snapshot()
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from time import perf_counter
+from typing import Iterable, Optional
 import threading
-import time
 
 from .fixtures import parse_fixtures_json
 from .buffer import UniverseBuffer
-from .artnet import ArtNetSender, DEFAULT_FPS, ARTNET_PORT
+from .scheduler import DEFAULT_SPIN, SKIP, FrameScheduler
+from .fades import FadeEngine
+from .groups import FixtureGroup
+from .realtime import RealtimeConfig
+from .artnet import ArtNetSender, DEFAULT_FPS, ARTNET_PORT, DEFAULT_KEEPALIVE
 from .fixture_types import Fixture, ParCanFixture, MovingHeadFixture
 
 
@@ -33,6 +37,14 @@ class Controller:
         buffer: Optional[UniverseBuffer] = None,
         fixtures_path: Optional[Path | str] = None,
         debug: bool = False,
+        send_on_change: bool = False,
+        keepalive: float = DEFAULT_KEEPALIVE,
+        variable_length: bool = False,
+        recorder=None,
+        own_buffer: bool = False,
+        spin: float = DEFAULT_SPIN,
+        overrun: str = SKIP,
+        output_stage=None,
     ):
         self._host = host
         self._port = port
@@ -50,17 +62,61 @@ class Controller:
             except Exception:
                 pass
         else:
-            self.sender = ArtNetSender(host=host, port=port, universe=universe, fps=fps, debug=self.debug)
+            # send_on_change: only transmit frames whose content changed, plus
+            # a keepalive resend of static universes every `keepalive` seconds
+            self.sender = ArtNetSender(
+                host=host,
+                port=port,
+                universe=universe,
+                fps=fps,
+                debug=self.debug,
+                send_on_change=send_on_change,
+                keepalive=keepalive,
+            )
 
         self.buffer = buffer if buffer is not None else UniverseBuffer()
+        # own_buffer: stop() closes the buffer (unlinking a SharedUniverseBuffer
+        # block); a buffer the caller passed in is theirs to close otherwise
+        self.own_buffer = bool(own_buffer)
+
+        # variable_length: size ArtDMX frames to the highest patched channel
+        # (computed once per fixture load) instead of the full 512 channels
+        self.variable_length = bool(variable_length)
+        self.patched_channels: int | None = None
+
+        # preallocated frame and the buffer generation it was copied at;
+        # idle ticks reuse it instead of copying the universe again
+        self._frame: bytearray | None = None
+        self._frame_view: memoryview | None = None
+        self._frame_generation = -1
+        self._frame_buffer = None
+
+        # optional FrameRecorder capturing every frame actually transmitted
+        self.recorder = recorder
+
+        # optional OutputStage (grand master, submasters, dimmer curves)
+        # applied to each outgoing frame; the buffer keeps programmed levels
+        self.output_stage = output_stage
 
         # fixtures will be a dict id->Fixture instances
         self._fixtures: dict | None = None
         self._fixtures_source: Path | None = Path(fixtures_path) if fixtures_path is not None else None
+        # bumped whenever fixtures are (re)built; FixtureGroups re-select on change
+        self._fixtures_version = 0
+        self._groups: dict = {}
 
         # runtime control for the sender thread
         self._tx_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # absolute-deadline frame clock; its `stats()` report achieved fps,
+        # jitter and overruns of the sender thread. `spin` and `overrun` tune
+        # it as for `Engine`
+        self.scheduler = FrameScheduler(
+            fps if fps > 0 else DEFAULT_FPS, spin=spin, overrun=overrun, stop_event=self._stop_event
+        )
+        # timed fades started by Fixture.fade(); advanced before every frame
+        # by the sender thread or the driving Engine
+        self.fades = FadeEngine()
 
     def load_fixtures(self, path: Optional[Path | str] = None, reload: bool = False) -> dict:
         """Load fixtures from JSON and convert them to Fixture objects bound to
@@ -100,13 +156,45 @@ class Controller:
                 meta=item.get("meta", {}),
                 arm_values=item.get("arm", {}),
                 controller=self,
+                presets=item.get("presets", []),
+                tags=item.get("tags", []),
             )
             fixtures[inst.id] = inst
 
         self._fixtures = fixtures
+        self._fixtures_version += 1
+        self._groups = {}
+        self._update_patched_channels()
         self._fixtures_source = Path(path) if path is not None else self._fixtures_source
         return fixtures
 
+    def group(
+        self,
+        ids: Optional[Iterable[str]] = None,
+        type: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> FixtureGroup:
+        """Return the (cached) `FixtureGroup` of fixtures matching ids, type and tag."""
+        key = (None if ids is None else tuple(ids), type, tag)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = FixtureGroup(self, ids=key[0], type=type, tag=tag)
+        return group
+
+    def _update_patched_channels(self) -> None:
+        """Record the highest patched channel and size the sender's frames to it."""
+        highest = 0
+        for f in (self._fixtures or {}).values():
+            chans = [ch for ch in f.channels.values() if isinstance(ch, int)]
+            if chans:
+                highest = max(highest, max(chans))
+        self.patched_channels = highest or None
+        if not self.variable_length or self.patched_channels is None:
+            return
+        set_length = getattr(self.sender, "set_length", None)
+        if set_length is not None:
+            set_length(self.patched_channels)
+
     def arm_fixtures(self, send: bool = True, force: bool = True) -> None:
         """Apply configured arm values for all fixtures and optionally send a frame.
 
@@ -138,39 +226,40 @@ class Controller:
         except Exception:
             self._last_configured_fixture = None
 
-    def send_frame(self, force: bool = False) -> None:
+    def send_frame(self, force: bool = False) -> bool:
         """Snapshot the buffer and send via the configured sender.
 
-        If no buffer or sender is configured, this is a no-op. If a fixture has
-        been recently configured, the payload will be trimmed to the highest
-        channel index present in that fixture's channel map.
+        Returns True when the sender actually transmitted the frame. If no
+        buffer or sender is configured, this is a no-op. In
+        `variable_length` mode the sender transmits only the channels up to the
+        highest patched one (see `load_fixtures`).
+
+        The sender receives a read-only memoryview of a frame that is reused
+        on the next tick: it is valid for the duration of `send()` only, so a
+        sender that keeps or queues the payload must copy it (`bytes(data)`).
         """
         if self.buffer is None or self.sender is None:
-            return
-        data = self.buffer.snapshot()
+            return False
+        return self._send(self._snapshot(), force=force)
 
-        # If we have a last-configured fixture, limit the payload to its
-        # highest channel index so we only send necessary channels.
-        if getattr(self, "_last_configured_fixture", None) is not None:
-            try:
-                chans = list(self._last_configured_fixture.channels.values())
-                if chans:
-                    max_ch = max(chans)
-                    # snapshot is bytes (0-based) and channels are 1-based
-                    send_data = data[:max_ch]
-                else:
-                    send_data = data
-            except Exception:
-                send_data = data
-        else:
-            send_data = data
+    def _send(self, data, force: bool = False) -> bool:
+        """Send one frame through the output stage, the sender, the recorder
+        and the debug dump. Engines that produce frames outside the buffer
+        (`LookaheadEngine`) send through here too."""
+        if self.sender is None:
+            return False
+        if self.output_stage is not None:
+            data = self.output_stage.process(data)
 
         sent = self.sender.send(data, force=force)
 
+        if sent and self.recorder is not None:
+            self._record(data)
+
         # If the send actually happened and debug mode is enabled, print a
         # trimmed hex dump limited to the last-configured fixture's highest
-        # channel. This ensures we always send the full universe but only log
-        # the relevant portion.
+        # channel. The frame on the wire is unaffected; only the log is
+        # trimmed to the relevant portion.
         if sent and getattr(self, "debug", False):
             try:
                 if getattr(self, "_last_configured_fixture", None) is not None:
@@ -185,33 +274,75 @@ class Controller:
                 print(" ".join(f"{b:02X}" for b in dump))
             except Exception:
                 pass
+        return bool(sent)
+
+    def _snapshot(self):
+        """Copy the buffer into a preallocated frame, skipping the copy while
+        the buffer is untouched, so the send loop allocates nothing.
+
+        The returned read-only view is reused for the next tick; senders copy
+        it into their packet during `send()`.
+        """
+        buffer = self.buffer
+        snapshot_into = getattr(buffer, "snapshot_into", None)
+        if snapshot_into is None:
+            return buffer.snapshot()
+        if self._frame_buffer is not buffer:
+            # buffer was swapped: its generations are unrelated to ours
+            self._frame_buffer = buffer
+            self._frame = bytearray(buffer.channels)
+            self._frame_view = memoryview(self._frame).toreadonly()
+            self._frame_generation = -1
+        if buffer.generation != self._frame_generation:
+            self._frame_generation = snapshot_into(self._frame)
+        return self._frame_view
+
+    def _record(self, data: bytes) -> None:
+        """Capture the frame just sent: the payload as trimmed on the wire,
+        the sender's universe and the sequence number it carried."""
+        sender = self.sender
+        length = getattr(sender, "length", None) or len(data)
+        sequence = (getattr(sender, "_sequence", 1) - 1) & 0xFF
+        universe = getattr(sender, "universe", self._universe)
+        try:
+            self.recorder.record(universe, data[:length], sequence=sequence)
+        except Exception:
+            # recording must never break output
+            pass
 
     def _sender_loop(self) -> None:
         """Background loop that sends frames at the configured FPS until stopped."""
-        interval = 1.0 / float(self._fps) if self._fps > 0 else 1.0 / DEFAULT_FPS
-        while not self._stop_event.is_set():
+        self.scheduler.reset()
+        while self.scheduler.wait():
             try:
+                self.fades.render(perf_counter())
                 self.send_frame(force=False)
             except Exception:
                 # don't let the thread die on transient errors
                 pass
-            # wait with small granularity so stop() becomes responsive
-            waited = 0.0
-            step = min(0.01, interval)
-            while waited < interval and not self._stop_event.is_set():
-                time.sleep(step)
-                waited += step
-
-    def start(self) -> None:
-        """Start the background sender thread. Idempotent."""
+
+    def start(self, realtime: Optional[RealtimeConfig] = None) -> None:
+        """Start the background sender thread. Idempotent.
+
+        `realtime` optionally raises the thread's scheduling priority, pins
+        it to CPUs or sets its niceness; see `RealtimeConfig`.
+        """
         if self._tx_thread is not None and self._tx_thread.is_alive():
             return
         self._stop_event.clear()
-        self._tx_thread = threading.Thread(target=self._sender_loop, name="dmx-sender", daemon=True)
+        target = self._sender_loop if realtime is None else realtime.wrap(self._sender_loop)
+        self._tx_thread = threading.Thread(target=target, name="dmx-sender", daemon=True)
         self._tx_thread.start()
+        if realtime is not None:
+            realtime.wait_applied()
 
     def stop(self) -> None:
-        """Stop the background sender thread and close the sender socket."""
+        """Stop the background sender thread and close the sender socket.
+
+        With `own_buffer=True` the buffer is closed too (a `SharedUniverseBuffer`
+        this process created is unlinked), so send any final blackout first;
+        otherwise the buffer is left open and the controller can be restarted.
+        """
         self._stop_event.set()
         if self._tx_thread is not None:
             self._tx_thread.join(timeout=1.0)
@@ -221,6 +352,12 @@ class Controller:
                 self.sender.close()
         except Exception:
             pass
+        close = getattr(self.buffer, "close", None) if self.own_buffer else None
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
 
     def blackout(self, send: bool = True, force: bool = True) -> None:
         """Set all channels to zero and optionally send immediately.
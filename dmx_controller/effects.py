@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+import math
+import random
+import threading
+
+from .utils import strided_runs
+
+SINE = "sine"
+SAW = "saw"
+SQUARE = "square"
+RANDOM = "random"
+CHASE = "chase"
+WAVEFORMS = (SINE, SAW, SQUARE, RANDOM, CHASE)
+
+# one waveform cycle is sampled into TABLE_SIZE steps
+TABLE_SIZE = 1024
+_MASK = TABLE_SIZE - 1
+_RANDOM_SIZE = 4096
+
+
+def _shape(waveform: str, width: float) -> list[float]:
+    """One cycle of `waveform` as TABLE_SIZE levels in 0..1."""
+    if waveform == SINE:
+        return [0.5 - 0.5 * math.cos(2.0 * math.pi * k / TABLE_SIZE) for k in range(TABLE_SIZE)]
+    if waveform == SAW:
+        return [k / (TABLE_SIZE - 1) for k in range(TABLE_SIZE)]
+    # square and chase: on for the first `width` of the cycle
+    on = max(1, int(round(width * TABLE_SIZE)))
+    return [1.0 if k < on else 0.0 for k in range(TABLE_SIZE)]
+
+
+class Effect:
+    """A waveform applied to one attribute of a group of fixtures.
+
+    `targets` are fixtures (written through their own buffer) or plain
+    channel numbers (written to `buffer`). Each member follows
+    `waveform` at `rate` cycles per second between `low` and `high`;
+    member i lags by `phase + spread * i / n` cycles, so `spread=1.0`
+    distributes one full cycle across the group. `width` is the on-fraction
+    of a cycle for "square" (default 0.5) and "chase" (default 1/n, one
+    member lit at a time). "random" picks a new level per member every
+    cycle.
+
+    Channels and lookup tables are resolved once; a frame is a table lookup
+    per member and one strided `set_range` per run of evenly spaced
+    channels, so identical fixtures patched back to back cost a single bulk
+    write. 16-bit attributes ("pan", "tilt") write their msb/lsb pairs.
+    """
+
+    def __init__(
+        self,
+        targets: Iterable,
+        attribute: str = "dimmer",
+        waveform: str = SINE,
+        rate: float = 1.0,
+        phase: float = 0.0,
+        spread: float = 1.0,
+        low: int = 0,
+        high: Optional[int] = None,
+        width: Optional[float] = None,
+        buffer=None,
+        seed: int = 0,
+    ):
+        if waveform not in WAVEFORMS:
+            raise ValueError(f"waveform must be one of {', '.join(WAVEFORMS)}")
+        members = []
+        buffers = []
+        for target in targets:
+            if isinstance(target, int):
+                members.append((target,))
+                buffers.append(buffer)
+            else:
+                members.append(tuple(target.channels_for(attribute)))
+                buffers.append(buffer if target.buffer is None else target.buffer)
+        if not members:
+            raise ValueError("effect needs at least one target")
+        lanes = len(members[0])
+        if any(len(m) != lanes for m in members):
+            raise ValueError(f"targets mix 8-bit and 16-bit {attribute!r} channels")
+        if any(b is None for b in buffers):
+            raise ValueError("targets without a buffer need Effect(buffer=...)")
+        n = len(members)
+        self.attribute = attribute
+        self.waveform = waveform
+        self.rate = float(rate)
+        self.phase = float(phase)
+        self.spread = float(spread)
+        self.low = int(low)
+        self.high = int(high) if high is not None else (0xFFFF if lanes == 2 else 0xFF)
+        if waveform == CHASE:
+            width = 1.0 / n if width is None else width
+        self.width = 0.5 if width is None else float(width)
+        self.start: Optional[float] = None
+        self._n = n
+        self._offsets = [int(round((self.phase + self.spread * i / n) * TABLE_SIZE)) for i in range(n)]
+        # per buffer: (lane, run) over the member order, written in one call
+        self._writes: list[tuple] = []
+        by_buffer: dict = {}
+        for lane in range(lanes):
+            for run in strided_runs(buffers, [m[lane] for m in members]):
+                entry = by_buffer.get(id(run.buffer))
+                if entry is None:
+                    entry = by_buffer[id(run.buffer)] = (run.buffer, [])
+                    self._writes.append(entry)
+                entry[1].append((lane, run))
+        span = self.high - self.low
+        if waveform == RANDOM:
+            rng = random.Random(seed)
+            levels = [self.low + int(round(rng.random() * span)) for _ in range(_RANDOM_SIZE)]
+        else:
+            levels = [self.low + int(round(v * span)) for v in _shape(waveform, self.width)]
+        if lanes == 2:
+            self._tables = [bytes(v >> 8 for v in levels), bytes(v & 0xFF for v in levels)]
+        else:
+            self._tables = [bytes(levels)]
+
+    def restart(self) -> None:
+        """Start the cycle over at the next render."""
+        self.start = None
+
+    def _indices(self, t: float) -> list[int]:
+        if self.start is None:
+            self.start = t
+        pos = int((t - self.start) * self.rate * TABLE_SIZE)
+        if self.waveform == RANDOM:
+            # level changes once per (member-shifted) cycle
+            size = _RANDOM_SIZE - 1
+            return [(((pos - o) // TABLE_SIZE) * 2654435761 + i * 40503) & size for i, o in enumerate(self._offsets)]
+        return [(pos - o) & _MASK for o in self._offsets]
+
+    def render(self, t: float) -> None:
+        """Write the effect's levels for time `t` (seconds, any monotonic origin)."""
+        indices = self._indices(t)
+        values = [bytes(map(table.__getitem__, indices)) for table in self._tables]
+        for buffer, runs in self._writes:
+            if len(runs) == 1:
+                lane, run = runs[0]
+                buffer.set_range(run.start, values[lane][run.lo : run.hi], run.step)
+            else:
+                # one atomic write: readers never see half an effect frame
+                buffer.set_ranges((run.start, values[lane][run.lo : run.hi], run.step) for lane, run in runs)
+
+
+class EffectEngine:
+    """Set of running effects rendered together once per frame.
+
+    Register it with an engine (`engine.add_renderer(effects)`) and every
+    tick renders all effects into their buffers just before the frame is
+    sent. Calling it directly (`effects(t)`) renders one frame.
+    """
+
+    def __init__(self):
+        self._effects: list[Effect] = []
+        self._lock = threading.Lock()
+
+    def add(self, effect: Effect) -> Effect:
+        with self._lock:
+            self._effects = self._effects + [effect]
+        return effect
+
+    def remove(self, effect: Effect) -> None:
+        with self._lock:
+            self._effects = [e for e in self._effects if e is not effect]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._effects = []
+
+    @property
+    def effects(self) -> list[Effect]:
+        return list(self._effects)
+
+    def render(self, t: float) -> None:
+        # later effects win where they share channels
+        for effect in self._effects:
+            effect.render(t)
+
+    __call__ = render
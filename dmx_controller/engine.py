@@ -6,23 +6,57 @@ from time import perf_counter
 from typing import Optional
 
 from .controller import Controller
+from .realtime import RealtimeConfig
+from .scheduler import DEFAULT_SPIN, SKIP, FrameScheduler
 
 
 class Engine:
-    """Engine that drives sending frames at a fixed FPS with graceful shutdown."""
+    """Engine that drives sending frames at a fixed FPS with graceful shutdown.
 
-    def __init__(self, controller: Controller, fps: float = 60.0):
+    With `sync=True` the engine emits one ArtSync per tick after the tick's
+    frame has been sent, so nodes latch all universes together. A tick only
+    advances once the whole batch (frame plus sync) has gone out.
+
+    Ticks follow a `FrameScheduler`: absolute deadlines, sleep plus a final
+    `spin` window, and `overrun="skip"` or `"catch_up"` for late ticks.
+    `engine.scheduler.stats()` reports achieved fps, jitter and overruns.
+
+    Renderers added with `add_renderer(fn)` are called as `fn(t)` (t from
+    `perf_counter()`) at the start of every tick, before the frame is taken,
+    e.g. an `EffectEngine`. A renderer that raises is counted in
+    `render_errors` and does not stop the tick.
+    """
+
+    def __init__(
+        self,
+        controller: Controller,
+        fps: float = 60.0,
+        sync: bool = False,
+        spin: float = DEFAULT_SPIN,
+        overrun: str = SKIP,
+    ):
         self.controller = controller
         self.fps = float(fps)
+        self.sync = bool(sync)
+        self.scheduler = FrameScheduler(self.fps, spin=spin, overrun=overrun, clock=perf_counter, sleep=time.sleep)
         self._running = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._renderers: list = []
+        self.render_errors = 0
+        fades = getattr(controller, "fades", None)
+        if fades is not None:
+            self.add_renderer(fades)
 
-    def start(self) -> None:
+    def start(self, realtime: Optional[RealtimeConfig] = None) -> None:
+        """Start the tick thread; `realtime` as in `Controller.start()`."""
         if self._thread and self._thread.is_alive():
             return
         self._running.set()
-        self._thread = threading.Thread(target=self._run, daemon=True)
+        target = self._run if realtime is None else realtime.wrap(self._run)
+        self._thread = threading.Thread(target=target, daemon=True)
         self._thread.start()
+        if realtime is not None:
+            realtime.wait_applied()
 
     def stop(self, timeout: float = 1.0) -> None:
         """Stop the engine and perform a final blackout (forced send)."""
@@ -32,29 +66,179 @@ class Engine:
         # Ensure final blackout is sent
         try:
             self.controller.blackout(send=True, force=True)
+            if self.sync:
+                self._send_sync()
         except Exception:
             # Do not raise from stop
             pass
 
     def _run(self, max_iterations: Optional[int] = None) -> None:
-        interval = 1.0 / self.fps
-        next_time = perf_counter()
-        iterations = 0
         # If max_iterations is provided run for that many iterations regardless of _running flag.
-        while (self._running.is_set() or max_iterations is not None) and (max_iterations is None or iterations < max_iterations):
-            now = perf_counter()
-            if now < next_time:
-                time.sleep(next_time - now)
-            else:
-                # if we're late, don't sleep
-                pass
+        self.scheduler.reset()
+        self.scheduler.run(self._tick, self._running.is_set, max_iterations)
+
+    def _send_sync(self) -> None:
+        send_sync = getattr(self.controller.sender, "send_sync", None)
+        if send_sync is not None:
+            send_sync()
 
-            # Send current frame
-            self.controller.send_frame()
+    def add_renderer(self, renderer) -> None:
+        """Call `renderer(t)` at the start of every tick."""
+        self._renderers = self._renderers + [renderer]
 
-            iterations += 1
-            next_time += interval
+    def remove_renderer(self, renderer) -> None:
+        self._renderers = [r for r in self._renderers if r is not renderer]
+
+    def _render(self, t: Optional[float] = None) -> None:
+        renderers = self._renderers
+        if not renderers:
+            return
+        if t is None:
+            t = perf_counter()
+        for renderer in renderers:
+            try:
+                renderer(t)
+            except Exception:
+                self.render_errors += 1
+
+    def _tick(self) -> None:
+        self._render()
+        sent = self.controller.send_frame()
+        if sent and self.sync:
+            self._send_sync()
 
     def run_once(self) -> None:
         """Send one frame immediately (useful for deterministic testing)."""
-        self.controller.send_frame()
+        self._tick()
+
+
+class _Registration:
+    """A controller serviced by `MultiEngine` every `divisor` ticks."""
+
+    def __init__(self, controller: Controller, divisor: int):
+        self.controller = controller
+        self.divisor = divisor
+        self.frames = 0
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+
+    def as_dict(self) -> dict:
+        return {
+            "divisor": self.divisor,
+            "frames": self.frames,
+            "errors": self.errors,
+            "last_error": repr(self.last_error) if self.last_error is not None else None,
+        }
+
+
+class MultiEngine(Engine):
+    """One engine thread servicing many controllers (e.g. one per universe).
+
+    Instead of a `dmx-sender` thread per `Controller.start()`, controllers
+    are registered with `add()` and all of them send from the engine's
+    single thread on each tick, so their frames leave back to back. A
+    controller may run at a lower rate given as an integer `divisor` of the
+    master fps (or an `fps` that divides it). A controller whose send raises
+    is counted in `status()` and does not hold up the others. With
+    `sync=True` one sync is sent per distinct sender after the tick's frames.
+
+    Registered controllers must not be `start()`ed themselves.
+    """
+
+    def __init__(
+        self,
+        controllers=(),
+        fps: float = 60.0,
+        sync: bool = False,
+        spin: float = DEFAULT_SPIN,
+        overrun: str = SKIP,
+    ):
+        super().__init__(None, fps=fps, sync=sync, spin=spin, overrun=overrun)
+        self._entries: list[_Registration] = []
+        self._tick_count = 0
+        for controller in controllers:
+            self.add(controller)
+
+    def add(self, controller: Controller, divisor: Optional[int] = None, fps: Optional[float] = None) -> None:
+        """Register `controller`, sending every tick or every `divisor` ticks."""
+        if fps is not None:
+            if divisor is not None:
+                raise ValueError("give either divisor or fps, not both")
+            ratio = self.fps / float(fps)
+            divisor = int(round(ratio))
+            if divisor < 1 or abs(ratio - divisor) > 1e-9:
+                raise ValueError(f"fps {fps} is not an integer divisor of the master rate {self.fps}")
+        divisor = 1 if divisor is None else int(divisor)
+        if divisor < 1:
+            raise ValueError("divisor must be >= 1")
+        entries = [e for e in self._entries if e.controller is not controller]
+        entries.append(_Registration(controller, divisor))
+        # replace rather than mutate so the engine thread iterates a stable list
+        self._entries = entries
+
+    def remove(self, controller: Controller) -> None:
+        self._entries = [e for e in self._entries if e.controller is not controller]
+
+    @property
+    def controllers(self) -> list[Controller]:
+        return [e.controller for e in self._entries]
+
+    def status(self) -> list[dict]:
+        """Per-controller frames sent and errors, in registration order."""
+        return [e.as_dict() for e in self._entries]
+
+    def _tick(self) -> None:
+        tick = self._tick_count
+        self._tick_count += 1
+        self._render()
+        now = perf_counter()
+        synced = []
+        for entry in self._entries:
+            if tick % entry.divisor:
+                continue
+            controller = entry.controller
+            try:
+                fades = getattr(controller, "fades", None)
+                if fades is not None:
+                    fades.render(now)
+                sent = controller.send_frame()
+            except Exception as exc:
+                entry.errors += 1
+                entry.last_error = exc
+                continue
+            if sent:
+                entry.frames += 1
+                if self.sync and not any(s is controller.sender for s in synced):
+                    synced.append(controller.sender)
+        for sender in synced:
+            self._sync_sender(sender)
+
+    def _sync_sender(self, sender) -> None:
+        send_sync = getattr(sender, "send_sync", None)
+        if send_sync is None:
+            return
+        try:
+            send_sync()
+        except Exception:
+            pass
+
+    def _send_sync(self) -> None:
+        seen = []
+        for entry in self._entries:
+            sender = entry.controller.sender
+            if not any(s is sender for s in seen):
+                seen.append(sender)
+                self._sync_sender(sender)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the engine and black out every registered controller."""
+        self._running.clear()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        for entry in self._entries:
+            try:
+                entry.controller.blackout(send=True, force=True)
+            except Exception:
+                pass
+        if self.sync:
+            self._send_sync()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+import threading
+
+# the curve names stay importable from here for fade callers
+from .utils import CURVES, EASE_IN, EASE_OUT, LINEAR, S_CURVE, strided_runs  # noqa: F401
+
+
+def _pack(values: Iterable[int], width: int) -> int:
+    """Pack values into one integer with `width`-byte little-endian lanes."""
+    return int.from_bytes(b"".join(v.to_bytes(width, "little") for v in values), "little")
+
+
+class _Batch:
+    """Fades sharing start time, duration and curve, interpolated together.
+
+    8-bit channels sit in 16-bit lanes of one big integer and 16-bit pairs
+    in 32-bit lanes, so a frame's levels are a single multiply-add over
+    all lanes: lane = from * (K - k) + to * k + K/2 for k = eased * K, and
+    the interpolated value is the high half of each lane, sliced straight
+    out of the integer's bytes.
+    """
+
+    def __init__(self, duration: float, curve: str):
+        self.duration = duration
+        self.curve = curve
+        self.start: Optional[float] = None
+        # key -> (buffer, channels, target); insertion order is write order
+        self.targets: dict = {}
+
+    def begin(self, t: float, snapshots: dict) -> None:
+        self.start = t
+        self._from = {}
+        for key, (buffer, channels, _target) in self.targets.items():
+            snap = snapshots.get(id(buffer))
+            if snap is None:
+                snap = snapshots[id(buffer)] = buffer.snapshot()
+            if len(channels) == 2:
+                self._from[key] = (snap[channels[0] - 1] << 8) | snap[channels[1] - 1]
+            else:
+                self._from[key] = snap[channels[0] - 1]
+        self._build()
+
+    def drop(self, keys) -> None:
+        for key in keys:
+            self.targets.pop(key, None)
+        if self.start is not None:
+            self._build()
+
+    def _build(self) -> None:
+        narrow = [k for k, v in self.targets.items() if len(v[1]) == 1]
+        wide = [k for k, v in self.targets.items() if len(v[1]) == 2]
+        t = self.targets
+        self._n8 = len(narrow)
+        self._from8 = _pack((self._from[k] for k in narrow), 2)
+        self._to8 = _pack((t[k][2] for k in narrow), 2)
+        self._half8 = _pack((128 for _ in narrow), 2)
+        self._runs8 = strided_runs([t[k][0] for k in narrow], [t[k][1][0] for k in narrow])
+        self._n16 = len(wide)
+        self._from16 = _pack((self._from[k] for k in wide), 4)
+        self._to16 = _pack((t[k][2] for k in wide), 4)
+        self._half16 = _pack((0x8000 for _ in wide), 4)
+        buffers = [t[k][0] for k in wide]
+        self._runs_msb = strided_runs(buffers, [t[k][1][0] for k in wide])
+        self._runs_lsb = strided_runs(buffers, [t[k][1][1] for k in wide])
+
+    def render(self, t: float) -> bool:
+        """Write the levels for `t`; return True once the fade is complete."""
+        p = (t - self.start) / self.duration if self.duration > 0 else 1.0
+        done = p >= 1.0
+        eased = 1.0 if done else CURVES[self.curve](max(0.0, p))
+        if self._n8:
+            k = int(round(eased * 256))
+            lanes = self._from8 * (256 - k) + self._to8 * k + self._half8
+            values = lanes.to_bytes(2 * self._n8, "little")[1::2]
+            for run in self._runs8:
+                run.buffer.set_range(run.start, values[run.lo : run.hi], run.step)
+        if self._n16:
+            k = int(round(eased * 65536))
+            lanes = self._from16 * (65536 - k) + self._to16 * k + self._half16
+            raw = lanes.to_bytes(4 * self._n16, "little")
+            msb, lsb = raw[3::4], raw[2::4]
+            for run in self._runs_msb:
+                run.buffer.set_range(run.start, msb[run.lo : run.hi], run.step)
+            for run in self._runs_lsb:
+                run.buffer.set_range(run.start, lsb[run.lo : run.hi], run.step)
+        return done
+
+
+class FadeEngine:
+    """Timed fades of channel values, advanced once per frame.
+
+    `fade(targets, duration, curve)` starts fading each (buffer, channels,
+    target) from the channel's current value; `channels` is a 1-tuple for
+    8-bit values or an (msb, lsb) pair for 16-bit values (0..65535) that are
+    interpolated at full resolution. A fade takes its start time from the
+    first render after it was requested, so every fade requested between
+    two frames with the same duration and curve joins one batch and is
+    interpolated in a single operation. Starting a fade on a channel that is
+    already fading takes it over from its current level (the older fade
+    keeps running on its other channels).
+
+    `Controller.fades` is rendered on every `Engine` tick and by the
+    controller's own sender thread; `Fixture.fade()` feeds it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: list[_Batch] = []
+        self._active: list[_Batch] = []
+        self._owner: dict = {}
+
+    def fade(self, targets: Iterable[tuple], duration: float, curve: str = S_CURVE) -> None:
+        if curve not in CURVES:
+            raise ValueError(f"curve must be one of {', '.join(CURVES)}")
+        duration = max(0.0, float(duration))
+        checked = []
+        for buffer, channels, target in targets:
+            channels = tuple(channels)
+            limit = 0xFFFF if len(channels) == 2 else 0xFF
+            if not 0 <= target <= limit:
+                raise ValueError(f"fade target must be 0..{limit}")
+            checked.append((buffer, channels, int(target)))
+        with self._lock:
+            batch = next((b for b in self._pending if b.duration == duration and b.curve == curve), None)
+            if batch is None:
+                batch = _Batch(duration, curve)
+                self._pending.append(batch)
+            for buffer, channels, target in checked:
+                key = (id(buffer), channels[0])
+                # a newer request for the same channel wins, in any pending batch
+                for other in self._pending:
+                    if other is not batch:
+                        other.targets.pop(key, None)
+                batch.targets.pop(key, None)
+                batch.targets[key] = (buffer, channels, target)
+
+    def cancel(self, buffer=None, channels: Optional[Iterable[int]] = None) -> None:
+        """Stop fades, leaving channels at their current level.
+
+        With no arguments every fade stops; otherwise only those on the given
+        buffer (and first channels, if given).
+        """
+        with self._lock:
+            for batch in self._pending + self._active:
+                keys = [
+                    k
+                    for k, (buf, chans, _t) in batch.targets.items()
+                    if (buffer is None or buf is buffer) and (channels is None or chans[0] in channels)
+                ]
+                batch.drop(keys)
+                for key in keys:
+                    if self._owner.get(key) is batch:
+                        del self._owner[key]
+            self._pending = [b for b in self._pending if b.targets]
+            self._active = [b for b in self._active if b.targets]
+
+    @property
+    def active(self) -> int:
+        """Number of channels currently fading (including not yet started)."""
+        with self._lock:
+            return sum(len(b.targets) for b in self._pending + self._active)
+
+    def render(self, t: float) -> None:
+        with self._lock:
+            if self._pending:
+                snapshots: dict = {}
+                for batch in self._pending:
+                    if not batch.targets:
+                        continue
+                    # take channels over from older fades
+                    taken: dict = {}
+                    for key in batch.targets:
+                        old = self._owner.get(key)
+                        if old is not None:
+                            taken.setdefault(id(old), (old, []))[1].append(key)
+                        self._owner[key] = batch
+                    for old, keys in taken.values():
+                        old.drop(keys)
+                    batch.begin(t, snapshots)
+                    self._active.append(batch)
+                self._pending = []
+            finished = []
+            for batch in self._active:
+                if not batch.targets or batch.render(t):
+                    finished.append(batch)
+            if finished:
+                self._active = [b for b in self._active if b not in finished]
+                for batch in finished:
+                    for key in batch.targets:
+                        if self._owner.get(key) is batch:
+                            del self._owner[key]
+
+    __call__ = render
@@ -20,6 +20,45 @@ _COLOR_PRESETS = {
 }
 
 
+def _dimmer_byte(value) -> int:
+    """Dimmer level as a byte: 0.0..1.0 is scaled, anything else must be 0..255."""
+    if not isinstance(value, (int, float)):
+        raise TypeError("dimmer must be float 0.0..1.0 or int 0..255")
+    if 0.0 <= float(value) <= 1.0:
+        return int(round(float(value) * 255.0))
+    if not 0 <= value <= 255:
+        raise ValueError("dimmer must be 0.0..1.0 or 0..255")
+    return int(value)
+
+
+def _rgb(value) -> tuple:
+    """(r, g, b) bytes from a preset name or a clamped 3-sequence."""
+    if isinstance(value, str):
+        rgb = _COLOR_PRESETS.get(value.lower())
+        if rgb is None:
+            raise ValueError(f"Unknown color preset: {value}")
+        return rgb
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        return tuple(max(0, min(255, int(x))) for x in value)
+    raise TypeError("color must be a preset name or (r,g,b) tuple")
+
+
+def _is_rgb(fixture) -> bool:
+    return all(c in fixture.channels for c in ("red", "green", "blue"))
+
+
+def _wheel(fixture, value) -> int:
+    """Color wheel byte from a `meta.value_mappings` color name or a clamped int."""
+    if isinstance(value, str):
+        mapping = (fixture.meta.get("value_mappings") or {}).get("color") or {}
+        for key, name in mapping.items():
+            if str(name).lower() == value.lower():
+                return int(key)
+    elif isinstance(value, int):
+        return max(0, min(255, value))
+    raise TypeError("Unsupported color value for fixture")
+
+
 @dataclass
 class Fixture:
     id: str
@@ -31,6 +70,8 @@ class Fixture:
     meta: Dict[str, Any] = field(default_factory=dict)
     arm_values: Dict[str, int] = field(default_factory=dict)
     controller: Optional[object] = None
+    presets: list = field(default_factory=list)
+    tags: list = field(default_factory=list)
 
     def _apply_channel_updates(self, updates: Iterable[tuple[int, int]]) -> None:
         """Write channel updates to the bound buffer if present and notify the
@@ -56,6 +97,28 @@ class Fixture:
                 self.controller._mark_configured(self)
             except Exception:
                 pass
+
+    def channels_for(self, attribute: str) -> tuple[int, ...]:
+        """Resolve an attribute to its DMX channel(s).
+
+        "dimmer" follows the same lookup as the `dimmer` setter; "pan" and
+        "tilt" resolve to their (msb, lsb) pair when the fixture has one; any
+        other name must be a logical channel. Raises KeyError if absent.
+        """
+        if attribute == "dimmer":
+            for logical, typ in (self.meta.get("channel_types") or {}).items():
+                if typ == "dimmer" and logical in self.channels:
+                    return (self.channels[logical],)
+            for candidate in ("dim", "dimmer", "intensity", "level"):
+                if candidate in self.channels:
+                    return (self.channels[candidate],)
+            raise KeyError("No dimmer channel present for fixture")
+        if f"{attribute}_msb" in self.channels and f"{attribute}_lsb" in self.channels:
+            return self.channels[f"{attribute}_msb"], self.channels[f"{attribute}_lsb"]
+        if attribute in self.channels:
+            return (self.channels[attribute],)
+        raise KeyError(f"Unknown logical channel {attribute}")
+
     def set_value(self, logical: str, value: int) -> Dict[int, int]:
         """Map a logical value to channel updates (returns mapping channel->value)."""
         if logical not in self.channels:
@@ -79,28 +142,8 @@ class Fixture:
     @dimmer.setter
     def dimmer(self, value: float) -> None:
         # Accept 0..1 floats or 0..255 ints
-        if isinstance(value, float) or isinstance(value, int):
-            if 0.0 <= float(value) <= 1.0:
-                v = int(round(float(value) * 255.0))
-            else:
-                v = int(value)
-        else:
-            raise TypeError("dimmer must be float 0.0..1.0 or int 0..255")
-        # find candidate channel(s)
-        target = None
-        # check meta channel types first
-        for logical, typ in (self.meta.get("channel_types") or {}).items():
-            if typ in ("dimmer", "dimmer"):
-                target = self.channels.get(logical)
-                break
-        # fallback to common names
-        if target is None:
-            for candidate in ("dim", "dimmer", "intensity", "level"):
-                if candidate in self.channels:
-                    target = self.channels[candidate]
-                    break
-        if target is None:
-            raise KeyError("No dimmer channel present for fixture")
+        v = _dimmer_byte(value)
+        target = self.channels_for("dimmer")[0]
         self.current_values["dim"] = v
         self._apply_channel_updates(((target, v),))
 
@@ -111,42 +154,103 @@ class Fixture:
     @color.setter
     def color(self, value) -> None:
         # RGB fixtures
-        if "red" in self.channels and "green" in self.channels and "blue" in self.channels:
-            if isinstance(value, str):
-                rgb = _COLOR_PRESETS.get(value.lower())
-                if rgb is None:
-                    raise ValueError(f"Unknown color preset: {value}")
-            elif isinstance(value, (list, tuple)) and len(value) == 3:
-                rgb = tuple(int(max(0, min(255, int(x)))) for x in value)
-            else:
-                raise TypeError("color must be a preset name or (r,g,b) tuple")
-            updates = []
-            updates.append((self.channels["red"], rgb[0]))
-            updates.append((self.channels["green"], rgb[1]))
-            updates.append((self.channels["blue"], rgb[2]))
+        if _is_rgb(self):
+            rgb = _rgb(value)
+            updates = [(self.channels[name], v) for name, v in zip(("red", "green", "blue"), rgb)]
             self.current_values.update({"red": rgb[0], "green": rgb[1], "blue": rgb[2]})
             self._apply_channel_updates(updates)
             return
 
-        # single wheel / numeric-mapped color (moving heads)
+        # single wheel / numeric-mapped color (moving heads), by name via meta.value_mappings
         if "color" in self.channels:
-            # try to map by name using meta.value_mappings
-            vm = self.meta.get("value_mappings", {}).get("color") if self.meta else None
-            if isinstance(value, str) and vm:
-                # find key whose mapped value matches (case-insensitive)
-                for k, name in vm.items():
-                    if str(name).lower() == value.lower():
-                        v = int(k)
-                        self.current_values["color"] = v
-                        self._apply_channel_updates(((self.channels["color"], v),))
-                        return
-            # otherwise if value numeric
-            if isinstance(value, int):
-                v = int(max(0, min(255, value)))
-                self.current_values["color"] = v
-                self._apply_channel_updates(((self.channels["color"], v),))
-                return
-            raise TypeError("Unsupported color value for fixture")
+            v = _wheel(self, value)
+            self.current_values["color"] = v
+            self._apply_channel_updates(((self.channels["color"], v),))
+
+    def fade(
+        self,
+        dimmer=None,
+        color=None,
+        pan: Optional[int] = None,
+        tilt: Optional[int] = None,
+        duration: float = 1.0,
+        curve: str = "s",
+        fades=None,
+        **values: int,
+    ) -> None:
+        """Fade attributes to new values over `duration` seconds.
+
+        Accepts the same values as the `dimmer` and `color` setters, 16-bit
+        `pan`/`tilt`, and any logical channel by name (`strobe=0`). `curve`
+        is "linear", "s", "in" or "out". The fade runs on the controller's
+        `FadeEngine` (or `fades`), advanced by the engine tick; a color wheel
+        cannot be interpolated and switches at once. `current_values` take
+        the fade's target values immediately.
+        """
+        engine = fades if fades is not None else getattr(self.controller, "fades", None)
+        if engine is None or self.buffer is None:
+            raise RuntimeError("fade needs a fixture bound to a controller (or fades=FadeEngine)")
+        # resolve and validate everything before any value is written
+        targets = []  # (current_values key, channels, value)
+        wheel = None
+        if dimmer is not None:
+            targets.append(("dim", self.channels_for("dimmer"), _dimmer_byte(dimmer)))
+        if color is not None:
+            if _is_rgb(self):
+                for name, v in zip(("red", "green", "blue"), _rgb(color)):
+                    targets.append((name, (self.channels[name],), v))
+            elif "color" in self.channels:
+                wheel = _wheel(self, color)
+        for name, v in (("pan", pan), ("tilt", tilt)):
+            if v is None:
+                continue
+            if not isinstance(v, int) or not 0 <= v <= 0xFFFF:
+                raise ValueError(f"{name} must be an integer 0..65535")
+            targets.append((name, self.channels_for(name), v))
+        for logical, v in values.items():
+            chans = self.channels_for(logical)
+            limit = 0xFFFF if len(chans) == 2 else 0xFF
+            if not isinstance(v, int) or not 0 <= v <= limit:
+                raise ValueError(f"{logical} must be an integer 0..{limit}")
+            targets.append((logical, chans, v))
+        # FadeEngine.fade checks the curve and targets before it queues anything
+        engine.fade(((self.buffer, chans, v) for _key, chans, v in targets), duration, curve)
+        for key, _chans, v in targets:
+            self.current_values[key] = v
+        if wheel is not None:
+            # a color wheel cannot be interpolated: switch at once
+            self.current_values["color"] = wheel
+            self._apply_channel_updates(((self.channels["color"], wheel),))
+        elif self.controller is not None:
+            try:
+                self.controller._mark_configured(self)
+            except Exception:
+                pass
+
+    def apply_preset(self, name: str) -> None:
+        """Apply a named preset from the fixture definition.
+
+        Preset values are raw channel bytes keyed by logical channel; "pan"
+        and "pan_fine" address the msb/lsb of a 16-bit pair.
+        """
+        for preset in self.presets or []:
+            if str(preset.get("name", "")).lower() == name.lower():
+                break
+        else:
+            raise KeyError(f"Unknown preset {name} for fixture {self.id}")
+        updates = []
+        for key, v in (preset.get("values") or {}).items():
+            if key in self.channels:
+                ch = self.channels[key]
+            elif key.endswith("_fine") and f"{key[:-5]}_lsb" in self.channels:
+                ch = self.channels[f"{key[:-5]}_lsb"]
+            elif f"{key}_msb" in self.channels:
+                ch = self.channels[f"{key}_msb"]
+            else:
+                raise KeyError(f"Preset {name} sets unknown channel {key}")
+            updates.append((ch, int(v)))
+        if updates:
+            self._apply_channel_updates(updates)
 
     def arm(self) -> None:
         """Apply the configured arm values for this fixture (if any)."""
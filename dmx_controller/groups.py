@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Iterable, Optional
+
+from .fixture_types import Fixture, _dimmer_byte, _is_rgb, _rgb, _wheel
+from .utils import strided_runs
+
+
+def _word(name: str, value) -> int:
+    if not isinstance(value, int):
+        raise TypeError(f"{name} must be an integer 0..65535")
+    if not 0 <= value <= 0xFFFF:
+        raise ValueError(f"{name} must be 0..65535")
+    return value
+
+
+def _byte(name: str, value) -> int:
+    if not isinstance(value, int):
+        raise TypeError(f"{name} must be an integer 0..255")
+    if not 0 <= value <= 255:
+        raise ValueError(f"{name} must be 0..255")
+    return value
+
+
+class _Plan:
+    """Resolved channels of one attribute across a group.
+
+    Lanes are (member index, component, buffer, channel), ordered by
+    component then member so evenly patched members form strided runs.
+    """
+
+    def __init__(self, lanes: list[tuple]):
+        self.lanes = lanes
+        self.members = sorted({lane[0] for lane in lanes})
+        self.rgb = {lane[0] for lane in lanes if lane[1] == "red"}
+        self.writes = []  # (buffer, lane indexes, runs)
+        by_buffer: dict = {}
+        for i, (_m, _c, buffer, _ch) in enumerate(lanes):
+            by_buffer.setdefault(id(buffer), (buffer, []))[1].append(i)
+        for buffer, indexes in by_buffer.values():
+            channels = [lanes[i][3] for i in indexes]
+            self.writes.append((buffer, indexes, strided_runs([buffer] * len(channels), channels)))
+
+    def write(self, values: Sequence[int]) -> None:
+        for buffer, indexes, runs in self.writes:
+            data = bytes(values[i] for i in indexes)
+            if len(runs) == 1:
+                run = runs[0]
+                buffer.set_range(run.start, data, run.step)
+            else:
+                buffer.set_ranges((run.start, data[run.lo : run.hi], run.step) for run in runs)
+
+
+class FixtureGroup:
+    """A set of fixtures driven together with one buffer update per attribute.
+
+    Members are given as fixtures or selected from a `Controller` by
+    `ids`, fixture `type` or a `tag` from fixtures.json (all given criteria
+    must match); `controller.group(...)` returns cached groups. Setting
+    `group.dimmer`, `group.color`, `group.pan`, `group.tilt`, `group.speed`
+    or `group.set(logical, value)` takes one value for every member or a
+    sequence with one value per member. Target channels are resolved once
+    per attribute, and each write lands in the buffer as one strided
+    `set_range` (evenly patched members) or one atomic `set_ranges` call.
+    Members without the attribute are skipped.
+
+    A controller-backed group re-selects its members after
+    `load_fixtures(reload=True)`.
+    """
+
+    def __init__(
+        self,
+        fixtures=None,
+        ids: Optional[Iterable[str]] = None,
+        type: Optional[str] = None,
+        tag: Optional[str] = None,
+    ):
+        self._controller = None
+        if fixtures is not None and hasattr(fixtures, "load_fixtures"):
+            self._controller = fixtures
+            fixtures = None
+        self._fixtures = None if fixtures is None else list(fixtures)
+        self.ids = None if ids is None else tuple(ids)
+        self.type = type
+        self.tag = tag
+        self._version = None
+        self._members: list[Fixture] = []
+        self._plans: dict = {}
+
+    @property
+    def members(self) -> list[Fixture]:
+        controller = self._controller
+        if controller is None:
+            if self._version is None:
+                self._members = self._select(self._fixtures)
+                self._version = 0
+            return self._members
+        pool = controller.fixtures  # may lazy-load, which bumps the version
+        if self._version != controller._fixtures_version:
+            self._members = self._select(pool)
+            self._plans = {}
+            self._version = controller._fixtures_version
+        return self._members
+
+    def _select(self, pool) -> list[Fixture]:
+        if self.ids is not None:
+            by_id = {f.id: f for f in pool}
+            missing = [fid for fid in self.ids if fid not in by_id]
+            if missing:
+                raise KeyError(f"Unknown fixture {missing[0]}")
+            pool = [by_id[fid] for fid in self.ids]
+        return [
+            f
+            for f in pool
+            if (self.type is None or f.type == self.type) and (self.tag is None or self.tag in f.tags)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __iter__(self):
+        return iter(self.members)
+
+    def _plan(self, attribute: str) -> _Plan:
+        members = self.members
+        plan = self._plans.get(attribute)
+        if plan is not None:
+            return plan
+        if attribute == "color":
+            components = [("red", "green", "blue"), ("color",)]
+            lanes = []
+            for names in components:
+                for name in names:
+                    for m, f in enumerate(members):
+                        if (name == "color") != _is_rgb(f) and name in f.channels:
+                            lanes.append((m, name, f.buffer, f.channels[name]))
+        else:
+            resolved = []
+            for m, f in enumerate(members):
+                try:
+                    resolved.append((m, f, f.channels_for(attribute)))
+                except KeyError:
+                    continue
+            lanes = [
+                (m, part, f.buffer, chans[part])
+                for part in (0, 1)
+                for m, f, chans in resolved
+                if part < len(chans)
+            ]
+        if not lanes:
+            raise KeyError(f"No member has a {attribute} channel")
+        unbound = [lane for lane in lanes if lane[2] is None]
+        if unbound:
+            raise RuntimeError(f"fixture {members[unbound[0][0]].id} is not bound to a buffer")
+        plan = self._plans[attribute] = _Plan(lanes)
+        return plan
+
+    def _convert(self, plan: _Plan, attribute: str, value, convert, by_fixture: bool) -> dict:
+        members = self.members
+        # a sequence gives one value per member; a bare (r, g, b) tuple is one color
+        single = isinstance(value, str) or (attribute == "color" and isinstance(value, tuple))
+        if isinstance(value, Sequence) and not single:
+            if len(value) != len(members):
+                raise ValueError(f"expected {len(members)} values, one per member")
+            return {m: convert(m, value[m]) for m in plan.members}
+        if by_fixture:
+            return {m: convert(m, value) for m in plan.members}
+        return dict.fromkeys(plan.members, convert(None, value))
+
+    def _apply(self, attribute: str, value, convert, by_fixture: bool = False) -> list:
+        """Convert, validate and write `value`; return (member, converted) pairs."""
+        plan = self._plan(attribute)
+        converted = self._convert(plan, attribute, value, convert, by_fixture)
+        if attribute == "color":
+            rgb = {"red": 0, "green": 1, "blue": 2}
+            data = [
+                converted[m][rgb[component]] if component in rgb else converted[m]
+                for m, component, _b, _c in plan.lanes
+            ]
+        elif attribute in ("pan", "tilt"):
+            # 16-bit value: msb lane (also for coarse-only fixtures), then lsb lane
+            data = [converted[m] & 0xFF if part else converted[m] >> 8 for m, part, _b, _c in plan.lanes]
+        else:
+            data = [converted[m] for m, _part, _b, _c in plan.lanes]
+        plan.write(data)
+        members = self.members
+        self._mark(members[plan.members[-1]])
+        return [(members[m], converted[m]) for m in plan.members]
+
+    def _mark(self, fixture: Fixture) -> None:
+        if fixture.controller is not None:
+            try:
+                fixture.controller._mark_configured(fixture)
+            except Exception:
+                pass
+
+    @property
+    def dimmer(self) -> list[float]:
+        return [f.dimmer for f in self.members]
+
+    @dimmer.setter
+    def dimmer(self, value) -> None:
+        for f, v in self._apply("dimmer", value, lambda m, v: _dimmer_byte(v)):
+            f.current_values["dim"] = v
+
+    @property
+    def color(self) -> list:
+        return [f.color for f in self.members]
+
+    @color.setter
+    def color(self, value) -> None:
+        plan = self._plan("color")
+        members = self.members
+        # one color for the whole group is converted once
+        single = _rgb(value) if plan.rgb and isinstance(value, (str, tuple)) else None
+
+        def convert(m, v):
+            if m not in plan.rgb:
+                return _wheel(members[m], v)
+            return single if v is value else _rgb(v)
+
+        for f, v in self._apply("color", value, convert, by_fixture=True):
+            if isinstance(v, tuple):
+                f.current_values.update({"red": v[0], "green": v[1], "blue": v[2]})
+            else:
+                f.current_values["color"] = v
+
+    @property
+    def pan(self) -> list[int]:
+        return [int(f.current_values.get("pan") or 0) for f in self.members]
+
+    @pan.setter
+    def pan(self, value) -> None:
+        for f, v in self._apply("pan", value, lambda m, v: _word("pan", v)):
+            f.current_values["pan"] = v
+
+    @property
+    def tilt(self) -> list[int]:
+        return [int(f.current_values.get("tilt") or 0) for f in self.members]
+
+    @tilt.setter
+    def tilt(self, value) -> None:
+        for f, v in self._apply("tilt", value, lambda m, v: _word("tilt", v)):
+            f.current_values["tilt"] = v
+
+    @property
+    def speed(self) -> list[int]:
+        return [int(f.current_values.get("speed") or 0) for f in self.members]
+
+    @speed.setter
+    def speed(self, value) -> None:
+        self.set("speed", value)
+
+    def set(self, logical: str, value) -> None:
+        """Write a logical channel (0..255) on every member that has it."""
+        for f, v in self._apply(logical, value, lambda m, v: _byte(logical, v)):
+            f.current_values[logical] = v
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Callable, Optional
+import gc
+import threading
+
+from .controller import Controller
+from .engine import Engine
+from .realtime import RealtimeConfig
+from .scheduler import DEFAULT_SPIN, SKIP
+
+DEFAULT_LOOKAHEAD = 4
+
+
+def freeze_gc() -> None:
+    """Collect once and move every live object to the permanent generation.
+
+    Call after fixtures and shows are loaded: those long-lived objects are
+    then never traversed again, so later collections stay short.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+@contextmanager
+def gc_deferred():
+    """Keep the cyclic collector from running inside the block."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class FrameRing:
+    """Fixed ring of preallocated frames for one producer and one consumer.
+
+    The producer fills `slot(index)` for frame `index` and `commit()`s it;
+    the consumer `peek()`s the oldest frame and `release()`s it after
+    sending. A slot is never rewritten before it is released.
+    """
+
+    def __init__(self, size: int = DEFAULT_LOOKAHEAD, channels: int = 512):
+        if size < 1:
+            raise ValueError("ring size must be >= 1")
+        self.size = size
+        self._frames = [bytearray(channels) for _ in range(size)]
+        self._views = [memoryview(f) for f in self._frames]
+        self._read = 0
+        self._write = 0
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    @property
+    def next_index(self) -> int:
+        """Index of the next frame the producer will write."""
+        return self._write
+
+    def wait_free(self, timeout: Optional[float] = None) -> bool:
+        """Block until a slot is free; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._write - self._read < self.size, timeout)
+
+    def slot(self, index: int) -> memoryview:
+        return self._views[index % self.size]
+
+    def commit(self) -> None:
+        with self._cond:
+            self._write += 1
+            self._cond.notify_all()
+
+    def peek(self) -> Optional[tuple[int, memoryview]]:
+        """Return (index, frame) of the oldest committed frame, or None."""
+        if self._write == self._read:
+            return None
+        index = self._read
+        return index, self._views[index % self.size]
+
+    def release(self) -> None:
+        with self._cond:
+            self._read += 1
+            self._cond.notify_all()
+
+    def clear(self, index: int = 0) -> None:
+        """Drop every frame and restart numbering at `index`."""
+        with self._cond:
+            self._read = self._write = index
+            self._cond.notify_all()
+
+
+class LookaheadEngine(Engine):
+    """Engine that renders deterministic content a few frames ahead.
+
+    `render(index, t, out)` fills `out` (a preallocated frame) with the
+    output of frame `index`, due `t = index / fps` seconds after start. A
+    render thread keeps up to `lookahead` frames queued in a `FrameRing`,
+    and each tick only pops the due frame and transmits it, so a GC pass or a
+    slow callback in the renderer is absorbed by the queue instead of
+    delaying output. Frames made stale by skipped deadlines are dropped.
+
+    Each frame starts as a copy of the controller's buffer after the
+    engine's renderers (the controller's fades and anything added with
+    `add_renderer`) ran at the frame's due time on the render thread, so
+    `render` overlays its content on the live fixture levels; those levels
+    therefore also reach the output up to `lookahead` frames late.
+
+    When the queue is empty at a deadline (an underrun) the tick resends
+    the last transmitted frame rather than the live buffer. Frames go out through the controller, so its output
+    stage, recorder and debug dump apply. `stats()` reports underruns, drops and
+    the lowest queue depth seen; frequent underruns mean `lookahead` is too
+    short. `gc_freeze=True` runs `freeze_gc()` on `start()` (load fixtures
+    first) and `defer_gc=True` disables the collector during each send.
+    """
+
+    def __init__(
+        self,
+        controller: Controller,
+        render: Callable[[int, float, memoryview], None],
+        fps: float = 60.0,
+        lookahead: int = DEFAULT_LOOKAHEAD,
+        sync: bool = False,
+        spin: float = DEFAULT_SPIN,
+        overrun: str = SKIP,
+        gc_freeze: bool = False,
+        defer_gc: bool = True,
+    ):
+        super().__init__(controller, fps=fps, sync=sync, spin=spin, overrun=overrun)
+        self.render = render
+        self.gc_freeze = bool(gc_freeze)
+        self.defer_gc = bool(defer_gc)
+        channels = controller.buffer.channels if controller.buffer is not None else 512
+        self.ring = FrameRing(lookahead, channels)
+        self._render_thread: Optional[threading.Thread] = None
+        self.rendered = 0
+        self.underruns = 0
+        self.dropped = 0
+        self.render_errors = 0
+        self.min_depth: Optional[int] = None
+        self._tick_base = 0
+        # perf_counter() of frame 0, the time base for the engine's renderers
+        self._t0 = perf_counter()
+        # copy of the last transmitted frame, resent on underruns
+        self._last = bytearray(channels)
+        self._last_valid = False
+
+    def fill(self, frames: Optional[int] = None) -> int:
+        """Render into free slots (all of them by default); returns frames rendered."""
+        ring = self.ring
+        count = 0
+        buffer = self.controller.buffer
+        while len(ring) < ring.size and (frames is None or count < frames):
+            index = ring.next_index
+            t = index / self.fps
+            out = ring.slot(index)
+            self._render(self._t0 + t)
+            if buffer is not None:
+                buffer.snapshot_into(out)
+            try:
+                self.render(index, t, out)
+            except Exception:
+                # an unrenderable frame still occupies its slot in time
+                self.render_errors += 1
+            ring.commit()
+            self.rendered += 1
+            count += 1
+        return count
+
+    def _render_loop(self) -> None:
+        ring = self.ring
+        while self._running.is_set():
+            if ring.wait_free(timeout=0.1):
+                self.fill(1)
+
+    def start(self, realtime: Optional[RealtimeConfig] = None) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        if self.gc_freeze:
+            freeze_gc()
+        self.ring.clear()
+        self._t0 = perf_counter()
+        self._tick_base = self.scheduler.frames + self.scheduler.skipped
+        self._running.set()
+        # prime the queue before the first deadline
+        self.fill()
+        self._render_thread = threading.Thread(target=self._render_loop, name="dmx-render", daemon=True)
+        self._render_thread.start()
+        # only the sending thread gets `realtime`; rendering runs ahead anyway
+        super().start(realtime)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._running.clear()
+        if self._render_thread is not None:
+            self._render_thread.join(timeout=timeout)
+            self._render_thread = None
+        super().stop(timeout=timeout)
+
+    def _due_index(self) -> int:
+        # ticks so far, counting deadlines the scheduler skipped
+        return max(0, self.scheduler.frames + self.scheduler.skipped - self._tick_base - 1)
+
+    def _tick(self) -> None:
+        ring = self.ring
+        due = self._due_index()
+        item = ring.peek()
+        while item is not None and item[0] < due:
+            ring.release()
+            self.dropped += 1
+            item = ring.peek()
+        depth = len(ring)
+        if self.min_depth is None or depth < self.min_depth:
+            self.min_depth = depth
+        if item is None:
+            self.underruns += 1
+            if self._last_valid:
+                self._transmit(self._last)
+            return
+        try:
+            if self._transmit(item[1]):
+                self._last[:] = item[1]
+                self._last_valid = True
+        finally:
+            ring.release()
+
+    def _transmit(self, frame) -> bool:
+        with gc_deferred() if self.defer_gc else nullcontext():
+            sent = self.controller._send(frame, force=False)
+            if sent and self.sync:
+                self._send_sync()
+        return sent
+
+    def stats(self) -> dict:
+        return {
+            "lookahead": self.ring.size,
+            "depth": len(self.ring),
+            "min_depth": self.min_depth,
+            "rendered": self.rendered,
+            "underruns": self.underruns,
+            "dropped": self.dropped,
+            "render_errors": self.render_errors,
+        }
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from .buffer import UniverseBuffer, _byte_view
+from .utils import HTP, LTP, intensity_channels, widen
+
+
+class Layer(UniverseBuffer):
+    """One mixer input: a universe buffer that also records which channels
+    it controls.
+
+    Anything that writes a `UniverseBuffer` (fixtures, effects, cue
+    playback, `ArtNetReceiver` targets) can write a layer. A channel joins
+    the layer on its first write and leaves on `release()`. `priority`,
+    `opacity` (0..1), `enabled` and `override` may be changed at any time.
+    An `override` layer merges all its channels LTP, so it can also pull
+    intensities down.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        channels: int = 512,
+        priority: int = 0,
+        opacity: float = 1.0,
+        override: bool = False,
+    ):
+        super().__init__(channels)
+        self.name = name
+        self.priority = int(priority)
+        self.opacity = float(opacity)
+        self.override = bool(override)
+        self.enabled = True
+        self._mask = bytearray(channels)
+
+    @property
+    def mask(self) -> bytes:
+        """0xFF for every channel this layer controls, else 0."""
+        return bytes(self._mask)
+
+    # the mask is marked before the value write: the write bumps the
+    # generation the mixer watches, so it never misses a mask change
+
+    def set_channel(self, channel: int, value: int) -> None:
+        if 1 <= channel <= self._channels:
+            self._mask[channel - 1] = 0xFF
+        super().set_channel(channel, value)
+
+    def set_channels(self, updates: Iterable[tuple[int, int]]) -> None:
+        updates = list(updates)
+        for ch, _val in updates:
+            if 1 <= ch <= self._channels:
+                self._mask[ch - 1] = 0xFF
+        super().set_channels(updates)
+
+    def set_range(self, start: int, data, step: int = 1) -> None:
+        n = len(_byte_view(data))
+        offset = start - 1
+        end = offset + (n - 1) * step + 1 if n else offset
+        if 1 <= start and end <= self._channels and step >= 1:
+            self._mask[offset:end:step] = b"\xff" * n
+        super().set_range(start, data, step)
+
+    def set_ranges(self, writes) -> None:
+        writes = list(writes)
+        for start, data, step in writes:
+            n = len(_byte_view(data))
+            offset = start - 1
+            end = offset + (n - 1) * step + 1 if n else offset
+            if 1 <= start and end <= self._channels and step >= 1:
+                self._mask[offset:end:step] = b"\xff" * n
+        super().set_ranges(writes)
+
+    def release(self, channels: Optional[Iterable[int]] = None) -> None:
+        """Stop controlling `channels` (all by default) and zero them."""
+        if channels is None:
+            self._mask[:] = bytes(self._channels)
+            UniverseBuffer.zero_all(self)
+            return
+        channels = [ch for ch in channels if 1 <= ch <= self._channels]
+        for ch in channels:
+            self._mask[ch - 1] = 0
+        UniverseBuffer.set_channels(self, [(ch, 0) for ch in channels])
+
+    def _state(self) -> tuple:
+        return (self.generation, self.priority, self.opacity, self.enabled, self.override)
+
+
+class LayerMixer:
+    """Composites prioritized layers into an output buffer once per tick.
+
+    Layers are applied in ascending `priority` (then creation order). HTP
+    channels (dimmer/intensity channel types, see `set_fixtures`) take the
+    highest level of all layers, scaled by each layer's opacity; other
+    channels are LTP: the top layer holding the channel wins, crossfaded
+    over the result below it by its opacity.
+
+    Channels are processed as 16-bit lanes of big integers, so each layer
+    costs a handful of whole-universe integer operations. The running
+    result after each layer is cached, and a tick recomposites only from
+    the lowest layer that changed. The output buffer is written with one
+    `set_range` only when the result changed or something else wrote the
+    output. Register the mixer as an engine renderer after the renderers
+    that feed its layers.
+    """
+
+    def __init__(self, output, fixtures: Optional[Iterable] = None):
+        self.output = output
+        self.channels = output.channels
+        n = self.channels
+        self._all = self._low = widen(b"\xff" * n)
+        self._half = widen(b"\x80" * n)
+        self._one = widen(b"\x01" * n)
+        self._carry = self._one << 8
+        self._htp = 0
+        self._layers: list[Layer] = []
+        self._cache: list[tuple] = []  # (layer, state, result) in composite order
+        self._result = 0
+        self._written: Optional[int] = None
+        if fixtures is not None:
+            self.set_fixtures(fixtures)
+
+    def set_fixtures(self, fixtures: Iterable) -> None:
+        """Derive HTP channels from fixture channel types (`utils.intensity_channels`)."""
+        htp = bytearray(self.channels)
+        for fixture in fixtures:
+            for ch in intensity_channels(fixture):
+                if 1 <= ch <= self.channels:
+                    htp[ch - 1] = 0xFF
+        self.set_modes(htp)
+
+    def set_modes(self, htp_mask) -> None:
+        """Set HTP channels from a per-channel mask (non-zero = HTP)."""
+        view = _byte_view(htp_mask)
+        self._htp = widen(bytes(0xFF if v else 0 for v in view[: self.channels]))
+        self._cache = []
+
+    def mode(self, channel: int) -> str:
+        return HTP if (self._htp >> (16 * (channel - 1))) & 0xFF else LTP
+
+    def add_layer(self, name: str, priority: int = 0, opacity: float = 1.0, override: bool = False) -> Layer:
+        if any(layer.name == name for layer in self._layers):
+            raise ValueError(f"layer {name!r} already exists")
+        layer = Layer(name, self.channels, priority=priority, opacity=opacity, override=override)
+        self._layers = self._layers + [layer]
+        return layer
+
+    def remove_layer(self, name: str) -> None:
+        self._layers = [layer for layer in self._layers if layer.name != name]
+
+    def __getitem__(self, name: str) -> Layer:
+        for layer in self._layers:
+            if layer.name == name:
+                return layer
+        raise KeyError(f"Unknown layer {name}")
+
+    @property
+    def layers(self) -> list[Layer]:
+        return sorted(self._layers, key=lambda layer: layer.priority)
+
+    def _apply(self, cur: int, layer: Layer) -> int:
+        if not layer.enabled or layer.opacity <= 0.0:
+            return cur
+        mask = widen(layer._mask)
+        if not mask:
+            return cur
+        values = widen(layer.snapshot())
+        k = int(round(min(1.0, layer.opacity) * 256))
+        low, all_ = self._low, self._all
+        htp = 0 if layer.override else mask & self._htp
+        ltp = mask ^ htp
+        if htp:
+            scaled = values if k == 256 else ((values * k + self._half) >> 8) & low
+            # lane-wise max: bit 8 of (cur + 0x100 - scaled) is set where cur >= scaled
+            ge = (((cur | self._carry) - scaled) >> 8) & self._one
+            keep = ge * 0xFF
+            top = (cur & keep) | (scaled & (all_ ^ keep))
+            cur = (top & htp) | (cur & (all_ ^ htp))
+        if ltp:
+            blended = values if k == 256 else ((cur * (256 - k) + values * k + self._half) >> 8) & low
+            cur = (blended & ltp) | (cur & (all_ ^ ltp))
+        return cur
+
+    def composite(self) -> bool:
+        """Recomposite changed layers; return True if the output was written."""
+        order = self.layers
+        cache = self._cache
+        start = 0
+        while (
+            start < len(order)
+            and start < len(cache)
+            and cache[start][0] is order[start]
+            and cache[start][1] == order[start]._state()
+        ):
+            start += 1
+        changed = start < len(order) or len(cache) != len(order)
+        if changed:
+            cur = cache[start - 1][2] if start else 0
+            cache = cache[:start]
+            for layer in order[start:]:
+                # read the state first: a write racing the snapshot shows up next tick
+                state = layer._state()
+                cur = self._apply(cur, layer)
+                cache.append((layer, state, cur))
+            self._cache = cache
+            self._result = cur
+        if not changed and self._written == self.output.generation:
+            return False
+        frame = self._result.to_bytes(2 * self.channels, "little")[0::2]
+        self.output.set_range(1, frame)
+        self._written = self.output.generation
+        return True
+
+    def render(self, t: float = 0.0) -> None:
+        self.composite()
+
+    __call__ = render
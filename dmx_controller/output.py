@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional, Union
+import threading
+
+from .buffer import _byte_view
+from .utils import CURVES, EASE_IN, LINEAR, S_CURVE, intensity_channels, strided_runs
+
+SQUARE = "square"
+LED = "led"
+
+# dimmer curves as functions of 0..1 -> 0..1, sharing the fade curves
+DIMMER_CURVES = {
+    LINEAR: CURVES[LINEAR],
+    SQUARE: CURVES[EASE_IN],
+    S_CURVE: CURVES[S_CURVE],
+    LED: lambda x: x**2.2,
+}
+_LUT_CACHE_LIMIT = 4096
+
+
+def _channels_of(targets) -> list[int]:
+    if isinstance(targets, int) or hasattr(targets, "channels"):
+        targets = [targets]
+    chans = []
+    for target in targets:
+        chans.extend([target] if isinstance(target, int) else intensity_channels(target))
+    return chans
+
+
+class OutputStage:
+    """Grand master, submasters and dimmer curves applied to outgoing frames.
+
+    Set as `Controller(output_stage=...)` (or `controller.output_stage`):
+    every frame is passed through `process()` after the buffer snapshot and
+    before the sender, so the buffer keeps the programmed levels. Only
+    intensity channels are touched: those of the given `fixtures` whose
+    `meta.channel_types` say dimmer/intensity (or their dimmer channel).
+
+    Each intensity channel maps through one 256-entry table combining its
+    curve with the grand master times the product of its submasters.
+    Channels sharing a table are applied with `bytes.translate` over
+    strided runs. Tables are cached and the channel grouping is rebuilt
+    only after a level or curve changes.
+    """
+
+    def __init__(self, fixtures: Iterable = (), channels: int = 512):
+        self.channels = channels
+        self._lock = threading.Lock()
+        self._grand = 1.0
+        self._intensity: set[int] = set()
+        self._curves: dict[int, str] = {}
+        self._submasters: dict[str, tuple[set[int], float]] = {}
+        self._luts: dict[tuple, bytes] = {}
+        self._runs: list[tuple[int, int, int, bytes]] = []
+        self._dirty = True
+        self._out = bytearray(0)
+        self._out_view = memoryview(self._out).toreadonly()
+        for fixture in fixtures:
+            self.add_fixture(fixture)
+
+    def add_fixture(self, fixture, curve: Optional[str] = None) -> None:
+        """Process `fixture`'s intensity channels, optionally with a curve."""
+        with self._lock:
+            for ch in intensity_channels(fixture):
+                if 1 <= ch <= self.channels:
+                    self._intensity.add(ch)
+                    if curve is not None:
+                        self._curves[ch] = self._check_curve(curve)
+            self._dirty = True
+
+    @staticmethod
+    def _check_curve(curve: str) -> str:
+        if curve not in DIMMER_CURVES:
+            raise ValueError(f"curve must be one of {', '.join(DIMMER_CURVES)}")
+        return curve
+
+    @property
+    def grand_master(self) -> float:
+        return self._grand
+
+    @grand_master.setter
+    def grand_master(self, level: float) -> None:
+        level = max(0.0, min(1.0, float(level)))
+        with self._lock:
+            if level != self._grand:
+                self._grand = level
+                self._dirty = True
+
+    def set_curve(self, targets, curve: str) -> None:
+        """Set the dimmer curve of fixtures or intensity channel numbers."""
+        curve = self._check_curve(curve)
+        with self._lock:
+            for ch in _channels_of(targets):
+                if ch in self._intensity:
+                    self._curves[ch] = curve
+            self._dirty = True
+
+    def add_submaster(self, name: str, targets, level: float = 1.0) -> None:
+        """Create submaster `name` over fixtures or intensity channel numbers."""
+        with self._lock:
+            chans = {ch for ch in _channels_of(targets) if ch in self._intensity}
+            self._submasters[name] = (chans, max(0.0, min(1.0, float(level))))
+            self._dirty = True
+
+    def submaster(self, name: str) -> float:
+        return self._submasters[name][1]
+
+    def set_submaster(self, name: str, level: float) -> None:
+        level = max(0.0, min(1.0, float(level)))
+        with self._lock:
+            chans, old = self._submasters[name]
+            if level != old:
+                self._submasters[name] = (chans, level)
+                self._dirty = True
+
+    def remove_submaster(self, name: str) -> None:
+        with self._lock:
+            self._submasters.pop(name, None)
+            self._dirty = True
+
+    def _lut(self, curve: str, level: float) -> bytes:
+        key = (curve, level)
+        lut = self._luts.get(key)
+        if lut is None:
+            if len(self._luts) >= _LUT_CACHE_LIMIT:
+                self._luts.clear()
+            shape = DIMMER_CURVES[curve]
+            lut = self._luts[key] = bytes(int(round(255.0 * shape(v / 255.0) * level)) for v in range(256))
+        return lut
+
+    def _rebuild(self) -> None:
+        levels = {ch: self._grand for ch in self._intensity}
+        for chans, level in self._submasters.values():
+            for ch in chans:
+                levels[ch] *= level
+        classes: dict[tuple, list[int]] = {}
+        for ch in sorted(self._intensity):
+            key = (self._curves.get(ch, LINEAR), levels[ch])
+            if key != (LINEAR, 1.0):
+                classes.setdefault(key, []).append(ch)
+        runs = []
+        for key, chans in classes.items():
+            lut = self._lut(*key)
+            for run in strided_runs([None] * len(chans), chans):
+                offset = run.start - 1
+                runs.append((offset, offset + (run.hi - run.lo - 1) * run.step + 1, run.step, lut))
+        self._runs = runs
+        self._dirty = False
+
+    def process(self, frame: Union[bytes, bytearray, memoryview]):
+        """Return the frame with masters and curves applied.
+
+        The result is a read-only view of a buffer owned by the stage and
+        reused by the next call; senders copy it into their packet.
+        """
+        with self._lock:
+            if self._dirty:
+                self._rebuild()
+            runs = self._runs
+        if not runs:
+            return frame
+        view = _byte_view(frame)
+        out = self._out
+        if len(out) != len(view):
+            out = self._out = bytearray(len(view))
+            self._out_view = memoryview(out).toreadonly()
+        out[:] = view
+        for start, end, step, lut in runs:
+            out[start:end:step] = out[start:end:step].translate(lut)
+        return self._out_view
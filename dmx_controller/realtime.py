@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional
+import os
+import threading
+import warnings
+
+FIFO = "fifo"
+RR = "rr"
+DEFAULT_RT_PRIORITY = 50
+
+
+class RealtimeConfig:
+    """Opt-in OS scheduling settings for a sender thread (Linux).
+
+    Pass to `Controller.start(realtime=...)` or `Engine.start(realtime=...)`;
+    the settings are applied from inside the new thread, so only that thread
+    is affected:
+
+      - `policy`: "fifo" or "rr" for SCHED_FIFO / SCHED_RR at `priority`
+        (1..99); needs root or CAP_SYS_NICE (or an rtprio limit).
+      - `cpus`: CPU numbers to pin the thread to (`os.sched_setaffinity`).
+      - `nice`: niceness for the thread; negative values need privileges.
+
+    A setting that is denied or unsupported is skipped with a
+    `RuntimeWarning`; the thread still runs. After start, `status` maps each
+    requested setting to "ok", "denied: ...", "unsupported" or
+    "failed: ...".
+    """
+
+    def __init__(
+        self,
+        policy: Optional[str] = FIFO,
+        priority: int = DEFAULT_RT_PRIORITY,
+        cpus: Optional[Iterable[int]] = None,
+        nice: Optional[int] = None,
+    ):
+        if policy not in (None, FIFO, RR):
+            raise ValueError(f"policy must be {FIFO!r}, {RR!r} or None")
+        self.policy = policy
+        self.priority = int(priority)
+        self.cpus = None if cpus is None else set(int(c) for c in cpus)
+        self.nice = None if nice is None else int(nice)
+        self.status: dict = {}
+        self._applied = threading.Event()
+
+    @property
+    def ok(self) -> bool:
+        """True when every requested setting was applied."""
+        return all(v == "ok" for v in self.status.values())
+
+    def apply(self) -> dict:
+        """Apply the settings to the calling thread; returns `status`."""
+        status = {}
+        if self.cpus is not None:
+            status["affinity"] = _attempt(lambda: os.sched_setaffinity(0, self.cpus))
+        if self.nice is not None:
+            status["nice"] = _attempt(
+                lambda: os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.nice)
+            )
+        if self.policy is not None:
+
+            def set_policy():
+                policy = os.SCHED_FIFO if self.policy == FIFO else os.SCHED_RR
+                os.sched_setscheduler(0, policy, os.sched_param(self.priority))
+
+            status["policy"] = _attempt(set_policy)
+        self.status = status
+        for setting, result in status.items():
+            if result != "ok":
+                warnings.warn(f"realtime {setting} not applied ({result})", RuntimeWarning, stacklevel=2)
+        self._applied.set()
+        return status
+
+    def wrap(self, target: Callable[[], None]) -> Callable[[], None]:
+        """Return a thread target that applies the settings, then runs `target`."""
+        self._applied.clear()
+
+        def run():
+            try:
+                self.apply()
+            finally:
+                self._applied.set()
+            target()
+
+        return run
+
+    def wait_applied(self, timeout: float = 1.0) -> bool:
+        return self._applied.wait(timeout)
+
+
+def _attempt(fn: Callable[[], None]) -> str:
+    try:
+        fn()
+    except PermissionError as exc:
+        return f"denied: {exc.strerror or exc}"
+    except (AttributeError, NotImplementedError):
+        # not available on this platform
+        return "unsupported"
+    except OSError as exc:
+        return f"failed: {exc.strerror or exc}"
+    return "ok"
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Mapping, Optional, Union
+import socket
+import threading
+
+from .artnet import ARTNET_PORT, DMX_CHANNELS, _parse_artdmx
+from .buffer import UniverseBuffer
+from .utils import HTP, LTP
+
+# Art-Net drops a merge source that has been silent for 10 seconds
+DEFAULT_SOURCE_TIMEOUT = 10.0
+
+_ZEROS = bytes(DMX_CHANNELS)
+
+
+class _Source:
+    """Latest frame received from one sender for one universe."""
+
+    def __init__(self, addr: tuple, mode: str):
+        self.addr = addr
+        self.mode = mode
+        self.data = bytearray(DMX_CHANNELS)
+        self.length = 0
+        self.sequence = 0
+        self.last_seen = 0.0
+
+    def update(self, payload: memoryview, sequence: int, now: float) -> None:
+        n = len(payload)
+        self.data[:n] = payload
+        if n < self.length:
+            # shorter frame than last time: clear the stale tail
+            self.data[n : self.length] = _ZEROS[n : self.length]
+        self.length = n
+        self.sequence = sequence
+        self.last_seen = now
+
+
+class _MergeState:
+    def __init__(self, target: UniverseBuffer):
+        self.target = target
+        self.sources: dict[tuple, _Source] = {}
+        self.out = bytearray(DMX_CHANNELS)
+        # channels covered by the previous merge write
+        self.written = 0
+
+
+class ArtNetReceiver:
+    """Receive ArtDMX and merge it into `UniverseBuffer` targets.
+
+    `targets` maps an incoming universe to the buffer it is merged into (a
+    single buffer is taken as the target for universe 0). Each sending host
+    is a merge source; its mode comes from `source_modes` (keyed by IP) or
+    `mode`. HTP sources are combined per channel by highest value, then LTP
+    sources overwrite the channels they carry, most recently received last.
+    Sources silent for `source_timeout` seconds drop out of the merge.
+
+    The merged frame is written to the target with a single bulk copy
+    covering the longest live source (and the channels the previous merge
+    wrote, which are zeroed once no source carries them), so merging never
+    loops over channels in Python.
+    """
+
+    def __init__(
+        self,
+        targets: Union[UniverseBuffer, Mapping[int, UniverseBuffer]],
+        host: str = "0.0.0.0",
+        port: int = ARTNET_PORT,
+        mode: str = HTP,
+        source_modes: Optional[Mapping[str, str]] = None,
+        source_timeout: float = DEFAULT_SOURCE_TIMEOUT,
+    ):
+        if isinstance(targets, UniverseBuffer):
+            targets = {0: targets}
+        for m in (mode, *(source_modes or {}).values()):
+            if m not in (HTP, LTP):
+                raise ValueError(f"merge mode must be '{HTP}' or '{LTP}', got {m!r}")
+        self._states = {int(u): _MergeState(buf) for u, buf in targets.items()}
+        self.mode = mode
+        self.source_modes = dict(source_modes or {})
+        self.source_timeout = float(source_timeout)
+        self.packets_received = 0
+        self.packets_ignored = 0
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, port))
+        # one receive buffer reused for every datagram
+        self._rx = bytearray(2048)
+        self._rx_view = memoryview(self._rx)
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def address(self) -> tuple:
+        """(host, port) the receiver is bound to."""
+        return self._socket.getsockname()
+
+    def poll(self, timeout: Optional[float] = 0.0) -> int:
+        """Process datagrams that arrive within `timeout` seconds.
+
+        Returns the number of datagrams handled. `timeout=None` blocks until
+        one arrives.
+        """
+        sock = self._socket
+        sock.settimeout(timeout)
+        handled = 0
+        while True:
+            try:
+                n, addr = sock.recvfrom_into(self._rx)
+            except (BlockingIOError, socket.timeout):
+                return handled
+            self.handle_packet(self._rx_view[:n], addr)
+            handled += 1
+            # drain whatever else is queued without waiting again
+            sock.settimeout(0.0)
+
+    def handle_packet(self, view: memoryview, addr: Optional[tuple] = None) -> bool:
+        """Merge one datagram; returns False if it was not a patched ArtDMX."""
+        parsed = _parse_artdmx(view)
+        if parsed is None:
+            self.packets_ignored += 1
+            return False
+        universe, sequence, payload = parsed
+        state = self._states.get(universe)
+        if state is None:
+            self.packets_ignored += 1
+            return False
+        self.packets_received += 1
+        now = perf_counter()
+        key = addr if addr is not None else ("", 0)
+        src = state.sources.get(key)
+        if src is None:
+            src = state.sources[key] = _Source(key, self.source_modes.get(key[0], self.mode))
+        src.update(payload, sequence, now)
+        self._merge(state, now)
+        return True
+
+    def _merge(self, state: _MergeState, now: float) -> None:
+        timeout = self.source_timeout
+        expired = [k for k, s in state.sources.items() if now - s.last_seen > timeout]
+        for k in expired:
+            del state.sources[k]
+        live = state.sources.values()
+        if not live and not state.written:
+            return
+        htp = [s for s in live if s.mode == HTP]
+        ltp = sorted((s for s in live if s.mode == LTP), key=lambda s: s.last_seen)
+        length = max((s.length for s in live), default=0)
+
+        out = state.out
+        if len(htp) == 1:
+            out[:] = htp[0].data
+        elif htp:
+            # per-channel max across all HTP sources, evaluated in C
+            out[:] = bytes(map(max, *(s.data for s in htp)))
+        else:
+            out[:] = _ZEROS
+        for s in ltp:
+            out[: s.length] = s.data[: s.length]
+        # also cover what the last merge wrote, so channels of a source that
+        # expired (or of a longer frame) fall back to zero instead of latching
+        extent = max(length, state.written)
+        state.target.set_range(1, memoryview(out)[:extent])
+        state.written = length
+
+    def expire(self) -> None:
+        """Drop timed-out sources and re-merge the affected universes."""
+        now = perf_counter()
+        for state in self._states.values():
+            if any(now - s.last_seen > self.source_timeout for s in state.sources.values()):
+                self._merge(state, now)
+
+    def sources(self, universe: int = 0) -> dict:
+        """Monitoring view of live sources: "ip:port" -> {mode, length, sequence, age}."""
+        now = perf_counter()
+        return {
+            f"{s.addr[0]}:{s.addr[1]}": {
+                "mode": s.mode,
+                "length": s.length,
+                "sequence": s.sequence,
+                "age": now - s.last_seen,
+            }
+            for s in self._states[universe].sources.values()
+        }
+
+    def _receive_loop(self) -> None:
+        sock = self._socket
+        # expiry runs on a clock, so steady traffic on one universe does not
+        # keep a silent source on another universe latched
+        interval = max(0.001, min(0.1, self.source_timeout / 2))
+        sock.settimeout(interval)
+        next_expiry = perf_counter() + interval
+        while not self._stop_event.is_set():
+            now = perf_counter()
+            if now >= next_expiry:
+                self.expire()
+                next_expiry = now + interval
+            try:
+                n, addr = sock.recvfrom_into(self._rx)
+            except (BlockingIOError, socket.timeout):
+                continue
+            except OSError:
+                if self._stop_event.is_set():
+                    break
+                continue
+            try:
+                self.handle_packet(self._rx_view[:n], addr)
+            except Exception:
+                # don't let the thread die on malformed input
+                pass
+
+    def start(self) -> None:
+        """Start the background receive thread. Idempotent."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._receive_loop, name="artnet-receiver", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the receive thread and close the socket."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.close()
+
+    def close(self) -> None:
+        try:
+            self._socket.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from time import perf_counter
+from typing import Iterator, Mapping, Optional, Union
+import mmap
+import struct
+import threading
+import time
+import zlib
+
+# File layout: MAGIC, then append-only records of
+#   timestamp f64 | universe u16 | length u16 | sequence u8 | kind u8 | body size u16
+# followed by the body. KEY bodies are the raw payload, DELTA bodies are the
+# zlib-compressed XOR against the universe's previous frame, REPEAT bodies are
+# empty (frame identical to the previous one).
+MAGIC = b"DMXREC01"
+_RECORD = struct.Struct("<dHHBBH")
+KIND_KEY = 0
+KIND_DELTA = 1
+KIND_REPEAT = 2
+DEFAULT_KEYFRAME_INTERVAL = 256
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    n = len(a)
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(n, "little")
+
+
+class FrameRecorder:
+    """Append transmitted frames to a compact binary capture file.
+
+    Consecutive frames of a universe are delta-encoded; a full key frame is
+    written every `keyframe_interval` frames of that universe (and whenever
+    the frame length changes) so the replayer can seek without decoding
+    from the start.
+    """
+
+    def __init__(self, path: Union[Path, str], keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        self.path = Path(path)
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._prev: dict[int, bytes] = {}
+        self._since_key: dict[int, int] = {}
+        # wall-clock origin with perf_counter precision for offsets
+        self._t0 = perf_counter()
+        self._t0_wall = time.time()
+        self._lock = threading.Lock()
+        self.frames = 0
+
+    def record(self, universe: int, data, sequence: int = 0, timestamp: Optional[float] = None) -> None:
+        """Append one frame of `universe` as it was transmitted."""
+        payload = bytes(data)
+        if timestamp is None:
+            timestamp = self._t0_wall + (perf_counter() - self._t0)
+        with self._lock:
+            if self._file is None:
+                raise ValueError("recorder is closed")
+            prev = self._prev.get(universe)
+            since = self._since_key.get(universe, 0)
+            if prev is None or len(prev) != len(payload) or since + 1 >= self.keyframe_interval:
+                kind, body = KIND_KEY, payload
+                self._since_key[universe] = 0
+            else:
+                if payload == prev:
+                    kind, body = KIND_REPEAT, b""
+                else:
+                    kind, body = KIND_DELTA, zlib.compress(_xor(payload, prev), 1)
+                self._since_key[universe] = since + 1
+            self._prev[universe] = payload
+            self._file.write(_RECORD.pack(timestamp, universe, len(payload), sequence & 0xFF, kind, len(body)))
+            if body:
+                self._file.write(body)
+            self.frames += 1
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class FrameReplayer:
+    """Stream a capture file back through a sender at its original timing.
+
+    The file is memory-mapped and only a compact index of record offsets is
+    kept in memory; payloads are decoded one frame at a time. `sender` is a
+    single sender used for every universe or a mapping of universe -> sender.
+    Frames are sent with `force=True` since the capture dictates the timing.
+    """
+
+    def __init__(self, path: Union[Path, str], sender=None):
+        self.path = Path(path)
+        self.sender = sender
+        self.speed = 1.0
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        if self._view[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a frame capture")
+        self._times = array("d")
+        self._offsets = array("Q")
+        self._universes = array("H")
+        self._kinds = array("B")
+        self._universe_set: set[int] = set()
+        self._build_index()
+        self._state: dict[int, bytes] = {}
+        self._pos = 0
+        self._stop_event = threading.Event()
+
+    def _build_index(self) -> None:
+        view = self._view
+        offset = len(MAGIC)
+        size = len(view)
+        unpack = _RECORD.unpack_from
+        while offset + _RECORD.size <= size:
+            ts, universe, _length, _seq, kind, body = unpack(view, offset)
+            if offset + _RECORD.size + body > size:
+                # truncated tail from an interrupted recording
+                break
+            self._times.append(ts)
+            self._offsets.append(offset)
+            self._universes.append(universe)
+            self._kinds.append(kind)
+            self._universe_set.add(universe)
+            offset += _RECORD.size + body
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def duration(self) -> float:
+        if not self._times:
+            return 0.0
+        return self._times[-1] - self._times[0]
+
+    @property
+    def position(self) -> float:
+        """Playback position in seconds from the start of the capture."""
+        if not self._times:
+            return 0.0
+        if self._pos >= len(self._times):
+            return self.duration
+        return self._times[self._pos] - self._times[0]
+
+    def _decode(self, index: int) -> tuple[float, int, int, bytes]:
+        ts, universe, length, seq, kind, body = _RECORD.unpack_from(self._view, self._offsets[index])
+        start = self._offsets[index] + _RECORD.size
+        if kind == KIND_KEY:
+            payload = bytes(self._view[start : start + body])
+        elif kind == KIND_DELTA:
+            payload = _xor(zlib.decompress(self._view[start : start + body]), self._state[universe])
+        else:
+            payload = self._state[universe]
+        self._state[universe] = payload
+        return ts, universe, seq, payload
+
+    def seek(self, seconds: float) -> None:
+        """Position playback at `seconds` from the start of the capture.
+
+        The target record is found by binary search; decoding restarts from
+        the latest key frame of each universe before it.
+        """
+        if not self._times:
+            return
+        index = bisect_left(self._times, self._times[0] + seconds)
+        needed = set(self._universe_set)
+        start = index
+        while start > 0 and needed:
+            start -= 1
+            if self._kinds[start] == KIND_KEY:
+                needed.discard(self._universes[start])
+        self._state = {}
+        for i in range(start, index):
+            universe = self._universes[i]
+            if self._kinds[i] != KIND_KEY and universe not in self._state:
+                continue
+            self._decode(i)
+        self._pos = index
+
+    def frames(self) -> Iterator[tuple[float, int, int, bytes]]:
+        """Yield (timestamp, universe, sequence, payload) from the current position."""
+        while self._pos < len(self._offsets):
+            index = self._pos
+            self._pos += 1
+            yield self._decode(index)
+
+    def _send(self, universe: int, payload: bytes) -> None:
+        sender = self.sender
+        if isinstance(sender, Mapping):
+            sender = sender.get(universe)
+        if sender is not None:
+            sender.send(payload, force=True)
+
+    def play(self, speed: Optional[float] = None, until: Optional[float] = None) -> int:
+        """Replay from the current position, blocking until done or `stop()`.
+
+        `speed` scales time (2.0 plays twice as fast) and may be changed
+        while playing via the `speed` attribute. Returns the number of
+        frames sent.
+        """
+        if speed is not None:
+            self.speed = float(speed)
+        self._stop_event.clear()
+        times = self._times
+        start = times[0] if times else 0.0
+        sent = 0
+        anchor_wall = perf_counter()
+        anchor_ts = times[self._pos] if self._pos < len(times) else 0.0
+        anchor_speed = self.speed
+        while self._pos < len(times):
+            ts = times[self._pos]
+            if until is not None and ts - start > until:
+                break
+            if self.speed != anchor_speed:
+                # re-anchor so a speed change applies from this frame on
+                anchor_wall, anchor_ts, anchor_speed = perf_counter(), ts, self.speed
+            delay = anchor_wall + (ts - anchor_ts) / anchor_speed - perf_counter()
+            if delay > 0 and self._stop_event.wait(delay):
+                break
+            if self._stop_event.is_set():
+                break
+            _ts, universe, _seq, payload = self._decode(self._pos)
+            self._pos += 1
+            self._send(universe, payload)
+            sent += 1
+        return sent
+
+    def stop(self) -> None:
+        """Stop a `play()` running on another thread."""
+        self._stop_event.set()
+
+    def close(self) -> None:
+        try:
+            self._view.release()
+        except Exception:
+            pass
+        try:
+            self._mmap.close()
+        except Exception:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
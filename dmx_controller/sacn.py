@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from typing import Optional, Union
+import socket
+import uuid
+
+from .artnet import (
+    DEFAULT_BACKOFF_INITIAL,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_FPS,
+    DEFAULT_KEEPALIVE,
+    DMX_CHANNELS,
+    ArtNetSender,
+    _ArtDmxPacket,
+)
+
+SACN_PORT = 5568
+DEFAULT_PRIORITY = 100
+ACN_PACKET_IDENTIFIER = b"ASC-E1.17\x00\x00\x00"
+
+VECTOR_ROOT_E131_DATA = 0x00000004
+VECTOR_ROOT_E131_EXTENDED = 0x00000008
+VECTOR_E131_DATA_PACKET = 0x00000002
+VECTOR_E131_EXTENDED_SYNCHRONIZATION = 0x00000001
+VECTOR_DMP_SET_PROPERTY = 0x02
+
+OPTION_STREAM_TERMINATED = 0x40
+
+# offsets into an E1.31 data packet
+_ROOT_FLAGS_OFFSET = 16
+_FRAMING_FLAGS_OFFSET = 38
+_SYNC_ADDRESS_OFFSET = 109
+_SEQUENCE_OFFSET = 111
+_OPTIONS_OFFSET = 112
+_DMP_FLAGS_OFFSET = 115
+_PROPERTY_COUNT_OFFSET = 123
+E131_HEADER_SIZE = 126
+
+
+def multicast_address(universe: int) -> str:
+    """Return the E1.31 multicast group for `universe` (239.255.hi.lo)."""
+    return f"239.255.{(universe >> 8) & 0xFF}.{universe & 0xFF}"
+
+
+def _flags_length(length: int) -> bytes:
+    return (0x7000 | (length & 0x0FFF)).to_bytes(2, "big")
+
+
+def _root_layer(vector: int, cid: bytes) -> bytearray:
+    root = bytearray()
+    root += (0x0010).to_bytes(2, "big")  # preamble size
+    root += (0x0000).to_bytes(2, "big")  # postamble size
+    root += ACN_PACKET_IDENTIFIER
+    root += bytes(2)  # flags & length, patched once the size is known
+    root += vector.to_bytes(4, "big")
+    root += cid
+    return root
+
+
+class _E131Packet(_ArtDmxPacket):
+    """Preallocated E1.31 data packet patched in place for every frame.
+
+    Shares `set_payload` with the ArtDMX template; only the header layout,
+    the sequence offset and the length fields differ.
+    """
+
+    def __init__(
+        self,
+        universe: int,
+        cid: bytes,
+        source_name: str = "dmx_controller",
+        priority: int = DEFAULT_PRIORITY,
+        sync_address: int = 0,
+        length: int = DMX_CHANNELS,
+    ):
+        buf = _root_layer(VECTOR_ROOT_E131_DATA, cid)
+        buf += bytes(2)  # framing flags & length
+        buf += VECTOR_E131_DATA_PACKET.to_bytes(4, "big")
+        buf += source_name.encode("utf-8")[:63].ljust(64, b"\x00")
+        buf += bytes((priority & 0xFF,))
+        buf += (sync_address & 0xFFFF).to_bytes(2, "big")
+        buf += bytes((0, 0))  # sequence, options
+        buf += (universe & 0xFFFF).to_bytes(2, "big")
+        buf += bytes(2)  # DMP flags & length
+        buf += bytes((VECTOR_DMP_SET_PROPERTY, 0xA1))
+        buf += (0x0000).to_bytes(2, "big")  # first property address
+        buf += (0x0001).to_bytes(2, "big")  # address increment
+        buf += bytes(2)  # property value count
+        buf += b"\x00"  # DMX start code
+        buf += bytes(DMX_CHANNELS)
+        self.buf = buf
+        self.view = memoryview(buf)
+        self.payload = self.view[E131_HEADER_SIZE:]
+        self.set_length(length)
+
+    def set_length(self, length: int) -> None:
+        """Set the number of slots carried (1..512)."""
+        length = max(1, min(DMX_CHANNELS, int(length)))
+        self.length = length
+        total = E131_HEADER_SIZE + length
+        buf = self.buf
+        buf[_ROOT_FLAGS_OFFSET : _ROOT_FLAGS_OFFSET + 2] = _flags_length(total - _ROOT_FLAGS_OFFSET)
+        buf[_FRAMING_FLAGS_OFFSET : _FRAMING_FLAGS_OFFSET + 2] = _flags_length(total - _FRAMING_FLAGS_OFFSET)
+        buf[_DMP_FLAGS_OFFSET : _DMP_FLAGS_OFFSET + 2] = _flags_length(total - _DMP_FLAGS_OFFSET)
+        buf[_PROPERTY_COUNT_OFFSET : _PROPERTY_COUNT_OFFSET + 2] = (length + 1).to_bytes(2, "big")
+        self.frame = self.view[:total]
+
+    def set_sequence(self, sequence: int) -> None:
+        self.buf[_SEQUENCE_OFFSET] = sequence & 0xFF
+
+    def set_terminated(self, terminated: bool) -> None:
+        if terminated:
+            self.buf[_OPTIONS_OFFSET] |= OPTION_STREAM_TERMINATED
+        else:
+            self.buf[_OPTIONS_OFFSET] &= ~OPTION_STREAM_TERMINATED & 0xFF
+
+
+def _build_e131_sync_packet(cid: bytes, sync_address: int, sequence: int = 0) -> bytes:
+    """Build an E1.31 universe synchronization packet (49 bytes)."""
+    pkt = _root_layer(VECTOR_ROOT_E131_EXTENDED, cid)
+    pkt += _flags_length(11)
+    pkt += VECTOR_E131_EXTENDED_SYNCHRONIZATION.to_bytes(4, "big")
+    pkt += bytes((sequence & 0xFF,))
+    pkt += (sync_address & 0xFFFF).to_bytes(2, "big")
+    pkt += bytes(2)  # reserved
+    pkt[_ROOT_FLAGS_OFFSET : _ROOT_FLAGS_OFFSET + 2] = _flags_length(len(pkt) - _ROOT_FLAGS_OFFSET)
+    return bytes(pkt)
+
+
+class E131Sender(ArtNetSender):
+    """sACN (E1.31) sender with the `ArtNetSender` contract.
+
+    Drop-in for `ArtNetSender` wherever a sender is injected (e.g.
+    `Controller(sender=E131Sender(universe=1))`): same `send(data, force)`
+    and `close()`, rate limiter, send-on-change, retries and backoff, and the
+    same in-place packet patching. Output is multicast to the universe's
+    239.255.x.y group unless `host` is given for unicast.
+
+    `close()` (and therefore `Controller.stop()`) first sends three
+    stream-terminated packets as E1.31 requires. With `sync_universe` set,
+    data packets name that synchronization address and `send_sync()` emits
+    an E1.31 synchronization packet.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: int = SACN_PORT,
+        universe: int = 1,
+        fps: int = DEFAULT_FPS,
+        timeout: float = 0.2,
+        retries: int = 0,
+        reuse_socket: bool = True,
+        priority: int = DEFAULT_PRIORITY,
+        source_name: str = "dmx_controller",
+        cid: Optional[Union[bytes, uuid.UUID]] = None,
+        sync_universe: int = 0,
+        multicast_ttl: int = 1,
+        multicast_interface: Optional[str] = None,
+        debug: bool = False,
+        send_on_change: bool = False,
+        keepalive: float = DEFAULT_KEEPALIVE,
+        length: int = DMX_CHANNELS,
+        backoff_initial: float = DEFAULT_BACKOFF_INITIAL,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        if not 1 <= universe <= 63999:
+            raise ValueError("sACN universe must be 1..63999")
+        if not 0 <= priority <= 200:
+            raise ValueError("sACN priority must be 0..200")
+        if cid is None:
+            cid = uuid.uuid4()
+        self.cid = cid.bytes if isinstance(cid, uuid.UUID) else bytes(cid)
+        if len(self.cid) != 16:
+            raise ValueError("cid must be 16 bytes")
+        self.priority = int(priority)
+        self.source_name = source_name
+        self.sync_universe = int(sync_universe)
+        self.multicast = host is None
+        self._multicast_ttl = int(multicast_ttl)
+        self._multicast_interface = multicast_interface
+        self._sync_sequence = 0
+        self._sync_socket = None
+        self._terminated = False
+        super().__init__(
+            host=multicast_address(universe) if host is None else host,
+            port=port,
+            universe=universe,
+            fps=fps,
+            timeout=timeout,
+            retries=retries,
+            reuse_socket=reuse_socket,
+            debug=debug,
+            send_on_change=send_on_change,
+            keepalive=keepalive,
+            length=length,
+            backoff_initial=backoff_initial,
+            backoff_max=backoff_max,
+        )
+
+    def _make_packet(self, length: int) -> _E131Packet:
+        return _E131Packet(
+            self.universe,
+            self.cid,
+            source_name=self.source_name,
+            priority=self.priority,
+            sync_address=self.sync_universe,
+            length=length,
+        )
+
+    def _create_socket(self):
+        s = super()._create_socket()
+        self._set_multicast_options(s)
+        return s
+
+    def _set_multicast_options(self, s) -> None:
+        if self.multicast:
+            try:
+                s.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, self._multicast_ttl)
+                if self._multicast_interface is not None:
+                    s.setsockopt(
+                        socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(self._multicast_interface)
+                    )
+            except Exception:
+                pass
+
+    def _sync_sock(self):
+        """Unconnected socket for sync packets to another multicast group.
+
+        The data socket is connect()ed to the universe's group, and BSD/macOS
+        refuse sendto() to a different address on it (EISCONN).
+        """
+        if self._sync_socket is None:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                if self._timeout is not None and self._timeout > 0:
+                    s.settimeout(self._timeout)
+            except Exception:
+                pass
+            self._set_multicast_options(s)
+            self._sync_socket = s
+        return self._sync_socket
+
+    def set_length(self, length: int) -> None:
+        """Send only the first `length` slots (1..512; no even rounding in E1.31)."""
+        self._packet.set_length(length)
+
+    def send_sync(self) -> None:
+        """Send an E1.31 synchronization packet for `sync_universe` (no-op if unset)."""
+        if not self.sync_universe:
+            return
+        pkt = _build_e131_sync_packet(self.cid, self.sync_universe, self._sync_sequence)
+        self._sync_sequence = (self._sync_sequence + 1) & 0xFF
+        addr = (multicast_address(self.sync_universe), self.port) if self.multicast else self._addr
+        if addr != self._addr:
+            self._sync_sock().sendto(pkt, addr)
+            return
+        sock = self._socket if self._reuse_socket else self._create_socket()
+        try:
+            self._transmit(sock, pkt)
+        finally:
+            if not self._reuse_socket:
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+
+    def terminate(self) -> None:
+        """Send three stream-terminated packets so receivers release the universe."""
+        packet = self._packet
+        packet.set_terminated(True)
+        try:
+            for _ in range(3):
+                self.send(packet.payload[: packet.length], force=True)
+        except Exception:
+            pass
+        finally:
+            packet.set_terminated(False)
+
+    def close(self) -> None:
+        if self.frames_sent and not self._terminated:
+            self._terminated = True
+            self.terminate()
+        if self._sync_socket is not None:
+            try:
+                self._sync_socket.close()
+            except Exception:
+                pass
+            self._sync_socket = None
+        super().close()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from array import array
+from time import perf_counter
+from typing import Callable, Optional
+import threading
+import time
+
+# sleep until this long before the deadline, then spin; covers the 1-2 ms
+# oversleep of time.sleep on a stock Linux kernel
+DEFAULT_SPIN = 0.001
+JITTER_SAMPLES = 1024
+
+SKIP = "skip"
+CATCH_UP = "catch_up"
+
+
+class FrameScheduler:
+    """Absolute-deadline frame clock shared by `Controller` and `Engine`.
+
+    Deadlines are `start + n / fps`, so the period never drifts with tick
+    duration or sleep overshoot. `wait()` sleeps until `spin` seconds before
+    the deadline and busy-waits the rest. When a tick starts after its
+    deadline it counts as an overrun; with `overrun="skip"` deadlines missed
+    by a whole period are dropped, with `overrun="catch_up"` the late ticks
+    run back to back until the schedule is met again.
+
+    `clock` and `sleep` are injectable for tests. With a `stop_event` the
+    sleep part waits on the event so a stop is noticed immediately.
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        spin: float = DEFAULT_SPIN,
+        overrun: str = SKIP,
+        clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], None]] = None,
+        stop_event: Optional[threading.Event] = None,
+    ):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        if overrun not in (SKIP, CATCH_UP):
+            raise ValueError(f"overrun must be {SKIP!r} or {CATCH_UP!r}")
+        self.fps = float(fps)
+        self.interval = 1.0 / self.fps
+        self.spin = max(0.0, float(spin))
+        self.overrun = overrun
+        self._clock = clock or perf_counter
+        self._sleep = sleep or time.sleep
+        self._stop_event = stop_event
+        self._deadline: Optional[float] = None
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.frames = 0
+        self.overruns = 0
+        self.skipped = 0
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+        self._jitter = array("d", bytes(8 * JITTER_SAMPLES))
+        self._jitter_count = 0
+
+    def reset(self) -> None:
+        """Restart the schedule: the next `wait()` returns immediately."""
+        self._deadline = None
+
+    def _stopped(self) -> bool:
+        return self._stop_event is not None and self._stop_event.is_set()
+
+    def wait(self) -> bool:
+        """Block until the next frame deadline; return False if stopped meanwhile."""
+        clock = self._clock
+        now = clock()
+        deadline = self._deadline
+        if deadline is None:
+            deadline = now
+        elif now > deadline:
+            self.overruns += 1
+            if self.overrun == SKIP:
+                missed = int((now - deadline) / self.interval)
+                if missed:
+                    self.skipped += missed
+                    deadline += missed * self.interval
+        else:
+            remaining = deadline - now - self.spin
+            if remaining > 0:
+                if self._stop_event is not None:
+                    if self._stop_event.wait(remaining):
+                        return False
+                else:
+                    self._sleep(remaining)
+            if self._stopped():
+                return False
+            while clock() < deadline:
+                pass
+            now = clock()
+        self._record(now - deadline, now)
+        self._deadline = deadline + self.interval
+        return True
+
+    def _record(self, jitter: float, now: float) -> None:
+        self._jitter[self._jitter_count % JITTER_SAMPLES] = jitter
+        self._jitter_count += 1
+        self.frames += 1
+        if self._first is None:
+            self._first = now
+        self._last = now
+
+    def run(self, tick: Callable[[], object], running: Callable[[], bool], max_iterations: Optional[int] = None) -> None:
+        """Call `tick` on every deadline while `running()` (or for `max_iterations`)."""
+        iterations = 0
+        while (max_iterations is None and running()) or (max_iterations is not None and iterations < max_iterations):
+            if not self.wait():
+                return
+            tick()
+            iterations += 1
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frame rate measured over the ticks since the last `reset_stats()`."""
+        if self.frames < 2 or self._last == self._first:
+            return 0.0
+        return (self.frames - 1) / (self._last - self._first)
+
+    def jitter_percentiles(self, percentiles=(50, 95, 99)) -> dict:
+        """Tick start lateness in seconds over the last ticks, by percentile."""
+        n = min(self._jitter_count, JITTER_SAMPLES)
+        if not n:
+            return {p: 0.0 for p in percentiles}
+        samples = sorted(self._jitter[:n])
+        return {p: samples[min(n - 1, max(0, int(round(p / 100.0 * n)) - 1))] for p in percentiles}
+
+    def stats(self) -> dict:
+        jitter = self.jitter_percentiles((50, 95, 99, 100))
+        return {
+            "fps": self.fps,
+            "achieved_fps": self.achieved_fps,
+            "frames": self.frames,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "jitter_p50": jitter[50],
+            "jitter_p95": jitter[95],
+            "jitter_p99": jitter[99],
+            "jitter_max": jitter[100],
+        }
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Optional
+import struct
+import threading
+
+from .buffer import SeqlockUniverseBuffer
+
+# Shared block layout: sequence u64 | generation u64 | channels u32 | pad u32 | channels...
+_HEADER = struct.Struct("<QQII")
+_SEQUENCE = struct.Struct("<Q")
+_GENERATION_OFFSET = 8
+
+
+class _SharedSeqLock:
+    """Seqlock whose counter lives in shared memory.
+
+    Writers in this process serialize on a local lock (plus `writer_lock`
+    when several processes write the same buffer); readers in any process
+    only read the counter, never a lock.
+    """
+
+    def __init__(self, header: memoryview, writer_lock=None):
+        self._header = header
+        self._local = threading.Lock()
+        self._writer_lock = writer_lock
+
+    @property
+    def sequence(self) -> int:
+        return _SEQUENCE.unpack_from(self._header, 0)[0]
+
+    def __enter__(self):
+        self._local.acquire()
+        if self._writer_lock is not None:
+            self._writer_lock.acquire()
+        _SEQUENCE.pack_into(self._header, 0, self.sequence + 1)
+
+    def __exit__(self, exc_type, exc, tb):
+        _SEQUENCE.pack_into(self._header, 0, self.sequence + 1)
+        if self._writer_lock is not None:
+            self._writer_lock.release()
+        self._local.release()
+
+
+class SharedUniverseBuffer(SeqlockUniverseBuffer):
+    """Universe buffer in `multiprocessing.shared_memory`.
+
+    The owning process creates it (`SharedUniverseBuffer()`), worker
+    processes attach with `SharedUniverseBuffer.attach(buf.name)` and write
+    channels directly. Consistency uses the seqlock scheme of
+    `SeqlockUniverseBuffer` with the counter and the generation stored in
+    the shared block, so `snapshot()` in the sender process never takes a
+    cross-process lock. Writers from several processes must pass a shared
+    `writer_lock` (e.g. `multiprocessing.Lock()`); a single writer process
+    needs none. The dirty range (`take_dirty`) is tracked per process.
+
+    `close()` detaches; the creating process also unlinks the block.
+    `Controller.stop()` closes the buffer it uses.
+    """
+
+    def __init__(
+        self,
+        channels: int = 512,
+        name: Optional[str] = None,
+        create: bool = True,
+        writer_lock=None,
+    ):
+        if create:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=_HEADER.size + channels)
+            _HEADER.pack_into(shm.buf, 0, 0, 0, channels, 0)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            _untrack(shm)
+            channels = _HEADER.unpack_from(shm.buf, 0)[2]
+        self._shm = shm
+        self._owner = create
+        # attributes of UniverseBuffer.__init__, bound to the shared block
+        # instead of calling it (it would reset the shared generation)
+        self._channels = channels
+        self._header = shm.buf[: _HEADER.size]
+        self._buf = shm.buf[_HEADER.size : _HEADER.size + channels]
+        self._lock = _SharedSeqLock(self._header, writer_lock)
+        self._zeros = bytes(channels)
+        self._dirty_lo = channels
+        self._dirty_hi = 0
+
+    @classmethod
+    def attach(cls, name: str, writer_lock=None) -> "SharedUniverseBuffer":
+        """Attach to a buffer created by another process."""
+        return cls(name=name, create=False, writer_lock=writer_lock)
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name to pass to `attach()`."""
+        return self._shm.name
+
+    @property
+    def _generation(self) -> int:
+        return _SEQUENCE.unpack_from(self._header, _GENERATION_OFFSET)[0]
+
+    @_generation.setter
+    def _generation(self, value: int) -> None:
+        _SEQUENCE.pack_into(self._header, _GENERATION_OFFSET, value)
+
+    def close(self) -> None:
+        """Detach from the block; the creating process also unlinks it."""
+        shm = getattr(self, "_shm", None)
+        if shm is None:
+            return
+        self._shm = None
+        # views into the mapping must be released before it can close
+        for view in (self._buf, self._header):
+            try:
+                view.release()
+            except Exception:
+                pass
+        try:
+            shm.close()
+        except Exception:
+            pass
+        if self._owner:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    """Stop the resource tracker from unlinking a block this process only
+    attached to (it would otherwise be destroyed when the worker exits)."""
+    try:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
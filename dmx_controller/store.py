@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional, Union
+import threading
+
+from .buffer import UniverseBuffer, _byte_view
+
+
+class UniverseView(UniverseBuffer):
+    """`UniverseBuffer` backed by one universe's slice of a `UniverseStore`.
+
+    It shares the store's memory and lock, so it can be handed to a
+    `Controller` or fixtures like any buffer while the store snapshots or
+    writes the whole rig at once.
+    """
+
+    def __init__(self, store: "UniverseStore", universe: int, offset: int, channels: int):
+        super().__init__(channels)
+        self.store = store
+        self.universe = universe
+        self.offset = offset
+        self._buf = store._view[offset : offset + channels]
+        self._lock = store._lock
+
+
+class UniverseStore:
+    """Many universes held in one contiguous buffer.
+
+    `universes` is a count (universes 0..N-1) or an iterable of universe
+    numbers, laid out in that order. `store[u]` returns the universe as a
+    `UniverseView`; the store itself is addressed by (universe, channel) and
+    `set_range` may run past the end of a universe into the next one in the
+    layout, so pixel walls spanning universes are written in one operation.
+    `snapshot()` copies the whole rig at once.
+    """
+
+    def __init__(self, universes: Union[int, Iterable[int]], channels: int = 512):
+        if isinstance(universes, int):
+            universes = range(universes)
+        self._order = [int(u) for u in universes]
+        if len(set(self._order)) != len(self._order):
+            raise ValueError("duplicate universe in store layout")
+        self._channels = channels
+        self._buf = bytearray(channels * len(self._order))
+        self._view = memoryview(self._buf)
+        self._lock = threading.Lock()
+        self._index = {u: i for i, u in enumerate(self._order)}
+        self._views = {u: UniverseView(self, u, i * channels, channels) for i, u in enumerate(self._order)}
+
+    @property
+    def universes(self) -> list[int]:
+        return list(self._order)
+
+    @property
+    def channels(self) -> int:
+        """Channels per universe."""
+        return self._channels
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, universe: int) -> UniverseView:
+        return self._views[universe]
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def _address(self, universe: int, channel: int) -> int:
+        """0-based offset of a 1-based (universe, channel) in the store."""
+        try:
+            index = self._index[universe]
+        except KeyError:
+            raise KeyError(f"Universe {universe} is not in this store") from None
+        if not 1 <= channel <= self._channels:
+            raise IndexError("channel out of range (1-based)")
+        return index * self._channels + channel - 1
+
+    def set_channel(self, universe: int, channel: int, value: int) -> None:
+        self._address(universe, channel)
+        self._views[universe].set_channel(channel, value)
+
+    def get_channel(self, universe: int, channel: int) -> int:
+        return self._buf[self._address(universe, channel)]
+
+    def set_range(self, universe: int, channel: int, data) -> None:
+        """Write a bytes-like block starting at (universe, channel), continuing
+        into the following universes of the layout if it is long enough."""
+        view = _byte_view(data)
+        start = self._address(universe, channel)
+        end = start + len(view)
+        if end > len(self._buf):
+            raise IndexError("range runs past the last universe in the store")
+        channels = self._channels
+        with self._lock:
+            self._view[start:end] = view
+            first, last = start // channels, (end - 1) // channels
+            for i in range(first, last + 1):
+                base = i * channels
+                self._views[self._order[i]]._touch(max(start, base) - base, min(end, base + channels) - base)
+
+    def snapshot(self) -> bytes:
+        """Return an immutable copy of every universe, in layout order."""
+        with self._lock:
+            return bytes(self._buf)
+
+    def snapshot_into(self, out) -> None:
+        """Copy every universe into the caller-owned buffer `out`."""
+        view = _byte_view(out)
+        with self._lock:
+            view[: len(self._buf)] = self._buf
+
+    def frames(self, data: Optional[Union[bytes, bytearray, memoryview]] = None) -> dict:
+        """Split a whole-rig snapshot into universe -> memoryview slices.
+
+        The result can be passed straight to `MultiUniverseSender.send`.
+        With no argument a fresh snapshot is taken.
+        """
+        view = memoryview(self.snapshot() if data is None else data)
+        channels = self._channels
+        return {u: view[i * channels : (i + 1) * channels] for i, u in enumerate(self._order)}
+
+    def zero_all(self) -> None:
+        with self._lock:
+            self._buf[:] = bytes(len(self._buf))
+            for v in self._views.values():
+                v._touch(0, self._channels)
@@ -8,3 +8,79 @@ def msb_lsb(value: int) -> tuple[int, int]:
     msb = (value >> 8) & 0xFF
     lsb = value & 0xFF
     return msb, lsb
+
+
+# easing curves as functions of progress 0..1 -> 0..1
+LINEAR = "linear"
+S_CURVE = "s"
+EASE_IN = "in"
+EASE_OUT = "out"
+
+CURVES = {
+    LINEAR: lambda p: p,
+    S_CURVE: lambda p: p * p * (3.0 - 2.0 * p),
+    EASE_IN: lambda p: p * p,
+    EASE_OUT: lambda p: 1.0 - (1.0 - p) * (1.0 - p),
+}
+
+# merge modes: highest takes precedence / latest takes precedence
+HTP = "htp"
+LTP = "ltp"
+
+# fixture channel types that carry intensity (merged HTP, scaled by masters)
+INTENSITY_TYPES = ("dimmer", "intensity")
+
+
+def widen(data) -> int:
+    """Pack bytes into 16-bit little-endian lanes of one integer."""
+    wide = bytearray(2 * len(data))
+    wide[0::2] = data
+    return int.from_bytes(wide, "little")
+
+
+def intensity_channels(fixture) -> list[int]:
+    """Channels of `fixture` whose channel type marks them as intensity
+    (falling back to its dimmer channel)."""
+    found = []
+    for logical, typ in (fixture.meta.get("channel_types") or {}).items():
+        ch = fixture.channels.get(logical)
+        if typ in INTENSITY_TYPES and isinstance(ch, int):
+            found.append(ch)
+    if not found:
+        try:
+            found = list(fixture.channels_for("dimmer"))
+        except KeyError:
+            pass
+    return found
+
+
+class Run:
+    """Members whose channels form an arithmetic progression in one buffer,
+    written with a single strided `set_range`."""
+
+    __slots__ = ("buffer", "start", "step", "lo", "hi")
+
+    def __init__(self, buffer, start: int, step: int, lo: int, hi: int):
+        self.buffer = buffer
+        self.start = start
+        self.step = step
+        self.lo = lo
+        self.hi = hi
+
+
+def strided_runs(buffers: list, channels: list[int]) -> list[Run]:
+    """Split channels (with the buffer of each) into evenly spaced runs;
+    `lo:hi` is the slice of the inputs each run covers."""
+    runs: list[Run] = []
+    i, n = 0, len(channels)
+    while i < n:
+        j = i + 1
+        step = channels[j] - channels[i] if j < n else 1
+        if j < n and (step < 1 or buffers[j] is not buffers[i]):
+            step, j = 1, i + 1
+        else:
+            while j < n and buffers[j] is buffers[i] and channels[j] - channels[j - 1] == step:
+                j += 1
+        runs.append(Run(buffers[i], channels[i], step, i, j))
+        i = j
+    return runs
@@ -0,0 +1,149 @@
+import asyncio
+import socket
+
+from dmx_controller.aio import AsyncArtNetSender, AsyncEngine
+from dmx_controller.artnet import _build_artdmx_packet
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.fixture_types import ParCanFixture
+
+
+def _receiver():
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.0.0.1", 0))
+    rx.setblocking(False)
+    return rx
+
+
+def _drain(rx):
+    packets = []
+    while True:
+        try:
+            packets.append(rx.recv(1024))
+        except BlockingIOError:
+            return packets
+
+
+def test_async_sender_requires_open():
+    sender = AsyncArtNetSender()
+    try:
+        sender.send(bytes(512), force=True)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected RuntimeError")
+
+
+def test_async_sender_sends_datagrams():
+    rx = _receiver()
+    port = rx.getsockname()[1]
+
+    async def main():
+        async with AsyncArtNetSender(port=port, fps=1000) as sender:
+            assert sender.send(bytes([7] * 512), force=True)
+            assert sender.send(bytes([8] * 512), force=True)
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    packets = _drain(rx)
+    rx.close()
+    assert packets == [
+        _build_artdmx_packet(bytes([7] * 512), 0, sequence=0),
+        _build_artdmx_packet(bytes([8] * 512), 0, sequence=1),
+    ]
+
+
+def test_async_engine_ticks_and_blacks_out():
+    rx = _receiver()
+    port = rx.getsockname()[1]
+    buf = UniverseBuffer()
+    c = Controller(sender=AsyncArtNetSender(port=port, fps=1000), buffer=buf)
+
+    async def main():
+        engine = AsyncEngine(c, fps=200)
+        await engine.start()
+        buf.set_channel(1, 200)
+        await asyncio.sleep(0.05)
+        await engine.stop()
+        return engine
+
+    engine = asyncio.run(main())
+    packets = _drain(rx)
+    rx.close()
+    assert engine.ticks >= 3
+    assert len(packets) >= 3
+    assert any(p[18] == 200 for p in packets)
+    # final frame is the blackout
+    assert packets[-1][18:] == bytes(512)
+
+
+def test_async_sender_recovers_after_icmp_error():
+    rx = _receiver()
+    port = rx.getsockname()[1]
+
+    async def main():
+        async with AsyncArtNetSender(port=port, fps=1000, backoff_initial=0.001) as sender:
+            sender._protocol.error_received(ConnectionRefusedError())
+            assert not sender.health.as_dict()["healthy"]
+            await asyncio.sleep(0.005)
+            # the first send after the error cannot tell yet whether it was delivered
+            assert sender.send(bytes(512))
+            assert not sender.health.as_dict()["healthy"]
+            await asyncio.sleep(0.005)
+            assert sender.send(bytes(512))
+            return sender.health.as_dict()
+
+    state = asyncio.run(main())
+    rx.close()
+    assert state["healthy"]
+    assert state["consecutive_failures"] == 0
+    assert state["time_in_backoff"] == 0.0
+
+
+def test_async_sender_backoff_grows_against_a_closed_port():
+    closed = _receiver()
+    port = closed.getsockname()[1]
+    closed.close()
+
+    async def main():
+        async with AsyncArtNetSender(port=port, fps=1000, backoff_initial=0.001) as sender:
+            for _ in range(100):
+                sender.send(bytes(512))
+                await asyncio.sleep(0.002)
+            return sender.health.as_dict()
+
+    state = asyncio.run(main())
+    assert not state["healthy"]
+    assert state["consecutive_failures"] >= 3
+    assert state["consecutive_failures"] == state["total_failures"]
+
+
+class DummySender:
+    def send(self, data, force=False):
+        return True
+
+    def close(self):
+        pass
+
+
+def test_async_engine_advances_fades_and_renderers():
+    buf = UniverseBuffer(8)
+    c = Controller(sender=DummySender(), buffer=buf)
+    par = ParCanFixture(id="par", name="Par", type="rgb", channels={"dim": 1}, buffer=buf, controller=c)
+    times = []
+
+    async def main():
+        engine = AsyncEngine(c, fps=200)
+        engine.add_renderer(times.append)
+        await engine.start()
+        par.fade(dimmer=1.0, duration=0.05)
+        await asyncio.sleep(0.2)
+        level = buf.get_channel(1)
+        await engine.stop()
+        return engine, level
+
+    engine, level = asyncio.run(main())
+    assert level == 255
+    assert c.fades.active == 0
+    assert len(times) >= 3
+    assert engine.render_errors == 0
@@ -0,0 +1,116 @@
+import socket
+
+from dmx_controller.artnet import ArtNetSender, MultiUniverseSender
+
+
+class DownSocket:
+    def __init__(self, down=True):
+        self.down = down
+        self.calls = 0
+
+    def setsockopt(self, *a, **k):
+        pass
+
+    def sendto(self, packet, addr):
+        self.calls += 1
+        if self.down:
+            raise OSError("host unreachable")
+
+    def close(self):
+        pass
+
+
+def _clock(monkeypatch):
+    counter = {"t": 50.0}
+    monkeypatch.setattr("dmx_controller.artnet.perf_counter", lambda: counter["t"])
+    return counter
+
+
+def test_failing_destination_backs_off_without_sleeping(monkeypatch):
+    fake = DownSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+
+    def no_sleep(s):
+        raise AssertionError("sender must not sleep")
+
+    monkeypatch.setattr("time.sleep", no_sleep)
+    clock = _clock(monkeypatch)
+    sender = ArtNetSender(fps=1000, retries=2, backoff_initial=0.1, backoff_max=0.4)
+
+    try:
+        sender.send(bytes(512))
+    except OSError:
+        pass
+    assert fake.calls == 3
+    assert sender.health.in_backoff
+    assert sender.health.consecutive_failures == 1
+
+    # still inside the backoff window: skipped without touching the socket
+    clock["t"] += 0.05
+    assert sender.send(bytes(512)) is False
+    assert fake.calls == 3
+
+    # backoff expired: one more try, which doubles the delay
+    clock["t"] += 0.1
+    try:
+        sender.send(bytes(512))
+    except OSError:
+        pass
+    assert abs(sender.health.backoff_until - clock["t"] - 0.2) < 1e-9
+
+    # recovery clears the state
+    fake.down = False
+    clock["t"] += 0.25
+    assert sender.send(bytes(512)) is True
+    state = sender.health.as_dict()
+    assert state["healthy"] is True
+    assert state["consecutive_failures"] == 0
+    assert state["total_failures"] == 2
+    assert "host unreachable" in state["last_error"]
+
+
+def test_multi_universe_health_per_destination(monkeypatch):
+    class PartialSocket(DownSocket):
+        def sendto(self, packet, addr):
+            self.calls += 1
+            if addr[0] == "127.0.0.2":
+                raise OSError("down")
+
+    fake = PartialSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    clock = _clock(monkeypatch)
+    sender = MultiUniverseSender({0: "127.0.0.2", 1: "127.0.0.1"}, fps=10, backoff_initial=0.5)
+
+    try:
+        sender.send({0: bytes(512), 1: bytes(512)})
+    except OSError:
+        pass
+    clock["t"] += 0.125
+    # the failing node is skipped, the healthy one keeps sending
+    assert sender.send({0: bytes(512), 1: bytes(512)}) == 1
+    health = sender.health()
+    assert health["127.0.0.2:6454"]["healthy"] is False
+    assert health["127.0.0.1:6454"]["healthy"] is True
+
+
+def test_connected_sender_reports_a_closed_port():
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+
+    sender = ArtNetSender(port=port, fps=1000, retries=0, backoff_initial=0.0)
+    try:
+        assert sender.send(bytes(512), force=True)
+        try:
+            sender.send(bytes(512), force=True)
+        except ConnectionRefusedError:
+            pass
+        else:
+            raise AssertionError("expected the ICMP error to surface")
+    finally:
+        sender.close()
+    state = sender.health.as_dict()
+    assert not state["healthy"]
+    assert state["total_failures"] == 1
+    assert isinstance(sender.health.last_error, ConnectionRefusedError)
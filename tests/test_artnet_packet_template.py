@@ -0,0 +1,40 @@
+import socket
+
+from dmx_controller.artnet import ArtNetSender, _ArtDmxPacket, _build_artdmx_packet
+
+
+def test_template_matches_reference_builder():
+    pkt = _ArtDmxPacket(universe=3, physical=1)
+    for seq, payload in ((0, bytes([1, 2, 3])), (7, bytes(range(256)) * 2), (255, bytes([9] * 600))):
+        pkt.set_sequence(seq)
+        pkt.set_payload(payload)
+        assert bytes(pkt.buf) == _build_artdmx_packet(payload, 3, sequence=seq, physical=1)
+
+
+def test_shorter_payload_clears_previous_tail():
+    pkt = _ArtDmxPacket()
+    pkt.set_payload(bytes([255] * 512))
+    pkt.set_payload(bytearray([1, 2]))
+    assert bytes(pkt.payload[:2]) == bytes([1, 2])
+    assert bytes(pkt.payload[2:]) == bytes(510)
+
+
+def test_sender_reuses_one_packet_buffer_on_connected_socket():
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.0.0.1", 0))
+    rx.settimeout(1.0)
+    port = rx.getsockname()[1]
+    sender = ArtNetSender(host="127.0.0.1", port=port, fps=1000)
+    try:
+        assert sender._connected
+        buf = sender._packet.buf
+        sender.send(bytes([10] * 512), force=True)
+        sender.send(bytes([20] * 512), force=True)
+        assert sender._packet.buf is buf
+        first, _ = rx.recvfrom(1024)
+        second, _ = rx.recvfrom(1024)
+        assert first == _build_artdmx_packet(bytes([10] * 512), 0, sequence=0)
+        assert second == _build_artdmx_packet(bytes([20] * 512), 0, sequence=1)
+    finally:
+        sender.close()
+        rx.close()
@@ -0,0 +1,79 @@
+import socket
+
+from dmx_controller.artnet import ArtNetSender, MultiUniverseSender
+from dmx_controller.controller import Controller
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def setsockopt(self, *a, **k):
+        pass
+
+    def sendto(self, packet, addr):
+        self.sent.append(bytes(packet))
+
+    def close(self):
+        pass
+
+
+def _clock(monkeypatch):
+    counter = {"t": 100.0}
+    monkeypatch.setattr("dmx_controller.artnet.perf_counter", lambda: counter["t"])
+    return counter
+
+
+def test_unchanged_frames_are_suppressed_until_keepalive(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    clock = _clock(monkeypatch)
+    sender = ArtNetSender(fps=10, send_on_change=True, keepalive=1.0)
+
+    frame = bytes([5] * 512)
+    assert sender.send(frame) is True
+    for _ in range(5):
+        clock["t"] += 0.125
+        assert sender.send(frame) is False
+    clock["t"] += 0.125
+    assert sender.send(bytes([6] * 512)) is True
+    # keepalive resend of a static frame once the interval elapses
+    clock["t"] += 1.0
+    assert sender.send(bytes([6] * 512)) is True
+
+    assert len(fake.sent) == 3
+    assert sender.frames_sent == 3
+    assert sender.frames_suppressed == 5
+
+
+def test_force_bypasses_change_filter(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    sender = ArtNetSender(fps=1000, send_on_change=True)
+    sender.send(bytes(512), force=True)
+    assert sender.send(bytes(512), force=True) is True
+    assert sender.frames_suppressed == 0
+
+
+def test_fixed_rate_mode_is_default(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    clock = _clock(monkeypatch)
+    c = Controller(fps=10)
+    c.send_frame()
+    clock["t"] += 0.25
+    c.send_frame()
+    assert len(fake.sent) == 2
+
+
+def test_multi_universe_skips_static_universes(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    clock = _clock(monkeypatch)
+    sender = MultiUniverseSender({0: "127.0.0.1", 1: "127.0.0.1"}, fps=10, send_on_change=True)
+
+    assert sender.send({0: bytes(512), 1: bytes(512)}) == 2
+    clock["t"] += 0.125
+    assert sender.send({0: bytes(512), 1: bytes([1] * 512)}) == 1
+    assert sender.frames_sent == 3
+    assert sender.frames_suppressed == 1
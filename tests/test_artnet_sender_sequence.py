@@ -11,7 +11,8 @@ class FakeSocket:
         pass
 
     def sendto(self, packet, addr):
-        self.sent.append(packet)
+        # the sender reuses its packet buffer; copy like the kernel does
+        self.sent.append(bytes(packet))
 
     def close(self):
         pass
@@ -0,0 +1,56 @@
+import socket
+
+from dmx_controller.artnet import ARTSYNC_PACKET, ArtNetSender, MultiUniverseSender
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.engine import Engine
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def setsockopt(self, *a, **k):
+        pass
+
+    def sendto(self, packet, addr):
+        self.sent.append((bytes(packet), addr))
+
+    def close(self):
+        pass
+
+
+def test_artsync_packet_layout():
+    assert ARTSYNC_PACKET == b"Art-Net\x00" + bytes((0x00, 0x52, 0x00, 0x0E, 0x00, 0x00))
+
+
+def test_multi_universe_sync_follows_burst_once(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    sender = MultiUniverseSender({0: "127.0.0.1", 1: "127.0.0.1", 2: "127.0.0.2"}, fps=1000, sync=True)
+
+    sender.send({0: bytes(512), 1: bytes(512), 2: bytes(512)}, force=True)
+
+    kinds = [pkt == ARTSYNC_PACKET for pkt, _addr in fake.sent]
+    assert kinds == [False, False, False, True, True]
+    assert {addr for pkt, addr in fake.sent[3:]} == {("127.0.0.1", 6454), ("127.0.0.2", 6454)}
+    assert sender.syncs_sent == 1
+
+
+def test_sync_host_broadcast(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    sender = MultiUniverseSender({0: "127.0.0.1", 1: "127.0.0.2"}, fps=1000, sync=True, sync_host="127.255.255.255")
+    sender.send({0: bytes(512), 1: bytes(512)}, force=True)
+    assert fake.sent[-1] == (ARTSYNC_PACKET, ("127.255.255.255", 6454))
+    assert fake.sent[-2][0] != ARTSYNC_PACKET
+
+
+def test_engine_emits_one_sync_per_tick(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    c = Controller(sender=ArtNetSender(fps=1000), buffer=UniverseBuffer())
+    engine = Engine(c, sync=True)
+
+    engine.run_once()
+    assert [pkt == ARTSYNC_PACKET for pkt, _addr in fake.sent] == [False, True]
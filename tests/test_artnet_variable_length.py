@@ -0,0 +1,58 @@
+import socket
+
+import dmx_controller
+from dmx_controller.artnet import ArtNetSender, _build_artdmx_packet, artdmx_length
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def setsockopt(self, *a, **k):
+        pass
+
+    def sendto(self, packet, addr):
+        self.sent.append(bytes(packet))
+
+    def close(self):
+        pass
+
+
+def test_artdmx_length_rounds_to_even_and_clamps():
+    assert artdmx_length(0) == 2
+    assert artdmx_length(39) == 40
+    assert artdmx_length(40) == 40
+    assert artdmx_length(511) == 512
+    assert artdmx_length(600) == 512
+
+
+def test_sender_variable_length_frames(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    sender = ArtNetSender(fps=1000, length=39)
+    assert sender.length == 40
+
+    data = bytes(range(1, 100))
+    sender.send(data, force=True)
+    assert fake.sent[-1] == _build_artdmx_packet(data, 0, sequence=0, length=40)
+    assert len(fake.sent[-1]) == 58
+
+    sender.set_length(512)
+    sender.send(data, force=True)
+    assert fake.sent[-1] == _build_artdmx_packet(data, 0, sequence=1)
+
+
+def test_controller_sizes_frames_to_highest_patched_channel(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    c = dmx_controller.Controller(fps=1000, variable_length=True)
+    highest = max(max(f.channels.values()) for f in c.fixtures)
+    assert c.patched_channels == highest
+
+    c.buffer.set_channel(highest, 77)
+    c.send_frame(force=True)
+    pkt = fake.sent[-1]
+    length = (pkt[16] << 8) | pkt[17]
+    assert length == artdmx_length(highest)
+    assert len(pkt) == 18 + length
+    assert pkt[18 + highest - 1] == 77
@@ -0,0 +1,80 @@
+from array import array
+
+from dmx_controller.buffer import SeqlockUniverseBuffer, UniverseBuffer
+
+
+def test_set_range_accepts_bytes_like_inputs():
+    for cls in (UniverseBuffer, SeqlockUniverseBuffer):
+        buf = cls(16)
+        buf.set_range(1, b"\x01\x02")
+        buf.set_range(3, bytearray([3, 4]))
+        buf.set_range(5, memoryview(bytes([5, 6])))
+        buf.set_range(7, array("B", [7, 8]))
+        assert buf.snapshot()[:8] == bytes(range(1, 9))
+        buf.set_range(15, b"\xff\xfe")
+        assert buf.snapshot()[-2:] == b"\xff\xfe"
+
+
+def test_set_range_validates():
+    buf = UniverseBuffer(16)
+    for start, data in ((0, b"\x01"), (16, b"\x01\x02")):
+        try:
+            buf.set_range(start, data)
+        except IndexError:
+            continue
+        raise AssertionError("expected IndexError")
+    try:
+        buf.set_range(1, array("H", [1, 2]))
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("expected TypeError for 16-bit items")
+
+
+def test_snapshot_into_and_zero_all():
+    for cls in (UniverseBuffer, SeqlockUniverseBuffer):
+        buf = cls(4)
+        buf.set_range(1, b"\x01\x02\x03\x04")
+        out = bytearray(6)
+        gen = buf.snapshot_into(out)
+        assert gen == buf.generation
+        assert out == bytearray(b"\x01\x02\x03\x04\x00\x00")
+        buf.zero_all()
+        buf.snapshot_into(out)
+        assert out[:4] == bytes(4)
+
+
+def test_set_range_with_step_writes_every_nth_channel():
+    buf = UniverseBuffer(16)
+    buf.take_dirty()
+    buf.set_range(2, b"\x01\x02\x03", step=5)
+    snap = buf.snapshot()
+    assert snap[1] == 1 and snap[6] == 2 and snap[11] == 3
+    assert sum(snap) == 6
+    assert buf.take_dirty() == (2, 12)
+    try:
+        buf.set_range(8, b"\x01\x02", step=10)
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("expected IndexError")
+
+
+def test_set_ranges_applies_all_writes_in_one_update():
+    for cls in (UniverseBuffer, SeqlockUniverseBuffer):
+        buf = cls(16)
+        buf.take_dirty()
+        generation = buf.generation
+        buf.set_ranges([(2, b"\x01\x02", 5), (3, b"\x03", 1)])
+        snap = buf.snapshot()
+        assert snap[1] == 1 and snap[6] == 2 and snap[2] == 3
+        assert buf.generation == generation + 1
+        assert buf.take_dirty() == (2, 7)
+        try:
+            buf.set_ranges([(1, b"\x09", 1), (16, b"\x01\x02", 1)])
+        except IndexError:
+            pass
+        else:
+            raise AssertionError("expected IndexError")
+        # nothing is written when any range is invalid
+        assert buf.get_channel(1) == 0
@@ -0,0 +1,71 @@
+from dmx_controller.buffer import SeqlockUniverseBuffer, UniverseBuffer
+
+
+def test_generation_and_snapshot_if_changed():
+    for cls in (UniverseBuffer, SeqlockUniverseBuffer):
+        buf = cls(16)
+        gen, data = buf.snapshot_if_changed(-1)
+        assert data == bytes(16)
+        assert buf.snapshot_if_changed(gen) is None
+
+        buf.set_channel(3, 7)
+        gen2, data = buf.snapshot_if_changed(gen)
+        assert gen2 > gen
+        assert data[2] == 7
+        assert buf.snapshot_if_changed(gen2) is None
+
+
+def test_dirty_range_tracks_all_write_paths():
+    buf = UniverseBuffer(16)
+    assert buf.take_dirty() is None
+
+    buf.set_channel(5, 1)
+    buf.set_channels([(9, 2), (7, 3)])
+    assert buf.take_dirty() == (5, 9)
+    assert buf.take_dirty() is None
+
+    buf.set_range(11, b"\x01\x02")
+    assert buf.take_dirty() == (11, 12)
+
+    buf.zero_all()
+    assert buf.take_dirty() == (1, 16)
+
+
+def test_failed_batch_still_marks_applied_writes():
+    buf = UniverseBuffer(16)
+    gen = buf.generation
+    try:
+        buf.set_channels([(2, 1), (99, 1)])
+    except IndexError:
+        pass
+    assert buf.generation > gen
+    assert buf.take_dirty() == (2, 2)
+
+
+def test_controller_copies_buffer_only_when_written():
+    from dmx_controller.controller import Controller
+
+    class Sender:
+        def __init__(self):
+            self.frames = []
+
+        def send(self, data, force=False):
+            self.frames.append(bytes(data))
+            return True
+
+    class CountingBuffer(UniverseBuffer):
+        copies = 0
+
+        def snapshot_into(self, out):
+            CountingBuffer.copies += 1
+            return super().snapshot_into(out)
+
+    sender = Sender()
+    c = Controller(sender=sender, buffer=CountingBuffer(8))
+    c.send_frame()
+    c.send_frame()
+    assert CountingBuffer.copies == 1
+    c.buffer.set_channel(1, 5)
+    c.send_frame()
+    assert CountingBuffer.copies == 2
+    assert sender.frames == [bytes(8), bytes(8), bytes([5]) + bytes(7)]
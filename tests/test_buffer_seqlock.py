@@ -0,0 +1,35 @@
+import threading
+
+from dmx_controller.buffer import SeqlockUniverseBuffer
+
+
+def test_snapshots_never_see_partial_batches():
+    buf = SeqlockUniverseBuffer(64)
+    stop = threading.Event()
+
+    def writer():
+        v = 0
+        while not stop.is_set():
+            v = (v + 1) & 0xFF
+            buf.set_channels([(ch, v) for ch in range(1, 65)])
+
+    t = threading.Thread(target=writer)
+    t.start()
+    try:
+        for _ in range(2000):
+            snap = buf.snapshot()
+            assert len(set(snap)) == 1
+    finally:
+        stop.set()
+        t.join()
+
+
+def test_same_api_as_locked_buffer():
+    buf = SeqlockUniverseBuffer(8)
+    buf.set_channel(2, 9)
+    buf.set_channels([(3, 4)])
+    assert buf.get_channel(2) == 9
+    assert buf.snapshot() == bytes([0, 9, 4, 0, 0, 0, 0, 0])
+    buf.zero_all()
+    assert buf.snapshot() == bytes(8)
+    assert buf._lock.sequence % 2 == 0
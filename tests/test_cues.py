@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.cues import CuePlayer, compile_cues, load_cue_list
+from dmx_controller.fixture_types import MovingHeadFixture, ParCanFixture
+
+
+def rig():
+    par = ParCanFixture(
+        id="par",
+        name="Par",
+        type="rgb",
+        channels={"dim": 10, "red": 11, "green": 12, "blue": 13, "strobe": 14},
+        meta={"channel_types": {"dim": "dimmer", "strobe": "strobe"}},
+    )
+    head = MovingHeadFixture(
+        id="head",
+        name="Head",
+        type="moving_head",
+        channels={"pan_msb": 1, "pan_lsb": 2, "tilt_msb": 3, "tilt_lsb": 4, "dim": 6},
+        presets=[{"name": "Piano", "values": {"pan": 120, "pan_fine": 35, "tilt": 20, "tilt_fine": 11}}],
+    )
+    return {"par": par, "head": head}
+
+
+CUES = [
+    {"name": "one", "values": {"par": {"dimmer": 1.0, "color": "red"}}, "fade": 1.0, "follow": 2.0},
+    {
+        "name": "two",
+        "values": {"par": {"color": "blue", "strobe": 200}, "head": {"preset": "Piano"}},
+        "fade": 1.0,
+        "follow": 3.0,
+    },
+    {"name": "three", "values": {"par": {"dimmer": 0}}, "fade": 0.5},
+]
+
+
+def test_compile_tracks_values_and_applies_presets():
+    show = compile_cues(CUES, rig(), fps=10)
+    assert (show.start, show.width) == (1, 14)
+    two = show.cues[1].keyframe
+    assert two[0:4] == bytes([120, 35, 20, 11])
+    assert two[9:14] == bytes([255, 0, 0, 255, 200])  # dimmer tracked from cue one
+    assert show.cues[2].keyframe[9] == 0
+    assert show.duration == 5.0
+
+
+def test_fade_frames_interpolate_pairs_and_snap_strobe():
+    show = compile_cues(CUES, rig(), fps=10)
+    mid = bytes(show.cues[1].frame_at(0.5, show.fps))
+    assert mid[10] == 128 and mid[12] == 128  # red out, blue in
+    assert mid[13] == 200  # strobe snaps at the start of the fade
+    pan = (mid[0] << 8) | mid[1]
+    assert pan == round(((120 << 8) | 35) / 2)
+
+
+def test_player_go_back_jump_and_follow():
+    show = compile_cues(CUES, rig(), fps=10)
+    buf = UniverseBuffer(32)
+    player = CuePlayer(show, buf)
+    player.render(0.0)
+    assert buf.snapshot() == bytes(32)  # nothing until GO
+    player.go()
+    player.render(100.0)
+    player.render(100.5)
+    assert buf.get_channel(10) == 128
+    player.render(102.5)  # followed into cue two
+    assert player.cue == "two"
+    player.render(104.0)
+    assert buf.get_channel(1) == 120
+    player.back()
+    player.render(104.1)
+    assert player.cue == "one" and buf.get_channel(1) == 0 and buf.get_channel(11) == 255
+    player.jump("three")
+    player.render(104.2)
+    assert buf.get_channel(10) == 0
+    with pytest.raises(KeyError):
+        player.jump("four")
+
+
+def test_seek_locates_cue_by_timeline_time():
+    show = compile_cues(CUES, rig(), fps=10)
+    assert show.locate(0.0) == (0, 0.0)
+    assert show.locate(2.5) == (1, 0.5)
+    assert show.locate(60.0) == (2, 55.0)
+    buf = UniverseBuffer(32)
+    player = CuePlayer(show, buf)
+    player.seek(2.5)
+    player.render(7.0)
+    assert player.cue == "two" and buf.get_channel(11) == 128
+
+
+def test_load_cue_list_and_unknown_fixture(tmp_path):
+    path = tmp_path / "show.json"
+    path.write_text(json.dumps({"cues": CUES}))
+    assert load_cue_list(path) == CUES
+    with pytest.raises(KeyError):
+        compile_cues([{"values": {"nope": {"dimmer": 1.0}}}], rig())
@@ -0,0 +1,117 @@
+import pytest
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.effects import Effect, EffectEngine
+from dmx_controller.engine import Engine
+from dmx_controller.fixture_types import MovingHeadFixture, ParCanFixture
+
+
+def pars(buf, count, first=1, width=5):
+    return [
+        ParCanFixture(
+            id=f"par{i}",
+            name=f"Par {i}",
+            type="rgb",
+            channels={"dim": first + i * width, "red": first + i * width + 1},
+            buffer=buf,
+            meta={"channel_types": {"dim": "dimmer"}},
+        )
+        for i in range(count)
+    ]
+
+
+class CountingBuffer(UniverseBuffer):
+    def __init__(self, channels=512):
+        super().__init__(channels)
+        self.writes = 0
+
+    def set_range(self, start, data, step=1):
+        self.writes += 1
+        super().set_range(start, data, step)
+
+    def set_ranges(self, writes):
+        self.writes += 1
+        super().set_ranges(writes)
+
+
+def test_chase_lights_one_member_at_a_time():
+    buf = CountingBuffer(64)
+    effect = Effect(pars(buf, 4), waveform="chase", rate=1.0)
+    for step in range(4):
+        effect.render(step * 0.25)
+        dims = buf.snapshot()[0:20:5]
+        assert dims == bytes(255 if i == step else 0 for i in range(4))
+    # evenly patched fixtures: one strided write per frame
+    assert buf.writes == 4
+
+
+def test_sine_spread_and_phase():
+    buf = UniverseBuffer(64)
+    effect = Effect(pars(buf, 2), waveform="sine", spread=1.0, low=10, high=250)
+    effect.render(5.0)
+    assert buf.snapshot()[0:10:5] == bytes([10, 250])
+    effect.render(5.5)
+    assert buf.snapshot()[0:10:5] == bytes([250, 10])
+
+
+def test_square_saw_and_random_levels():
+    buf = UniverseBuffer(16)
+    square = Effect([1], waveform="square", buffer=buf, width=0.25)
+    saw = Effect([2], waveform="saw", buffer=buf, high=100)
+    rnd = Effect([3, 4, 5], waveform="random", buffer=buf, spread=0.0, seed=7)
+    for effect in (square, saw, rnd):
+        effect.render(0.0)
+    first = buf.snapshot()
+    assert first[0] == 255 and first[1] == 0
+    for effect in (square, saw, rnd):
+        effect.render(0.5)
+    half = buf.snapshot()
+    assert half[0] == 0 and 45 <= half[1] <= 55
+    assert half[2:5] == first[2:5]  # random holds for a cycle
+    rnd.render(1.0)
+    assert buf.snapshot()[2:5] != first[2:5]
+
+
+def test_sixteen_bit_attribute_writes_msb_and_lsb():
+    buf = UniverseBuffer(16)
+    head = MovingHeadFixture(
+        id="head", name="Head", type="moving_head", channels={"pan_msb": 1, "pan_lsb": 2}, buffer=buf
+    )
+    Effect([head], attribute="pan", waveform="saw", low=0x1234, high=0x1234).render(0.0)
+    assert buf.snapshot()[:2] == b"\x12\x34"
+
+
+def test_irregular_patch_and_validation():
+    buf = CountingBuffer(64)
+    fixtures = pars(buf, 3)
+    fixtures[1].channels["dim"] = 40
+    Effect(fixtures, waveform="square", spread=0.0).render(0.0)
+    assert [buf.get_channel(ch) for ch in (1, 40, 11)] == [255, 255, 255]
+    # irregular runs still land in one atomic write
+    assert buf.writes == 1
+    with pytest.raises(ValueError):
+        Effect([], waveform="sine")
+    with pytest.raises(ValueError):
+        Effect([1], waveform="triangle", buffer=buf)
+    with pytest.raises(ValueError):
+        Effect([1])
+
+
+def test_engine_tick_renders_effects_before_send():
+    buf = UniverseBuffer(16)
+    sent = []
+
+    class Sender:
+        def send(self, data, force=False):
+            sent.append(bytes(data))
+            return True
+
+    effects = EffectEngine()
+    effects.add(Effect([3], waveform="square", buffer=buf))
+    engine = Engine(Controller(sender=Sender(), buffer=buf))
+    engine.add_renderer(effects)
+    engine.add_renderer(lambda t: 1 / 0)
+    engine.run_once()
+    assert sent[0][2] == 255
+    assert engine.render_errors == 1
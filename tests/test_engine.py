@@ -46,7 +46,7 @@ def test_run_loop_max_iterations(monkeypatch):
     buf = UniverseBuffer(8)
     sender = DummySender()
     c = Controller(sender=sender, buffer=buf)
-    engine = Engine(c, fps=10.0)
+    engine = Engine(c, fps=10.0, spin=0.0)
 
     # Run internal loop for 3 iterations
     engine._run(max_iterations=3)
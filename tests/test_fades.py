@@ -0,0 +1,143 @@
+import pytest
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.engine import Engine
+from dmx_controller.fades import FadeEngine
+from dmx_controller.fixture_types import MovingHeadFixture, ParCanFixture
+
+
+class DummySender:
+    def send(self, data, force=False):
+        return True
+
+    def close(self):
+        pass
+
+
+def setup():
+    buf = UniverseBuffer(32)
+    c = Controller(sender=DummySender(), buffer=buf)
+    par = ParCanFixture(
+        id="par",
+        name="Par",
+        type="rgb",
+        channels={"dim": 1, "red": 2, "green": 3, "blue": 4, "strobe": 5},
+        buffer=buf,
+        meta={"channel_types": {"dim": "dimmer"}},
+        controller=c,
+    )
+    head = MovingHeadFixture(
+        id="head",
+        name="Head",
+        type="moving_head",
+        channels={"pan_msb": 10, "pan_lsb": 11, "tilt_msb": 12, "tilt_lsb": 13},
+        buffer=buf,
+        controller=c,
+    )
+    return buf, c, par, head
+
+
+def test_linear_fade_of_dimmer_and_color():
+    buf, c, par, _ = setup()
+    par.fade(dimmer=1.0, color=(100, 0, 200), duration=2.0, curve="linear")
+    c.fades.render(10.0)  # fade starts at the first render
+    assert buf.snapshot()[:4] == bytes(4)
+    c.fades.render(11.0)
+    assert buf.snapshot()[:4] == bytes([128, 50, 0, 100])
+    c.fades.render(12.5)
+    assert buf.snapshot()[:4] == bytes([255, 100, 0, 200])
+    assert c.fades.active == 0
+    assert par.current_values["red"] == 100
+
+
+def test_sixteen_bit_pan_at_full_resolution():
+    buf, c, _, head = setup()
+    head.fade(pan=1000, duration=1.0, curve="linear")
+    c.fades.render(0.0)
+    c.fades.render(0.5)
+    snap = buf.snapshot()
+    assert (snap[9] << 8) | snap[10] == 500
+    c.fades.render(1.0)
+    snap = buf.snapshot()
+    assert (snap[9] << 8) | snap[10] == 1000
+
+
+def test_s_curve_is_symmetric_and_eased():
+    buf, c, par, _ = setup()
+    par.fade(strobe=200, duration=1.0)
+    c.fades.render(0.0)
+    c.fades.render(0.1)
+    early = buf.get_channel(5)
+    c.fades.render(0.5)
+    assert early < 20 and buf.get_channel(5) == 100
+
+
+def test_new_fade_takes_over_from_current_level():
+    buf, c, par, _ = setup()
+    par.fade(dimmer=200, red=200, duration=2.0, curve="linear")
+    c.fades.render(0.0)
+    c.fades.render(1.0)
+    assert buf.get_channel(1) == 100
+    par.fade(dimmer=0, duration=1.0, curve="linear")
+    c.fades.render(1.0)
+    c.fades.render(1.5)
+    assert buf.get_channel(1) == 50
+    assert buf.get_channel(2) == 150  # the older fade continues on red
+    c.fades.render(2.0)
+    assert buf.get_channel(1) == 0 and buf.get_channel(2) == 200
+    c.fades.render(3.0)
+    assert buf.get_channel(1) == 0
+    assert c.fades.active == 0
+
+
+def test_many_fades_between_frames_share_one_batch():
+    buf = UniverseBuffer(512)
+    fades = FadeEngine()
+    for ch in range(1, 501):
+        fades.fade([(buf, (ch,), 255)], 1.0, "linear")
+    assert len(fades._pending) == 1
+    fades.render(0.0)
+    fades.render(1.0)
+    assert buf.snapshot()[:500] == bytes([255]) * 500
+
+
+def test_cancel_and_validation():
+    buf, c, par, _ = setup()
+    par.fade(dimmer=1.0, duration=1.0, curve="linear")
+    c.fades.render(0.0)
+    c.fades.render(0.5)
+    c.fades.cancel(buf, [1])
+    c.fades.render(1.0)
+    assert buf.get_channel(1) == 128
+    with pytest.raises(ValueError):
+        par.fade(dimmer=1.0, curve="bounce")
+    with pytest.raises(RuntimeError):
+        ParCanFixture(id="x", name="x", type="rgb", channels={"dim": 1}).fade(dimmer=1.0)
+
+
+def test_engine_tick_advances_controller_fades():
+    buf, c, par, _ = setup()
+    engine = Engine(c)
+    par.fade(dimmer=1.0, duration=0.0)
+    engine.run_once()
+    assert buf.get_channel(1) == 255
+
+
+def test_invalid_fade_changes_nothing():
+    buf, c, par, head = setup()
+    head.channels["color"] = 14
+    head.meta = {"value_mappings": {"color": {"40": "red"}}}
+    before = buf.snapshot()
+    for kwargs, exc in (
+        ({"color": "red", "pan": 70000}, ValueError),
+        ({"color": "red", "gobo": 3}, KeyError),
+        ({"color": "red", "pan": 100, "curve": "bounce"}, ValueError),
+    ):
+        with pytest.raises(exc):
+            head.fade(duration=1.0, **kwargs)
+    with pytest.raises(ValueError):
+        par.fade(dimmer=1.0, strobe=300)
+    assert buf.snapshot() == before
+    assert head.current_values == {} and par.current_values == {}
+    assert c.fades.active == 0
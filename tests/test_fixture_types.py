@@ -1,3 +1,6 @@
+import pytest
+
+from dmx_controller.buffer import UniverseBuffer
 from dmx_controller.fixture_types import ParCanFixture, MovingHeadFixture
 
 
@@ -22,3 +25,16 @@ def test_moving_head_pan_tilt_mapping():
     assert updates[4] == 0xFF
     assert f.current_values["pan"] == 0x1234
     assert f.current_values["tilt"] == 0x00FF
+
+
+def test_dimmer_setter_rejects_out_of_range_levels():
+    f = ParCanFixture(id="p1", name="Par", type="rgb", channels={"dim": 1}, buffer=UniverseBuffer(4))
+    f.dimmer = 0.5
+    f.dimmer = 200
+    assert f.current_values["dim"] == 200
+    with pytest.raises(ValueError):
+        f.dimmer = 300
+    with pytest.raises(ValueError):
+        f.dimmer = -1
+    assert f.current_values["dim"] == 200
+    assert f.buffer.get_channel(1) == 200
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from dmx_controller import Controller, FixtureGroup, UniverseBuffer
+from dmx_controller.fixture_types import ParCanFixture
+
+
+class DummySender:
+    def send(self, data, force=False):
+        return True
+
+
+class CountingBuffer(UniverseBuffer):
+    def __init__(self, channels=512):
+        super().__init__(channels)
+        self.writes = 0
+
+    def set_range(self, start, data, step=1):
+        self.writes += 1
+        super().set_range(start, data, step)
+
+    def set_ranges(self, writes):
+        self.writes += 1
+        super().set_ranges(writes)
+
+
+def make_controller(buffer=None):
+    c = Controller(sender=DummySender(), buffer=buffer or UniverseBuffer())
+    c.load_fixtures()
+    return c
+
+
+def pars(buffer, count, spacing=5):
+    return [
+        ParCanFixture(
+            id=f"par{i}",
+            name="Par",
+            type="rgb",
+            channels={"dim": 1 + spacing * i, "red": 2 + spacing * i, "green": 3 + spacing * i, "blue": 4 + spacing * i},
+            buffer=buffer,
+        )
+        for i in range(count)
+    ]
+
+
+def test_select_by_ids_and_type():
+    c = make_controller()
+    assert [f.id for f in c.group(type="rgb")] == ["parcan_l", "parcan_r", "parcan_pl", "parcan_pr"]
+    assert [f.id for f in c.group(ids=["parcan_r", "head_el150"])] == ["parcan_r", "head_el150"]
+    assert c.group(type="rgb") is c.group(type="rgb")
+    with pytest.raises(KeyError):
+        len(c.group(ids=["nope"]))
+
+
+def test_dimmer_writes_all_members_in_one_update():
+    buf = CountingBuffer()
+    group = FixtureGroup(pars(buf, 100))
+    group.dimmer = 0.5
+    assert buf.writes == 1
+    snap = buf.snapshot()
+    assert all(snap[5 * i] == 128 for i in range(100))
+    assert snap[1] == 0
+    assert group.dimmer[0] == pytest.approx(128 / 255)
+
+
+def test_color_writes_atomically_and_per_member_values():
+    buf = CountingBuffer()
+    group = FixtureGroup(pars(buf, 3))
+    group.color = "blue"
+    assert buf.writes == 1
+    assert buf.snapshot()[:15] == bytes([0, 0, 0, 255, 0] * 3)
+    group.color = ["red", (1, 2, 3), "white"]
+    assert buf.snapshot()[:15] == bytes([0, 255, 0, 0, 0, 0, 1, 2, 3, 0, 0, 255, 255, 255, 0])
+    assert group.members[1].current_values["blue"] == 3
+    group.dimmer = [0.0, 1.0, 10]
+    assert buf.snapshot()[0:15:5] == bytes([0, 255, 10])
+    with pytest.raises(ValueError):
+        group.dimmer = [0.1, 0.2]
+
+
+def test_mixed_group_pan_and_wheel_color():
+    c = make_controller()
+    group = c.group(ids=["head_el150", "parcan_l"])
+    group.pan = 0x1234
+    assert c.buffer.snapshot()[:2] == b"\x12\x34"
+    assert group.members[0].pan == 0x1234
+    group.color = "red"
+    assert c.buffer.get_channel(17) == 255
+    with pytest.raises(ValueError):
+        group.tilt = 70000
+    with pytest.raises(KeyError):
+        c.group(type="rgb").pan = 1
+
+
+def test_membership_refreshes_on_reload(tmp_path):
+    items = [
+        {"id": "a", "name": "A", "type": "rgb", "channels": {"dim": 1}, "tags": ["front"]},
+        {"id": "b", "name": "B", "type": "rgb", "channels": {"dim": 2}},
+    ]
+    path = tmp_path / "fixtures.json"
+    path.write_text(json.dumps(items))
+    c = Controller(sender=DummySender(), buffer=UniverseBuffer(), fixtures_path=path)
+    front = c.group(tag="front")
+    assert [f.id for f in front] == ["a"]
+    items[1]["tags"] = ["front"]
+    path.write_text(json.dumps(items))
+    c.load_fixtures(path, reload=True)
+    assert [f.id for f in front] == ["a", "b"]
+    front.dimmer = 1.0
+    assert c.buffer.snapshot()[:2] == b"\xff\xff"
+    assert c.fixtures[1].dimmer == 1.0
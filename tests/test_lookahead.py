@@ -0,0 +1,117 @@
+import gc
+import time
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.fixture_types import ParCanFixture
+from dmx_controller.lookahead import FrameRing, LookaheadEngine, gc_deferred
+
+
+class DummySender:
+    def __init__(self):
+        self.calls = []
+
+    def send(self, data, force=False):
+        self.calls.append(bytes(data))
+        return True
+
+    def close(self):
+        pass
+
+
+def render_index(index, t, out):
+    out[0] = index & 0xFF
+
+
+def make(**kw):
+    c = Controller(sender=DummySender(), buffer=UniverseBuffer(4))
+    return c, LookaheadEngine(c, render_index, fps=100, **kw)
+
+
+def test_ring_never_overwrites_unreleased_frames():
+    ring = FrameRing(2, 4)
+    for i in range(2):
+        ring.slot(ring.next_index)[0] = i
+        ring.commit()
+    assert not ring.wait_free(timeout=0)
+    index, frame = ring.peek()
+    assert (index, frame[0]) == (0, 0)
+    ring.release()
+    assert ring.wait_free(timeout=0)
+    assert ring.slot(ring.next_index) is not None and len(ring) == 1
+
+
+def test_ticks_send_rendered_frames_in_order_and_count_underruns():
+    c, engine = make(lookahead=3)
+    engine.fill()
+    for _ in range(4):
+        engine.run_once()
+    # the underrun resends the last transmitted frame, not the live buffer
+    assert [f[0] for f in c.sender.calls] == [0, 1, 2, 2]
+    stats = engine.stats()
+    assert stats["rendered"] == 3
+    assert stats["underruns"] == 1
+    assert stats["min_depth"] == 0
+
+
+def test_frames_go_through_the_controller_recorder():
+    class Recorder:
+        def __init__(self):
+            self.frames = []
+
+        def record(self, universe, data, sequence=0):
+            self.frames.append(bytes(data))
+
+    c, engine = make(lookahead=2)
+    c.recorder = Recorder()
+    engine.fill()
+    for _ in range(3):
+        engine.run_once()
+    assert [f[0] for f in c.recorder.frames] == [0, 1, 1]
+
+
+def test_underrun_before_any_frame_sends_nothing():
+    c, engine = make(lookahead=2)
+    c.buffer.set_channel(1, 99)
+    engine.run_once()
+    assert c.sender.calls == []
+    assert engine.underruns == 1
+
+
+def test_stale_frames_are_dropped_after_skipped_deadlines():
+    c, engine = make(lookahead=4)
+    engine.fill()
+    engine.scheduler.frames, engine.scheduler.skipped = 1, 2  # tick 0 ran, 1 and 2 skipped
+    engine.run_once()
+    assert c.sender.calls[-1][0] == 2
+    assert engine.dropped == 2
+
+
+def test_threaded_playback_keeps_queue_filled():
+    c, engine = make(lookahead=4)
+    engine.start()
+    time.sleep(0.2)
+    engine.stop()
+    sent = [f[0] for f in c.sender.calls[:-1]]
+    assert len(sent) >= 5
+    assert engine.render_errors == 0
+    assert c.sender.calls[-1] == bytes(4)  # blackout on stop
+
+
+def test_gc_deferred_restores_state():
+    assert gc.isenabled()
+    with gc_deferred():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+def test_controller_fades_render_into_lookahead_frames():
+    c, engine = make(lookahead=4)
+    par = ParCanFixture(id="par", name="Par", type="rgb", channels={"dim": 2}, buffer=c.buffer, controller=c)
+    par.fade(dimmer=1.0, duration=0.02, curve="linear")
+    engine.fill()
+    for _ in range(4):
+        engine.run_once()
+    # frame i renders the fade at t0 + i / fps; render() still owns channel 1
+    assert [f[:2] for f in c.sender.calls] == [bytes([0, 0]), bytes([1, 128]), bytes([2, 255]), bytes([3, 255])]
+    assert c.fades.active == 0
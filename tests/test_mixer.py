@@ -0,0 +1,109 @@
+import pytest
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.fixture_types import MovingHeadFixture, ParCanFixture
+from dmx_controller.mixer import HTP, LTP, LayerMixer
+
+
+def fixtures():
+    par = ParCanFixture(
+        id="par",
+        name="Par",
+        type="rgb",
+        channels={"dim": 1, "red": 2},
+        meta={"channel_types": {"dim": "dimmer", "red": "color"}},
+    )
+    head = MovingHeadFixture(
+        id="head", name="Head", type="moving_head", channels={"pan_msb": 5, "pan_lsb": 6, "dim": 7}
+    )
+    return [par, head]
+
+
+def make():
+    out = UniverseBuffer(8)
+    return out, LayerMixer(out, fixtures())
+
+
+def test_modes_from_channel_types():
+    _, mixer = make()
+    assert [mixer.mode(ch) for ch in (1, 2, 5, 7)] == [HTP, LTP, LTP, HTP]
+
+
+def test_htp_takes_highest_and_ltp_takes_top_priority():
+    out, mixer = make()
+    base = mixer.add_layer("base")
+    desk = mixer.add_layer("desk", priority=10)
+    base.set_channels([(1, 200), (2, 10), (5, 40)])
+    desk.set_channels([(1, 100), (2, 250)])
+    mixer.composite()
+    assert out.snapshot()[:5] == bytes([200, 250, 0, 0, 40])
+    desk.set_channel(1, 255)
+    mixer.composite()
+    assert out.get_channel(1) == 255
+
+
+def test_opacity_scales_htp_and_crossfades_ltp():
+    out, mixer = make()
+    base = mixer.add_layer("base")
+    top = mixer.add_layer("top", priority=1, opacity=0.5)
+    base.set_channels([(1, 100), (2, 0)])
+    top.set_channels([(1, 255), (2, 200)])
+    mixer.composite()
+    assert out.get_channel(1) == 128 and out.get_channel(2) == 100
+    top.opacity = 0.0
+    mixer.composite()
+    assert out.get_channel(1) == 100 and out.get_channel(2) == 0
+
+
+def test_override_layer_can_pull_intensity_down_and_release():
+    out, mixer = make()
+    base = mixer.add_layer("base")
+    base.set_channel(1, 255)
+    desk = mixer.add_layer("desk", priority=5, override=True)
+    desk.set_channel(1, 0)
+    mixer.composite()
+    assert out.get_channel(1) == 0
+    desk.release([1])
+    mixer.composite()
+    assert out.get_channel(1) == 255
+    desk.enabled = False
+    desk.set_channel(1, 0)
+    mixer.composite()
+    assert out.get_channel(1) == 255
+
+
+def test_only_changed_layers_are_recomposited():
+    out, mixer = make()
+    layers = [mixer.add_layer(f"l{i}", priority=i) for i in range(4)]
+    for i, layer in enumerate(layers):
+        layer.set_channel(i + 1, 10 * (i + 1))
+    applied = []
+    real = mixer._apply
+    mixer._apply = lambda cur, layer: applied.append(layer.name) or real(cur, layer)
+    assert mixer.composite()
+    assert applied == ["l0", "l1", "l2", "l3"]
+    applied.clear()
+    assert not mixer.composite()
+    assert applied == []
+    layers[2].set_channel(3, 99)
+    assert mixer.composite()
+    assert applied == ["l2", "l3"]
+    assert out.snapshot()[:4] == bytes([10, 20, 99, 40])
+
+
+def test_external_output_write_is_repaired_without_recompositing():
+    out, mixer = make()
+    mixer.add_layer("base").set_channel(2, 77)
+    mixer.composite()
+    out.zero_all()
+    assert mixer.composite()
+    assert out.get_channel(2) == 77
+    with pytest.raises(ValueError):
+        mixer.add_layer("base")
+
+
+def test_layer_set_ranges_marks_mask():
+    out, mixer = make()
+    layer = mixer.add_layer("fx")
+    layer.set_ranges([(1, b"\x10", 1), (5, b"\x20\x30", 1)])
+    assert layer.mask[:6] == b"\xff\x00\x00\x00\xff\xff"
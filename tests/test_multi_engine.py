@@ -0,0 +1,70 @@
+import pytest
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.engine import MultiEngine
+
+
+class DummySender:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.syncs = 0
+        self.fail = fail
+
+    def send(self, data, force=False):
+        if self.fail:
+            raise OSError("node unreachable")
+        self.calls.append((bytes(data), force))
+        return True
+
+    def send_sync(self):
+        self.syncs += 1
+
+
+def make_controller(sender=None):
+    return Controller(sender=sender or DummySender(), buffer=UniverseBuffer(8))
+
+
+def test_divisors_set_per_controller_rate():
+    fast, slow = make_controller(), make_controller()
+    engine = MultiEngine(fps=40)
+    engine.add(fast)
+    engine.add(slow, fps=10)
+    for _ in range(8):
+        engine.run_once()
+    assert len(fast.sender.calls) == 8
+    assert len(slow.sender.calls) == 2
+    assert [s["divisor"] for s in engine.status()] == [1, 4]
+
+
+def test_rate_must_divide_master():
+    engine = MultiEngine(fps=40)
+    with pytest.raises(ValueError):
+        engine.add(make_controller(), fps=30)
+    with pytest.raises(ValueError):
+        engine.add(make_controller(), divisor=0)
+
+
+def test_failing_controller_does_not_block_others():
+    bad, good = make_controller(DummySender(fail=True)), make_controller()
+    engine = MultiEngine([bad, good], fps=40)
+    engine.run_once()
+    engine.run_once()
+    assert len(good.sender.calls) == 2
+    status = engine.status()
+    assert status[0]["errors"] == 2 and "node unreachable" in status[0]["last_error"]
+    assert status[1] == {"divisor": 1, "frames": 2, "errors": 0, "last_error": None}
+
+
+def test_sync_once_per_sender_and_blackout_on_stop():
+    shared = DummySender()
+    a, b = make_controller(shared), make_controller(shared)
+    a.buffer.set_channel(1, 50)
+    engine = MultiEngine([a, b], fps=40, sync=True)
+    engine.run_once()
+    assert len(shared.calls) == 2 and shared.syncs == 1
+    engine.remove(b)
+    engine.stop()
+    assert engine.controllers == [a]
+    assert shared.calls[-1] == (bytes(8), True)
+    assert b.buffer.snapshot() == bytes(8)
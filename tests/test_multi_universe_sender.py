@@ -0,0 +1,80 @@
+import socket
+
+from dmx_controller.artnet import MultiUniverseSender, _build_artdmx_packet
+
+
+class FakeSocket:
+    def __init__(self, fail_addrs=()):
+        self.sent = []
+        self.fail_addrs = set(fail_addrs)
+
+    def setsockopt(self, *a, **k):
+        pass
+
+    def settimeout(self, *a, **k):
+        pass
+
+    def sendto(self, packet, addr):
+        if addr in self.fail_addrs:
+            raise OSError("unreachable")
+        self.sent.append((bytes(packet), addr))
+
+    def close(self):
+        pass
+
+
+def test_burst_uses_one_socket_and_per_universe_sequences(monkeypatch):
+    created = []
+
+    def factory(*a, **k):
+        created.append(FakeSocket())
+        return created[-1]
+
+    monkeypatch.setattr(socket, "socket", factory)
+    sender = MultiUniverseSender({0: "127.0.0.1", 1: ("127.0.0.2", 6455)}, fps=1000)
+
+    assert sender.send({0: bytes([1] * 512), 1: bytes([2] * 512)}, force=True) == 2
+    assert sender.send({1: bytes([3] * 512)}, force=True) == 1
+
+    assert len(created) == 1
+    sent = created[0].sent
+    assert sent[0] == (_build_artdmx_packet(bytes([1] * 512), 0, sequence=0), ("127.0.0.1", 6454))
+    assert sent[1] == (_build_artdmx_packet(bytes([2] * 512), 1, sequence=0), ("127.0.0.2", 6455))
+    assert sent[2] == (_build_artdmx_packet(bytes([3] * 512), 1, sequence=1), ("127.0.0.2", 6455))
+    assert sender.sequence(0) == 1
+    assert sender.sequence(1) == 2
+
+
+def test_failing_universe_does_not_block_others(monkeypatch):
+    fake = FakeSocket(fail_addrs={("127.0.0.2", 6454)})
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    sender = MultiUniverseSender({0: "127.0.0.2", 1: "127.0.0.1"}, fps=1000, retries=1)
+
+    try:
+        sender.send({0: bytes(512), 1: bytes(512)}, force=True)
+    except OSError:
+        pass
+    else:
+        raise AssertionError("expected the failing universe to raise")
+
+    assert [addr for _p, addr in fake.sent] == [("127.0.0.1", 6454)]
+    assert sender.sequence(0) == 0
+    assert sender.sequence(1) == 1
+
+
+def test_unknown_universe_rejected_before_anything_is_sent(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    sender = MultiUniverseSender({0: "127.0.0.1"}, fps=1000, sync=True)
+
+    try:
+        sender.send({0: bytes(512), 7: bytes(512)}, force=True)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("expected KeyError for an unregistered universe")
+
+    assert fake.sent == []
+    assert sender.sequence(0) == 0
+    assert sender.frames_sent == 0
@@ -0,0 +1,112 @@
+import pytest
+
+from dmx_controller import Controller, OutputStage, UniverseBuffer
+from dmx_controller.fixture_types import ParCanFixture
+
+
+class DummySender:
+    def __init__(self):
+        self.frames = []
+
+    def send(self, data, force=False):
+        self.frames.append(bytes(data))
+        return True
+
+
+def par(ch):
+    return ParCanFixture(
+        id=f"par{ch}", name="Par", type="rgb", channels={"dim": ch}, meta={"channel_types": {"dim": "dimmer"}}
+    )
+
+
+def make_controller():
+    c = Controller(sender=DummySender(), buffer=UniverseBuffer())
+    c.load_fixtures()
+    return c
+
+
+def test_untouched_without_levels_or_curves():
+    c = make_controller()
+    stage = OutputStage(c.fixtures)
+    frame = bytes(range(256)) * 2
+    assert bytes(stage.process(frame)) == frame
+
+
+def test_grand_master_scales_only_intensity_channels():
+    c = make_controller()
+    c.output_stage = stage = OutputStage(c.fixtures)
+    c.buffer.set_range(1, b"\xff" * 40)
+    stage.grand_master = 0.5
+    c.send_frame()
+    frame = c.sender.frames[-1]
+    for ch in (6, 16, 22, 28, 35):
+        assert frame[ch - 1] == 128
+    assert frame[16] == 255  # parcan_l red
+    assert frame[0] == 255  # pan
+    # the buffer keeps programmed levels
+    assert c.buffer.get_channel(16) == 255
+
+
+def test_submasters_multiply_with_grand_master():
+    c = make_controller()
+    f = {x.id: x for x in c.fixtures}
+    stage = OutputStage(c.fixtures)
+    stage.add_submaster("left", [f["parcan_l"], f["parcan_pl"]], level=0.5)
+    stage.add_submaster("pl", f["parcan_pl"])
+    stage.set_submaster("pl", 0.5)
+    stage.grand_master = 0.5
+    out = stage.process(b"\xff" * 512)
+    assert out[15] == 64  # 0.5 * 0.5
+    assert out[27] == 32  # 0.5 * 0.5 * 0.5
+    assert out[21] == 128
+    assert stage.submaster("pl") == 0.5
+    stage.remove_submaster("left")
+    assert stage.process(b"\xff" * 512)[15] == 128
+
+
+def test_curves_per_fixture():
+    c = make_controller()
+    f = {x.id: x for x in c.fixtures}
+    stage = OutputStage(c.fixtures)
+    stage.set_curve(f["parcan_l"], "square")
+    stage.set_curve(f["parcan_r"], "led")
+    stage.set_curve([f["parcan_pl"]], "s")
+    frame = bytearray(512)
+    for ch in (16, 22, 28, 35):
+        frame[ch - 1] = 128
+    out = stage.process(frame)
+    assert out[15] == round(255 * (128 / 255) ** 2)
+    assert out[21] == round(255 * (128 / 255) ** 2.2)
+    assert out[27] == 128  # s curve midpoint
+    assert out[34] == 128  # linear
+    for curve_out in (out[15], out[21]):
+        assert curve_out < 128
+    with pytest.raises(ValueError):
+        stage.set_curve(f["parcan_l"], "cubic")
+
+
+def test_tables_cached_and_rebuilt_only_on_change():
+    stage = OutputStage([par(1)])
+    stage.grand_master = 0.5
+    stage.process(b"\xff")
+    runs = stage._runs
+    stage.grand_master = 0.5
+    stage.process(b"\xff")
+    assert stage._runs is runs
+    stage.grand_master = 0.25
+    assert stage.process(b"\xff")[0] == 64
+    assert stage._runs is not runs
+    # returning to a previous level reuses its cached table
+    stage.grand_master = 0.5
+    stage.process(b"\xff")
+    assert stage._runs[0][3] is runs[0][3]
+
+
+def test_strided_channels_share_one_run():
+    stage = OutputStage([par(1 + 5 * i) for i in range(10)])
+    stage.grand_master = 0.0
+    assert len(stage.process(b"\xff" * 50)) == 50
+    assert len(stage._runs) == 1
+    out = stage.process(b"\xff" * 50)
+    assert all(out[5 * i] == 0 for i in range(10))
+    assert bytes(out).count(0) == 10
@@ -0,0 +1,68 @@
+import os
+import time
+
+import pytest
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.engine import Engine
+from dmx_controller.realtime import RealtimeConfig
+
+
+class DummySender:
+    def send(self, data, force=False):
+        return True
+
+    def close(self):
+        pass
+
+
+def test_denied_policy_falls_back_and_reports(monkeypatch):
+    def deny(*args):
+        raise PermissionError(1, "Operation not permitted")
+
+    monkeypatch.setattr(os, "sched_setscheduler", deny, raising=False)
+    applied = []
+    monkeypatch.setattr(os, "sched_setaffinity", lambda pid, cpus: applied.append(cpus), raising=False)
+    config = RealtimeConfig(policy="rr", cpus=[0])
+    c = Controller(sender=DummySender(), buffer=UniverseBuffer(4), fps=100)
+    with pytest.warns(RuntimeWarning, match="policy"):
+        c.start(realtime=config)
+    try:
+        time.sleep(0.05)
+        assert c._tx_thread.is_alive()
+    finally:
+        c.stop()
+    assert config.status == {"affinity": "ok", "policy": "denied: Operation not permitted"}
+    assert not config.ok
+    assert applied == [{0}]
+
+
+def test_unsupported_platform_is_reported(monkeypatch):
+    monkeypatch.delattr(os, "sched_setscheduler", raising=False)
+    config = RealtimeConfig(policy="fifo")
+    with pytest.warns(RuntimeWarning):
+        config.apply()
+    assert config.status == {"policy": "unsupported"}
+
+
+def test_engine_start_applies_in_tick_thread(monkeypatch):
+    calls = []
+
+    def record(pid, policy, param):
+        import threading
+
+        calls.append((threading.current_thread().name, policy, param.sched_priority))
+
+    monkeypatch.setattr(os, "sched_setscheduler", record, raising=False)
+    engine = Engine(Controller(sender=DummySender(), buffer=UniverseBuffer(4)), fps=100)
+    config = RealtimeConfig(policy="fifo", priority=70)
+    engine.start(realtime=config)
+    engine.stop()
+    assert config.ok
+    assert len(calls) == 1 and calls[0][0] != "MainThread" and calls[0][2] == 70
+
+
+def test_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        RealtimeConfig(policy="deadline")
@@ -0,0 +1,103 @@
+import socket
+import time
+
+from dmx_controller.artnet import _build_artdmx_packet
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.receiver import ArtNetReceiver
+
+
+def _sender(ip="127.0.0.1"):
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.bind((ip, 0))
+    return s
+
+
+def test_htp_merge_of_two_sources_over_loopback():
+    buf = UniverseBuffer()
+    rx = ArtNetReceiver({1: buf}, host="127.0.0.1", port=0)
+    a, b = _sender(), _sender()
+    try:
+        a.sendto(_build_artdmx_packet(bytes([10, 200, 0, 5]), universe=1, length=4), rx.address)
+        b.sendto(_build_artdmx_packet(bytes([50, 100, 7, 5]), universe=1, length=4), rx.address)
+        # other universes and non-Art-Net traffic are ignored
+        a.sendto(_build_artdmx_packet(bytes([99] * 4), universe=2, length=4), rx.address)
+        a.sendto(b"hello", rx.address)
+        handled = 0
+        while handled < 4:
+            handled += rx.poll(timeout=1.0)
+    finally:
+        a.close()
+        b.close()
+        rx.close()
+
+    assert buf.snapshot()[:5] == bytes([50, 200, 7, 5, 0])
+    assert rx.packets_received == 2
+    assert rx.packets_ignored == 2
+
+
+def test_ltp_source_overrides_and_sources_time_out():
+    buf = UniverseBuffer()
+    rx = ArtNetReceiver(buf, host="127.0.0.1", port=0, source_modes={"10.0.0.9": "ltp"}, source_timeout=60.0)
+    try:
+        rx.handle_packet(memoryview(_build_artdmx_packet(bytes([200, 200]), length=2)), ("10.0.0.1", 6454))
+        rx.handle_packet(memoryview(_build_artdmx_packet(bytes([1, 2]), length=2)), ("10.0.0.9", 6454))
+        assert buf.snapshot()[:2] == bytes([1, 2])
+        assert rx.sources()["10.0.0.9:6454"]["mode"] == "ltp"
+
+        # the LTP source goes silent: after the timeout only the HTP source remains
+        rx.source_timeout = 0.0
+        rx.handle_packet(memoryview(_build_artdmx_packet(bytes([30, 40]), length=2)), ("10.0.0.1", 6454))
+        assert buf.snapshot()[:2] == bytes([30, 40])
+        assert list(rx.sources()) == ["10.0.0.1:6454"]
+    finally:
+        rx.close()
+
+
+def test_expired_longer_source_is_cleared():
+    buf = UniverseBuffer()
+    rx = ArtNetReceiver(buf, host="127.0.0.1", port=0, source_timeout=60.0)
+    try:
+        rx.handle_packet(memoryview(_build_artdmx_packet(bytes([10, 20]), length=2)), ("10.0.0.1", 6454))
+        rx.handle_packet(memoryview(_build_artdmx_packet(bytes([1, 2, 255, 255]), length=4)), ("10.0.0.2", 6454))
+        assert buf.snapshot()[:4] == bytes([10, 20, 255, 255])
+
+        # B goes silent past the timeout: its extra channels drop back to zero
+        rx._states[0].sources[("10.0.0.2", 6454)].last_seen -= 120.0
+        rx.expire()
+        assert buf.snapshot()[:4] == bytes([10, 20, 0, 0])
+        assert list(rx.sources()) == ["10.0.0.1:6454"]
+
+        # every source gone: nothing stays latched
+        rx.source_timeout = 0.0
+        rx._states[0].sources[("10.0.0.1", 6454)].last_seen = 0.0
+        rx.expire()
+        assert buf.snapshot()[:4] == bytes(4)
+        assert rx.sources() == {}
+    finally:
+        rx.close()
+
+
+def test_silent_source_expires_while_another_universe_streams():
+    a, b = UniverseBuffer(), UniverseBuffer()
+    rx = ArtNetReceiver({0: a, 1: b}, host="127.0.0.1", port=0, source_timeout=0.3)
+    busy, quiet = _sender(), _sender()
+    rx.start()
+    try:
+        quiet.sendto(_build_artdmx_packet(bytes([255] * 4), universe=1, length=4), rx.address)
+        deadline = time.monotonic() + 1.5
+        cleared = None
+        while time.monotonic() < deadline:
+            busy.sendto(_build_artdmx_packet(bytes([7] * 4), universe=0, length=4), rx.address)
+            time.sleep(0.01)
+            if b.snapshot()[:4] == bytes([255] * 4) and cleared is None:
+                cleared = False
+            elif cleared is False and b.snapshot()[:4] == bytes(4):
+                cleared = time.monotonic()
+                break
+    finally:
+        rx.stop()
+        busy.close()
+        quiet.close()
+
+    assert cleared, "universe 1 stayed latched while universe 0 kept streaming"
+    assert a.snapshot()[:4] == bytes([7] * 4)
@@ -0,0 +1,90 @@
+import os
+import socket
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.recorder import FrameRecorder, FrameReplayer
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def setsockopt(self, *a, **k):
+        pass
+
+    def sendto(self, packet, addr):
+        self.sent.append(bytes(packet))
+
+    def close(self):
+        pass
+
+
+class ListSender:
+    def __init__(self):
+        self.calls = []
+
+    def send(self, data, force=False):
+        self.calls.append((bytes(data), force))
+        return True
+
+
+def _frames(n):
+    frames = []
+    for i in range(n):
+        f = bytearray(512)
+        f[0] = i & 0xFF
+        f[100] = 7
+        frames.append(bytes(f))
+    return frames
+
+
+def test_round_trip_is_delta_encoded(tmp_path):
+    path = tmp_path / "show.dmxrec"
+    frames = _frames(40)
+    with FrameRecorder(path, keyframe_interval=16) as rec:
+        for i, f in enumerate(frames):
+            rec.record(1, f, sequence=i, timestamp=1000.0 + i * 0.025)
+        rec.record(1, frames[-1], sequence=40, timestamp=1001.0)
+
+    # far smaller than 41 raw frames
+    assert os.path.getsize(path) < 41 * 512 // 4
+
+    with FrameReplayer(path) as rep:
+        decoded = list(rep.frames())
+    assert [p for _t, _u, _s, p in decoded] == frames + [frames[-1]]
+    assert [s for _t, _u, s, _p in decoded][:3] == [0, 1, 2]
+    assert all(u == 1 for _t, u, _s, _p in decoded)
+
+
+def test_seek_and_play_through_sender(tmp_path):
+    path = tmp_path / "show.dmxrec"
+    frames = _frames(40)
+    with FrameRecorder(path, keyframe_interval=8) as rec:
+        for i, f in enumerate(frames):
+            rec.record(0, f, timestamp=i * 0.001)
+
+    sender = ListSender()
+    with FrameReplayer(path, sender) as rep:
+        rep.seek(0.0305)
+        assert rep.position > 0.030
+        assert rep.play(speed=4.0) == 9
+    assert [d for d, _f in sender.calls] == frames[31:]
+    assert all(force for _d, force in sender.calls)
+
+
+def test_controller_records_transmitted_frames(tmp_path, monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    path = tmp_path / "cap.dmxrec"
+    rec = FrameRecorder(path)
+    c = Controller(fps=1000, universe=3, buffer=UniverseBuffer(), recorder=rec)
+    c.buffer.set_channel(1, 9)
+    c.send_frame(force=True)
+    c.send_frame(force=True)
+    rec.close()
+
+    with FrameReplayer(path) as rep:
+        decoded = list(rep.frames())
+    assert [(u, s) for _t, u, s, _p in decoded] == [(3, 0), (3, 1)]
+    assert decoded[0][3] == fake.sent[0][18:]
@@ -0,0 +1,129 @@
+import socket
+import uuid
+
+from dmx_controller.buffer import UniverseBuffer
+from dmx_controller.controller import Controller
+from dmx_controller.sacn import E131Sender, _build_e131_sync_packet, multicast_address
+
+CID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+        self.opts = []
+
+    def setsockopt(self, *a):
+        self.opts.append(a)
+
+    def sendto(self, packet, addr):
+        self.sent.append((bytes(packet), addr))
+
+    def close(self):
+        pass
+
+
+def test_e131_data_packet_layout(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    sender = E131Sender(universe=258, cid=CID, priority=150, source_name="desk", fps=1000)
+    sender.send(bytes([1, 2, 3]), force=True)
+    sender.send(bytes([4]), force=True)
+
+    pkt, addr = fake.sent[0]
+    assert addr == ("239.255.1.2", 5568)
+    assert len(pkt) == 638
+    assert pkt[4:16] == b"ASC-E1.17\x00\x00\x00"
+    assert pkt[16:18] == (0x7000 | 622).to_bytes(2, "big")
+    assert pkt[22:38] == CID.bytes
+    assert pkt[38:40] == (0x7000 | 600).to_bytes(2, "big")
+    assert pkt[44:48] == b"desk"
+    assert pkt[108] == 150
+    assert pkt[111] == 0
+    assert pkt[113:115] == (258).to_bytes(2, "big")
+    assert pkt[115:117] == (0x7000 | 523).to_bytes(2, "big")
+    assert pkt[123:125] == (513).to_bytes(2, "big")
+    assert pkt[125] == 0
+    assert pkt[126:130] == bytes([1, 2, 3, 0])
+    # sequence and payload patched in place on the next frame
+    assert fake.sent[1][0][111] == 1
+    assert fake.sent[1][0][126:128] == bytes([4, 0])
+
+
+def test_unicast_variable_length_and_termination_on_stop(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    sender = E131Sender(host="10.0.0.5", universe=1, fps=1000, length=40)
+    c = Controller(sender=sender, buffer=UniverseBuffer())
+    c.buffer.set_channel(40, 9)
+    c.send_frame(force=True)
+    c.stop()
+
+    pkt, addr = fake.sent[0]
+    assert addr == ("10.0.0.5", 5568)
+    assert len(pkt) == 126 + 40
+    assert pkt[-1] == 9
+    terminated = fake.sent[1:]
+    assert len(terminated) == 3
+    assert all(p[112] & 0x40 for p, _a in terminated)
+    assert not pkt[112] & 0x40
+
+
+def test_sync_packet(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    sender = E131Sender(universe=1, cid=CID, sync_universe=7, fps=1000)
+    sender.send(bytes(512), force=True)
+    sender.send_sync()
+    data, _ = fake.sent[0]
+    assert data[109:111] == (7).to_bytes(2, "big")
+    assert fake.sent[1] == (_build_e131_sync_packet(CID.bytes, 7, 0), (multicast_address(7), 5568))
+    assert len(fake.sent[1][0]) == 49
+
+
+def test_universe_range_validated():
+    for bad in (0, 64000):
+        try:
+            E131Sender(universe=bad)
+        except ValueError:
+            continue
+        raise AssertionError("expected ValueError")
+
+
+class ConnectingSocket(FakeSocket):
+    """Socket that behaves like BSD: sendto() on a connected socket fails."""
+
+    def __init__(self):
+        super().__init__()
+        self.peer = None
+
+    def settimeout(self, *a):
+        pass
+
+    def connect(self, addr):
+        self.peer = addr
+
+    def send(self, packet):
+        self.sent.append((bytes(packet), self.peer))
+
+    def sendto(self, packet, addr):
+        if self.peer is not None:
+            raise OSError(56, "Socket is already connected")
+        super().sendto(packet, addr)
+
+
+def test_sync_packet_uses_unconnected_socket(monkeypatch):
+    created = []
+
+    def factory(*a, **k):
+        created.append(ConnectingSocket())
+        return created[-1]
+
+    monkeypatch.setattr(socket, "socket", factory)
+    sender = E131Sender(universe=1, cid=CID, sync_universe=7, fps=1000)
+    sender.send(bytes(512), force=True)
+    sender.send_sync()
+    sender.send_sync()
+    assert created[0].sent[0][1] == (multicast_address(1), 5568)
+    assert len(created) == 2
+    assert [addr for _p, addr in created[1].sent] == [(multicast_address(7), 5568)] * 2
@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+
+from dmx_controller.controller import Controller
+from dmx_controller.scheduler import CATCH_UP, FrameScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.t
+
+    def sleep(self, s):
+        self.slept.append(s)
+        self.t += s
+
+
+def make(fps=4.0, **kw):
+    clock = FakeClock()
+    return clock, FrameScheduler(fps, spin=0.0, clock=clock, sleep=clock.sleep, **kw)
+
+
+def test_deadlines_are_absolute_and_do_not_drift():
+    clock, sched = make()
+    starts = []
+
+    def tick():
+        starts.append(clock.t)
+        clock.t += 0.125  # tick work eats half the period
+
+    sched.run(tick, lambda: True, max_iterations=4)
+    assert starts == [0.0, 0.25, 0.5, 0.75]
+    assert clock.slept == [0.125, 0.125, 0.125]
+    assert sched.overruns == 0
+    assert sched.achieved_fps == pytest.approx(4.0)
+
+
+def test_skip_drops_missed_deadlines():
+    clock, sched = make()
+    starts = []
+
+    def tick():
+        starts.append(clock.t)
+        if len(starts) == 2:
+            clock.t += 0.625  # late for 0.5 and 0.75: 0.5 is dropped
+
+    sched.run(tick, lambda: True, max_iterations=4)
+    assert starts == [0.0, 0.25, 0.875, 1.0]
+    assert sched.overruns == 1
+    assert sched.skipped == 1
+
+
+def test_catch_up_runs_late_ticks_back_to_back():
+    clock, sched = make(overrun="catch_up")
+    starts = []
+
+    def tick():
+        starts.append(clock.t)
+        if len(starts) == 2:
+            clock.t += 0.625
+
+    sched.run(tick, lambda: True, max_iterations=5)
+    assert starts == [0.0, 0.25, 0.875, 0.875, 1.0]
+    assert sched.overruns == 2
+    assert sched.skipped == 0
+
+
+def test_spin_window_finishes_with_busy_wait():
+    clock = FakeClock()
+    ticks = iter([0.0, 0.0, 0.2, 0.23, 0.26, 0.26])
+
+    def fake_clock():
+        clock.t = next(ticks, 0.3)
+        return clock.t
+
+    sched = FrameScheduler(4.0, spin=0.05, clock=fake_clock, sleep=clock.slept.append)
+    assert sched.wait()
+    assert sched.wait()
+    assert clock.slept == [pytest.approx(0.2)]
+    stats = sched.stats()
+    assert stats["frames"] == 2
+    assert stats["jitter_max"] == pytest.approx(0.01)
+
+
+def test_stop_event_interrupts_wait():
+    stop = threading.Event()
+    sched = FrameScheduler(0.5, stop_event=stop)
+    assert sched.wait()
+    stop.set()
+    assert sched.wait() is False
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        FrameScheduler(0)
+    with pytest.raises(ValueError):
+        FrameScheduler(10, overrun="drop")
+
+
+def test_controller_passes_spin_and_overrun_to_its_scheduler():
+    c = Controller(sender=object(), fps=40, spin=0.0005, overrun=CATCH_UP)
+    assert c.scheduler.fps == 40
+    assert c.scheduler.spin == 0.0005
+    assert c.scheduler.overrun == CATCH_UP
+    with pytest.raises(ValueError):
+        Controller(sender=object(), overrun="drop")
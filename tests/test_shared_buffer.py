@@ -0,0 +1,93 @@
+import multiprocessing
+
+from dmx_controller.controller import Controller
+from dmx_controller.shared import SharedUniverseBuffer
+
+
+def _worker(name, rounds):
+    buf = SharedUniverseBuffer.attach(name)
+    try:
+        for i in range(rounds):
+            v = i & 0xFF
+            buf.set_range(1, bytes([v]) * buf.channels)
+    finally:
+        buf.close()
+
+
+def test_attach_shares_channels_and_generation():
+    with SharedUniverseBuffer(16) as owner:
+        other = SharedUniverseBuffer.attach(owner.name)
+        try:
+            assert other.channels == 16
+            other.set_channel(3, 200)
+            assert owner.get_channel(3) == 200
+            assert owner.generation == other.generation == 1
+            assert owner.snapshot_if_changed(0) == (1, owner.snapshot())
+            assert owner.snapshot_if_changed(1) is None
+        finally:
+            other.close()
+
+
+def test_snapshots_from_another_process_are_consistent():
+    ctx = multiprocessing.get_context("spawn")
+    with SharedUniverseBuffer(64) as buf:
+        proc = ctx.Process(target=_worker, args=(buf.name, 3000))
+        proc.start()
+        try:
+            while proc.is_alive():
+                assert len(set(buf.snapshot())) == 1
+        finally:
+            proc.join(timeout=30)
+        assert proc.exitcode == 0
+        assert buf.generation == 3000
+        assert buf.snapshot() == bytes([2999 & 0xFF]) * 64
+
+
+def test_close_unlinks_owned_block():
+    buf = SharedUniverseBuffer(8)
+    name = buf.name
+    buf.close()
+    buf.close()
+    try:
+        SharedUniverseBuffer.attach(name)
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError("block still exists after owner close")
+
+
+class DummySender:
+    def send(self, data, force=False):
+        return True
+
+    def close(self):
+        pass
+
+
+def test_controller_stop_leaves_a_caller_owned_buffer_open():
+    buf = SharedUniverseBuffer(8)
+    c = Controller(sender=DummySender(), buffer=buf)
+    c.stop()
+    try:
+        peer = SharedUniverseBuffer.attach(buf.name)
+        c.buffer.set_channel(1, 9)
+        assert peer.get_channel(1) == 9
+        assert c.send_frame(force=True)
+        peer.close()
+    finally:
+        buf.close()
+
+
+def test_controller_stop_unlinks_an_owned_shared_buffer():
+    buf = SharedUniverseBuffer(8)
+    name = buf.name
+    c = Controller(sender=DummySender(), buffer=buf, own_buffer=True)
+    c.buffer.set_channel(1, 255)
+    c.blackout()
+    c.stop()
+    try:
+        SharedUniverseBuffer.attach(name)
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError("block still exists after Controller.stop()")
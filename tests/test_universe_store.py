@@ -0,0 +1,73 @@
+import socket
+
+from dmx_controller.artnet import MultiUniverseSender
+from dmx_controller.controller import Controller
+from dmx_controller.store import UniverseStore
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def setsockopt(self, *a, **k):
+        pass
+
+    def sendto(self, packet, addr):
+        self.sent.append(bytes(packet))
+
+    def close(self):
+        pass
+
+
+def test_views_share_one_contiguous_buffer():
+    store = UniverseStore([3, 4, 7], channels=8)
+    store[4].set_channel(1, 10)
+    store.set_channel(7, 8, 20)
+    assert store.get_channel(4, 1) == 10
+    snap = store.snapshot()
+    assert len(snap) == 24
+    assert snap[8] == 10
+    assert snap[23] == 20
+    assert store[7].snapshot()[-1] == 20
+    assert store[3].snapshot() == bytes(8)
+
+
+def test_set_range_spans_universe_boundaries():
+    store = UniverseStore(3, channels=8)
+    gens = {u: store[u].generation for u in store}
+    store.set_range(0, 7, bytes(range(1, 11)))
+    snap = store.snapshot()
+    assert snap[6:16] == bytes(range(1, 11))
+    assert store[0].take_dirty() == (7, 8)
+    assert store[1].take_dirty() == (1, 8)
+    assert store[2].snapshot_if_changed(gens[2]) is None
+    try:
+        store.set_range(2, 8, b"\x01\x02")
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("expected IndexError")
+
+
+def test_view_drives_controller_and_store_feeds_multi_sender(monkeypatch):
+    fake = FakeSocket()
+    monkeypatch.setattr(socket, "socket", lambda *a, **k: fake)
+    store = UniverseStore(2)
+
+    class Sender:
+        frames = []
+
+        def send(self, data, force=False):
+            self.frames.append(bytes(data))
+            return True
+
+    c = Controller(sender=Sender(), buffer=store[1])
+    store.set_channel(1, 5, 99)
+    c.send_frame()
+    assert Sender.frames[-1][4] == 99
+
+    multi = MultiUniverseSender({0: "127.0.0.1", 1: "127.0.0.1"}, fps=1000)
+    assert multi.send(store.frames(), force=True) == 2
+    assert fake.sent[1][18 + 4] == 99
+    store.zero_all()
+    assert store.snapshot() == bytes(1024)